@@ -0,0 +1,148 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+import plotly
+
+import project_core
+from project_core import (GANTT_PAGE_SIZE, GanttModel, ScheduleIndex, SearchIndex, process_data, get_comparison, build_dashboard,
+                          build_comparison, build_gantt, build_timeline, build_insights)
+from synthetic import make_schedule, write_table
+
+# --- PERFORMANS ÖLÇÜM TAKIMI ---
+# Qt gerektirmez (project_core üzerinden çalışır), ekransız sunucuda/CI'da koşar.
+# Her boyut için sentetik güncel/baseline dosyaları yazılır; her aşama önce süre için, sonra
+# tracemalloc altında tepe bellek için ayrıca çalıştırılır (tracemalloc süreyi şişirir).
+#   python benchmarks/run_benchmarks.py --sizes 1000 10000 100000 -o sonuc.json
+#   python benchmarks/run_benchmarks.py --sizes 1000 10000 -o yeni.json --compare sonuc.json
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 500_000]
+
+def _gantt(ctx):
+    # Uygulamadaki gibi: model bir kez kurulur, ilk sayfa çizilir
+    model = build_gantt(ctx['current'])
+    if not isinstance(model, GanttModel): return model
+    expanded = model.expanded()
+    return model.figure(model.visible_rows(expanded)[:GANTT_PAGE_SIZE], expanded)
+
+def _search(ctx):
+    # Yazarken arama: her harfte bir sorgu; süre yazılan dizinin toplamıdır
+    index = ctx['search_index']
+    return [index.search(query) for query in ("A", "Ak", "Akt", "Aktivite 4", "aktivite 42", "AKTİVİTE 427", "ktivite 9")]
+
+def _merge(ctx):
+    project_core._comparison_cache = None
+    return get_comparison(ctx['current'], ctx['baseline'])
+
+# (aşama adı, fonksiyon, sonucu bağlama yazılacak anahtar)
+STAGES = [
+    ("process_data", lambda ctx: process_data(ctx['current_path']), 'current'),
+    ("process_data_baseline", lambda ctx: process_data(ctx['baseline_path']), 'baseline'),
+    ("schedule_index", lambda ctx: ScheduleIndex(ctx['current']), None),
+    ("search_index", lambda ctx: SearchIndex(ctx['current']), 'search_index'),
+    ("search_query", _search, None),
+    ("comparison_merge", _merge, None),
+    ("build_comparison", lambda ctx: build_comparison(ctx['current'], ctx['baseline']), None),
+    ("build_gantt", _gantt, None),
+    ("build_timeline", lambda ctx: build_timeline(ctx['current']), None),
+    ("build_dashboard", lambda ctx: build_dashboard(ctx['current'])[1], None),
+    ("build_insights", lambda ctx: build_insights(ctx['current'], ctx['baseline']), None),
+]
+
+def payload_size(result):
+    if isinstance(result, str): return len(result.encode('utf-8'))
+    if hasattr(result, 'to_plotly_json'): return len(result.to_json())
+    return None
+
+def measure(fn, ctx, repeat, memory):
+    best = None; result = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter(); result = fn(ctx); elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    peak = None
+    if memory:
+        gc.collect(); tracemalloc.start()
+        try:
+            fn(ctx); peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, best, peak
+
+def run_size(rows, workdir, args):
+    current, baseline = make_schedule(rows, args.seed)
+    ctx = {'current_path': os.path.join(workdir, f"guncel_{rows}.{args.format}"),
+           'baseline_path': os.path.join(workdir, f"baseline_{rows}.{args.format}")}
+    write_table(current, ctx['current_path']); write_table(baseline, ctx['baseline_path'])
+    del current, baseline
+
+    records = []
+    for name, fn, key in STAGES:
+        if args.stages and name not in args.stages and key is None: continue
+        result, seconds, peak = measure(fn, ctx, args.repeat, not args.no_memory)
+        if key: ctx[key] = result
+        rec = {"rows": rows, "stage": name, "seconds": round(seconds, 6), "peak_bytes": peak, "payload_bytes": payload_size(result)}
+        records.append(rec)
+        mem = f"{peak / 2**20:9.1f} MB" if peak is not None else ""
+        print(f"{rows:>9} {name:<24} {seconds * 1000:10.1f} ms {mem}", flush=True)
+    return records
+
+def environment():
+    return {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor(),
+            "cpu_count": os.cpu_count(), "pandas": pd.__version__, "numpy": np.__version__, "plotly": plotly.__version__,
+            "parser_version": project_core.PARSER_VERSION, "timestamp": datetime.now().isoformat(timespec='seconds')}
+
+def compare(results, reference_path, tolerance):
+    # Aynı (satır, aşama) çiftleri için süre oranı; tolerans aşılırsa gerileme sayılır
+    with open(reference_path, encoding='utf-8') as f: reference = json.load(f)
+    ref = {(r['rows'], r['stage']): r for r in reference['results']}
+    regressions = 0
+    print(f"\n{'satır':>9} {'aşama':<24} {'önce':>10} {'şimdi':>10} {'oran':>7}")
+    for r in results:
+        old = ref.get((r['rows'], r['stage']))
+        if not old or not old['seconds']: continue
+        ratio = r['seconds'] / old['seconds']
+        flag = " ⚠" if ratio > 1 + tolerance else ""
+        regressions += bool(flag)
+        print(f"{r['rows']:>9} {r['stage']:<24} {old['seconds'] * 1000:8.1f}ms {r['seconds'] * 1000:8.1f}ms {ratio:6.2f}x{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="process_data, kıyas birleşimi, figür üretimi ve analiz notları için süre/bellek ölçümü.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Aktivite sayıları")
+    parser.add_argument("--stages", nargs="+", help="Yalnızca bu aşamalar (process_data her zaman çalışır)")
+    parser.add_argument("--repeat", type=int, default=1, help="Süre için tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--format", choices=("csv", "xlsx"), default="csv", help="Sentetik dosya biçimi")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc tepe bellek ölçümünü atla")
+    parser.add_argument("--workdir", help="Sentetik dosyaların yazılacağı klasör (varsayılan: geçici)")
+    parser.add_argument("-o", "--output", default="benchmark_results.json", help="JSON sonuç dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Gerileme eşiği (0.2 = %%20 yavaşlama)")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+        for rows in args.sizes: results += run_size(rows, workdir, args)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar: {args.output}")
+    if args.compare and compare(results, args.compare, args.tolerance): return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
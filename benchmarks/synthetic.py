@@ -0,0 +1,135 @@
+import argparse
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+# --- SENTETİK PROGRAM ÜRETİCİ ---
+# MS Project Türkçe dışa aktarımını taklit eden tablo: "Mart 20, 2026 8:00 AM" tarihleri, "12 gün"
+# süreleri, "35g" bollukları, İKY hiyerarşisi ve Özet satırları, "3TB+5g" öncülleri.
+# Baseline, güncel programın kaydırılmış/süreleri değiştirilmiş bir kopyasıdır.
+TR_MONTH_NAMES = np.array(["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"], dtype=object)
+PROJECT_START = np.datetime64('2024-08-16')
+STATUS_DATE = np.datetime64('2025-11-01')
+SUMMARY_SHARE = 0.13
+MAX_DEPTH = 6
+
+def build_tree(n, rng):
+    # İKY kodları, ebeveyn indeksleri ve özet bayrakları; satırlar MS Project'teki gibi ağaç sırasında
+    summary = np.zeros(n, dtype=bool); parent = np.full(n, -1, dtype=np.int64); depth = np.zeros(n, dtype=np.int64)
+    codes = [None] * n
+    summary[0] = True; codes[0] = "1"
+    stack = [0]; counters = [0]
+    make_summary = rng.random(n) < SUMMARY_SHARE
+    close = rng.random(n) < 0.12
+    for i in range(1, n):
+        p = stack[-1]
+        counters[-1] += 1
+        parent[i] = p; depth[i] = len(stack); codes[i] = f"{codes[p]}.{counters[-1]}"
+        if make_summary[i] and len(stack) < MAX_DEPTH:
+            summary[i] = True; stack.append(i); counters.append(0)
+        elif close[i] and len(stack) > 1 and counters[-1] > 1:
+            stack.pop(); counters.pop()
+    return codes, parent, depth, summary
+
+def tr_dates(days, time_text):
+    # datetime64[D] -> "Mart 20, 2026 8:00 AM"
+    ts = pd.DatetimeIndex(days)
+    return TR_MONTH_NAMES[ts.month - 1] + " " + ts.day.astype(str) + ", " + ts.year.astype(str) + " " + time_text
+
+def us_dates(days, mask):
+    # Fiili tarihler dışa aktarımda "11/8/2025" biçimindedir; olmayanlar "Yok"
+    ts = pd.DatetimeIndex(days)
+    text = (ts.month.astype(str) + "/" + ts.day.astype(str) + "/" + ts.year.astype(str)).to_numpy(dtype=object)
+    text[~mask] = "Yok"
+    return text
+
+def roll_up(parent, depth, summary, start, finish):
+    # Özet satırlarının tarihleri alt kırılımın en erken başlangıcı ve en geç bitişidir
+    start = start.copy(); finish = finish.copy()
+    parents = summary & (np.bincount(parent[parent >= 0], minlength=len(parent)) > 0)
+    start[parents] = np.datetime64('2262-01-01'); finish[parents] = np.datetime64('1678-01-01')
+    for d in range(int(depth.max()), 0, -1):
+        idx = np.flatnonzero(depth == d)
+        np.minimum.at(start, parent[idx], start[idx]); np.maximum.at(finish, parent[idx], finish[idx])
+    return start, finish
+
+def render(frame):
+    # Sayısal/tarih iç sütunlardan dışa aktarım metin sütunlarını üretir
+    start, finish = (frame[c].to_numpy().astype('datetime64[D]') for c in ('_start', '_finish'))
+    started = start <= STATUS_DATE; done = finish <= STATUS_DATE
+    duration = np.busday_count(start, finish) + 1
+    elapsed = np.clip(np.busday_count(start, np.minimum(finish, STATUS_DATE)) + 1, 0, None)
+    progress = np.where(done, 1.0, np.where(started, np.round(elapsed / np.maximum(duration, 1), 2), 0.0))
+    return pd.DataFrame({
+        'Benzersiz_Kimlik': frame['Benzersiz_Kimlik'].to_numpy(),
+        'Özet': np.where(frame['_summary'], 'Evet', 'Hayır'),
+        'İKY': frame['İKY'].to_numpy(),
+        'Ad': frame['Ad'].to_numpy(),
+        'Tamamlanma_Yüzdesi': progress,
+        'Süre': duration.astype(str).astype(object) + " gün",
+        'Başlangıç': tr_dates(start, "8:00 AM"),
+        'Bitiş': tr_dates(finish, "5:00 PM"),
+        'Fiili_Başlangıç': us_dates(start, started),
+        'Fiili_Bitiş': us_dates(finish, done),
+        'Toplam_Bolluk': frame['_slack'].astype(str).to_numpy(dtype=object) + "g",
+        'Öncüller': frame['Öncüller'].to_numpy(),
+    })
+
+def make_schedule(n, seed=0):
+    # Dönüş: (güncel, baseline) ham dışa aktarım tabloları
+    rng = np.random.default_rng(seed)
+    codes, parent, depth, summary = build_tree(n, rng)
+    span = int(np.busday_count(PROJECT_START, PROJECT_START + np.timedelta64(900, 'D')))
+    offset = rng.integers(0, span, n)
+    duration = np.clip(rng.lognormal(2.2, 1.0, n).astype(np.int64), 1, 400)
+    start = np.busday_offset(PROJECT_START, offset, roll='forward')
+    finish = np.busday_offset(start, duration - 1, roll='forward')
+    start, finish = roll_up(parent, depth, summary, start, finish)
+    # Bolluk: görevlerin ~%25'i kritik, kalanı üstel dağılımlı
+    slack = np.where(rng.random(n) < 0.25, 0, rng.exponential(60, n).astype(np.int64))
+
+    # Öncüller: aynı özet altındaki bir önceki satıra bağlantı; bir kısmı BB/TT ve gecikmeli
+    ids = np.arange(1, n + 1)
+    prev_sibling = np.r_[False, parent[1:] == parent[:-1]] & ~summary
+    kinds = rng.choice(np.array(["", "BB", "TT", "TB+5g", "BB+2g"], dtype=object), n, p=[0.65, 0.15, 0.08, 0.07, 0.05])
+    links = np.full(n, np.nan, dtype=object)
+    links[prev_sibling] = (ids - 1)[prev_sibling].astype(str).astype(object) + kinds[prev_sibling]
+
+    frame = pd.DataFrame({'Benzersiz_Kimlik': rng.permutation(np.arange(1, n + 1) * 3) if n > 1 else [1],
+                          'İKY': codes, 'Ad': [f"Aktivite {i}" for i in ids], 'Öncüller': links,
+                          '_summary': summary, '_start': start, '_finish': finish, '_slack': slack})
+    frame.loc[0, 'Benzersiz_Kimlik'] = 1  # Proje özet satırı
+    current = render(frame)
+
+    # Baseline: satırların %40'ı -10..+10 iş günü kaydırılmış, %20'sinin süresi ±%30 değişmiş,
+    # bolluklar yeniden çekilmiş; satırların %2'si baseline'da yoktur (sonradan eklenmiş)
+    base = frame.copy()
+    shift = np.where(rng.random(n) < 0.4, rng.integers(-10, 11, n), 0)
+    stretch = np.where(rng.random(n) < 0.2, rng.uniform(0.7, 1.3, n), 1.0)
+    b_start = np.busday_offset(start, shift, roll='forward')
+    b_len = np.maximum(1, (np.busday_count(start, finish) * stretch).astype(np.int64))
+    base['_start'] = b_start; base['_finish'] = np.busday_offset(b_start, b_len, roll='forward')
+    base['_slack'] = np.clip(slack + rng.integers(-15, 16, n), 0, None)
+    baseline = render(base)[rng.random(n) >= 0.02].reset_index(drop=True)
+    return current, baseline
+
+def write_table(df, path):
+    if path.lower().endswith('.csv'): df.to_csv(path, index=False, encoding='utf-8')
+    else: df.to_excel(path, index=False)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik güncel/baseline program dosyaları üretir.")
+    parser.add_argument("rows", type=int, help="Aktivite sayısı")
+    parser.add_argument("-o", "--output", default=".", help="Çıktı klasörü")
+    parser.add_argument("--format", choices=("csv", "xlsx"), default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    current, baseline = make_schedule(args.rows, args.seed)
+    os.makedirs(args.output, exist_ok=True)
+    for name, df in (("guncel", current), ("baseline", baseline)):
+        path = os.path.join(args.output, f"{name}_{args.rows}.{args.format}")
+        write_table(df, path); print(path)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+import re
+import numpy as np
+import pandas as pd
+
+# --- KRİTİK YOL MOTORU (CPM) ---
+# Görevler düğüm, "Öncüller" bağlantıları kenar olarak dizi tabanlı (CSR) komşuluk yapılarında tutulur.
+# İleri/geri geçişler topolojik seviye seviye, her seviyede numpy ile toplu yapılır: O(V+E).
+# Süre değiştiğinde yalnızca etkilenen koni yeniden hesaplanır: ileri geçiş değişen görevlerin
+# ardıl konisinde, geri geçiş öncül konisinde (proje bitişi değişirse tüm ağda).
+# Zaman ekseni: en erken başlangıçtan itibaren iş günü. Takvim dosyadan çıkarılır: görev süreleri
+# başlangıç-bitiş arasındaki takvim günlerine uyuyorsa 7 gün, aksi halde Pzt-Cum çalışılır.
+# Özet satırları ağa girmez; tarihleri ve bollukları İKY ağacında alt görevlerden toplanır.
+# Sonuçlar dışa aktarılan değerlere fark olarak uygulanır; böylece MS Project'in kısıt ayrıntıları
+# (son tarihler, kısıtlı başlangıçlar) korunur. Motorun kendi bolluğu bu ayrıntıları bilmediği için
+# dışa aktarılandan sapabilir; sapma ScheduleNetwork.slack_agreement ile ölçülür ve arayüzde gösterilir.
+WEEKMASK = '1111100'
+CALENDAR_WEEKMASK = '1111111'
+SLACK_TOLERANCE = 1  # gün; motor ve dışa aktarım bolluğu bu farka kadar uyumlu sayılır
+HOURS_PER_DAY = 8
+# Öncül türü -> (öncülün bitişi mi, ardılın bitişi mi)
+LINK_TYPES = {'TB': (True, False), 'BB': (False, False), 'TT': (True, True), 'BT': (False, True)}
+# Gecikme birimi -> iş günü çarpanı ('%' öncül süresine göredir, ayrıca ele alınır)
+LAG_UNITS = {'': 1, 'g': 1, 'gn': 1, 'gün': 1, 'eg': 1, 's': 1 / HOURS_PER_DAY, 'sa': 1 / HOURS_PER_DAY,
+             'h': 5, 'hf': 5, 'a': 20, 'ay': 20, 'dk': 1 / (HOURS_PER_DAY * 60)}
+LINK_PATTERN = re.compile(r'(\d+)\s*(TB|BB|TT|BT)?\s*(?:([+-]\s*\d+(?:[.,]\d+)?)\s*([a-zçğıöşü%]*))?', re.IGNORECASE)
+
+def parse_links(df):
+    # "Öncüller" metnini (ör. "3TB+19g,4") satır numarası dizilerine çevirir.
+    # Görev numarası MSPDI'den gelen 'Kimlik' sütunundan, yoksa satır sırasından (1'den başlar) okunur.
+    empty = np.empty(0, dtype=np.int64)
+    if 'Öncüller' not in df.columns: return empty, empty, empty.astype(bool), empty.astype(bool), empty.astype(float)
+    text = df['Öncüller'].reset_index(drop=True)
+    text = text[text.notna()].astype(str)
+    found = text.str.extractall(LINK_PATTERN)
+    if found.empty: return empty, empty, empty.astype(bool), empty.astype(bool), empty.astype(float)
+    succ = found.index.get_level_values(0).to_numpy(dtype=np.int64)
+    if 'Kimlik' in df.columns:
+        row_of = pd.Series(np.arange(len(df)), index=df['Kimlik'].astype(str).to_numpy())
+        pred = found[0].map(row_of)
+    else:
+        pred = found[0].astype(int) - 1
+        pred = pred.where((pred >= 0) & (pred < len(df)))
+    kind = found[1].str.upper().fillna('TB')
+    lag = pd.to_numeric(found[2].str.replace(' ', '').str.replace(',', '.'), errors='coerce').fillna(0).to_numpy(dtype=float)
+    unit = found[3].fillna('').str.lower()
+    known = pred.notna().to_numpy()
+    pred = pred.fillna(0).to_numpy(dtype=np.int64)
+    percent = (unit == '%').to_numpy()
+    scale = unit.map(LAG_UNITS).fillna(1).to_numpy(dtype=float)
+    lag = lag * scale
+    if percent.any():
+        dur = df['Süre_Num'].to_numpy(dtype=float)
+        lag[percent] = np.nan_to_num(dur[pred[percent]]) * lag[percent] / 100 / scale[percent]
+    from_finish = kind.map(lambda k: LINK_TYPES[k][0]).to_numpy(dtype=bool)
+    to_finish = kind.map(lambda k: LINK_TYPES[k][1]).to_numpy(dtype=bool)
+    ok = known & (pred != succ)
+    return pred[ok], succ[ok], from_finish[ok], to_finish[ok], lag[ok]
+
+def _csr(keys, n):
+    # keys'e göre sıralı kenar permütasyonu ve satır başlangıçları
+    order = np.argsort(keys, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=indptr[1:])
+    return order, indptr
+
+def _gather(indptr, nodes):
+    # Verilen düğümlerin CSR satırlarındaki tüm kenar konumları
+    starts = indptr[nodes]; counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if not total: return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(total, dtype=np.int64) - offsets + np.repeat(starts, counts)
+
+def _day_offsets(dates, origin, weekmask=WEEKMASK):
+    days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    valid = ~np.isnat(days)
+    out = np.zeros(len(days))
+    out[valid] = np.busday_count(origin, days[valid], weekmask=weekmask)
+    return out, valid
+
+def infer_weekmask(df, tasks):
+    # Süresi olan görevlerde süre, başlangıç-bitiş aralığının takvim günü sayısına mı iş günü sayısına mı uyuyor
+    start = df['Başlangıç_Date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    finish = df['Bitiş_Date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    duration = df['Süre_Num'].to_numpy(dtype=float)
+    ok = tasks & ~np.isnat(start) & ~np.isnat(finish) & (duration > 0) & (finish >= start)
+    if not ok.any(): return WEEKMASK
+    start, finish, duration = start[ok], finish[ok] + 1, duration[ok]
+    calendar = np.mean((finish - start).astype(np.int64) == duration)
+    workdays = np.mean(np.busday_count(start, finish, weekmask=WEEKMASK) == duration)
+    return CALENDAR_WEEKMASK if calendar > workdays else WEEKMASK
+
+def summary_parents(df, summary):
+    # Her satırın İKY'de en yakın özet atası (-1 yok) ve İKY derinliği
+    n = len(df)
+    parent = np.full(n, -1, dtype=np.int64); depth = np.zeros(n, dtype=np.int64)
+    if 'İKY' not in df.columns or not summary.any(): return parent, depth
+    codes = df['İKY'].astype(str).str.strip().tolist()
+    rows = {}
+    for i in np.flatnonzero(summary).tolist(): rows.setdefault(codes[i], i)
+    for i, code in enumerate(codes):
+        parts = code.split('.'); depth[i] = len(parts)
+        for k in range(len(parts) - 1, 0, -1):
+            p = rows.get('.'.join(parts[:k]))
+            if p is not None and p != i: parent[i] = p; break
+    return parent, depth
+
+def shift_workdays(dates, delta, weekmask=WEEKMASK):
+    # Tarihleri iş günü cinsinden kaydırır; saat bilgisi ve değişmeyen satırlar olduğu gibi kalır
+    values = dates.to_numpy(dtype='datetime64[ns]').copy()
+    steps = np.rint(np.nan_to_num(delta)).astype(np.int64)
+    move = (steps != 0) & ~np.isnat(values)
+    if move.any():
+        day = values[move].astype('datetime64[D]')
+        time_of_day = values[move] - day.astype('datetime64[ns]')
+        moved = np.busday_offset(day, steps[move], roll='forward', weekmask=weekmask)
+        values[move] = moved.astype('datetime64[ns]') + time_of_day
+    return pd.Series(values, index=dates.index)
+
+class ScheduleNetwork:
+    def __init__(self, df):
+        n = len(df); self.n = n
+        self.ids = df['Benzersiz_Kimlik'].astype(str).to_numpy()
+        self.row_of = {uid: i for i, uid in enumerate(self.ids)}
+        self.base_duration = np.nan_to_num(df['Süre_Num'].to_numpy(dtype=float))
+        self.duration = self.base_duration.copy()
+        self.summary = (df['Özet'] == 'Evet').to_numpy() if 'Özet' in df.columns else np.zeros(n, dtype=bool)
+        self.tasks = np.flatnonzero(~self.summary)
+        self.weekmask = infer_weekmask(df, ~self.summary)
+
+        starts = df['Başlangıç_Date']
+        origin = starts.min()
+        origin = np.datetime64(origin.date() if pd.notna(origin) else pd.Timestamp.today().date(), 'D')
+        start_off, has_start = _day_offsets(starts, origin, self.weekmask)
+        self.parent, depth = summary_parents(df, self.summary)
+        self._roll_up_plan(depth)
+        pred, succ, from_finish, to_finish, lag = self._task_links(*parse_links(df))
+
+        self.cyclic_links = 0
+        self.level = self._levels(pred, succ)
+        if (self.level < 0).any():
+            # Döngüye giren bağlantılar hesaptan çıkarılır (MS Project zaten bunlara izin vermez)
+            keep = ~((self.level[pred] < 0) & (self.level[succ] < 0))
+            self.cyclic_links = int((~keep).sum())
+            pred, succ, from_finish, to_finish, lag = pred[keep], succ[keep], from_finish[keep], to_finish[keep], lag[keep]
+            self.level = self._levels(pred, succ)
+        self.pred, self.succ, self.from_finish, self.to_finish, self.lag = pred, succ, from_finish, to_finish, lag
+
+        # Başlamış görevler fiili başlangıcına sabitlenir; öncülsüz görevler plandaki başlangıçtan başlar
+        self.pinned = df['Fiili_Başlangıç_Date'].notna().to_numpy()
+        has_pred = np.bincount(succ, minlength=n) > 0
+        self.floor = np.where(self.pinned | ~has_pred, np.where(has_start, start_off, 0.0), -np.inf)
+
+        # İleri geçiş için ardıla göre, geri geçiş için öncüle göre CSR
+        self.in_order, self.in_ptr = _csr(succ, n)
+        self.out_order, self.out_ptr = _csr(pred, n)
+
+        # Ağa girmeyen (alt görevi olmayan) özetler kendi tarihlerinde sabit kalır
+        self.ES = np.where(has_start, start_off, 0.0); self.EF = self.ES + self.duration; self.LF = self.EF.copy()
+        self.forward(self.tasks)
+        self.finish = self.EF[self.tasks].max() if self.tasks.size else 0.0
+        self.backward(self.tasks)
+        self.roll_up()
+        self.base_ES = self.ES.copy(); self.base_EF = self.EF.copy(); self.base_slack = self.slack()
+
+        # Motor bolluğunun dışa aktarılanla uyumu (görevlerde); düşükse sonuçlar yalnızca fark olarak güvenilirdir
+        exported = df['Bolluk_Num'].to_numpy(dtype=float)[self.tasks]
+        known = ~np.isnan(exported)
+        gap = self.base_slack[self.tasks][known] - exported[known]
+        self.slack_agreement = float(np.mean(np.abs(gap) <= SLACK_TOLERANCE)) if gap.size else 1.0
+        self.slack_gap = float(np.median(gap)) if gap.size else 0.0
+
+    def _task_links(self, pred, succ, from_finish, to_finish, lag):
+        # Özet uçlu bağlantılar alt görevlere açılır: özetin bitişinden çıkan bağlantı her alt görevin
+        # bitişinden (özet bitişi en geç alt bitiştir), özetin başlangıcına giren bağlantı her alt görevin
+        # başlangıcına girer. Özetin başlangıcından çıkan ya da bitişine giren bağlantılar görev
+        # kenarlarıyla ifade edilemez; hesaptan çıkarılır ve summary_links'te sayılır.
+        summary = self.summary
+        self.summary_links = 0
+        involved = summary[pred] | summary[succ]
+        if not involved.any(): return pred, succ, from_finish, to_finish, lag
+        expressible = (~summary[pred] | from_finish) & (~summary[succ] | ~to_finish)
+        self.summary_links = int((involved & ~expressible).sum())
+        members = self._summary_tasks()
+        keep = ~involved
+        extra = [[] for _ in range(5)]
+        for e in np.flatnonzero(involved & expressible).tolist():
+            preds = members.get(pred[e], ()) if summary[pred[e]] else (pred[e],)
+            succs = members.get(succ[e], ()) if summary[succ[e]] else (succ[e],)
+            for p in preds:
+                for s in succs:
+                    if p == s: continue
+                    for column, value in zip(extra, (p, s, from_finish[e], to_finish[e], lag[e])): column.append(value)
+        arrays = (pred, succ, from_finish, to_finish, lag)
+        return tuple(np.concatenate([a[keep], np.asarray(x, dtype=a.dtype)]) for a, x in zip(arrays, extra))
+
+    def _summary_tasks(self):
+        # Özet satırı -> İKY'de altındaki tüm görev satırları
+        members = {}
+        for i in self.tasks.tolist():
+            p = self.parent[i]
+            while p >= 0: members.setdefault(p, []).append(i); p = self.parent[p]
+        return members
+
+    def _roll_up_plan(self, depth):
+        # Alt görevi olan özetler ve alttan üste (derinden sığa) toplama adımları
+        has_child = np.flatnonzero(self.parent >= 0)
+        reached = np.zeros(self.n, dtype=bool); reached[self.tasks] = True
+        self.roll_steps = []
+        for d in sorted(set(depth[has_child].tolist()), reverse=True):
+            rows = has_child[depth[has_child] == d]
+            rows = rows[reached[rows]]
+            reached[self.parent[rows]] = True
+            if rows.size: self.roll_steps.append((rows, self.parent[rows]))
+        self.rolled = reached & self.summary
+
+    def roll_up(self):
+        # Özet (MS Project gibi): en erken alt başlangıç, en geç alt bitiş ve en geç alt geç bitiş;
+        # bolluğu da bunlardan LF - EF olarak çıkar
+        rolled = self.rolled
+        if not rolled.any(): return
+        ES, EF, LF = self.ES, self.EF, self.LF
+        ES[rolled] = np.inf; EF[rolled] = -np.inf; LF[rolled] = -np.inf
+        for rows, parents in self.roll_steps:
+            np.minimum.at(ES, parents, ES[rows]); np.maximum.at(EF, parents, EF[rows]); np.maximum.at(LF, parents, LF[rows])
+
+    def _levels(self, pred, succ):
+        # Kahn algoritması: her adımda giriş derecesi sıfıra inen tüm düğümler birlikte işlenir
+        n = self.n
+        order, indptr = _csr(pred, n)
+        targets = succ[order]
+        remaining = np.bincount(succ, minlength=n)
+        level = np.full(n, -1, dtype=np.int64)
+        frontier = np.flatnonzero(remaining == 0); depth = 0
+        while frontier.size:
+            level[frontier] = depth; depth += 1
+            hit = targets[_gather(indptr, frontier)]
+            if not hit.size: break
+            touched, counts = np.unique(hit, return_counts=True)
+            remaining[touched] -= counts
+            frontier = touched[remaining[touched] == 0]
+        return level
+
+    def slack(self):
+        return self.LF - self.EF
+
+    def _by_level(self, nodes, edges, edge_level, descending):
+        # Düğüm ve kenarları seviyeye göre sıralar; her seviyenin dilim sınırlarını döndürür
+        sign = -1 if descending else 1
+        nodes = nodes[np.argsort(sign * self.level[nodes], kind='stable')]
+        edge_sort = np.argsort(sign * edge_level, kind='stable')
+        edges = edges[edge_sort]
+        node_levels = sign * self.level[nodes]; edge_levels = sign * edge_level[edge_sort]
+        steps = np.unique(node_levels)
+        return nodes, edges, np.searchsorted(node_levels, steps, side='right'), np.searchsorted(edge_levels, steps, side='right')
+
+    def forward(self, nodes):
+        # Erken başlangıç/bitiş; kenarlar ardılın seviyesine göre gruplanır
+        edges = self.in_order[_gather(self.in_ptr, nodes)]
+        edges = edges[~self.pinned[self.succ[edges]]]
+        nodes, edges, node_bounds, edge_bounds = self._by_level(nodes, edges, self.level[self.succ[edges]], False)
+        ES, EF, dur = self.ES, self.EF, self.duration
+        a = c = 0
+        for b, d in zip(node_bounds, edge_bounds):
+            level_nodes = nodes[a:b]
+            ES[level_nodes] = self.floor[level_nodes]
+            if d > c:
+                e = edges[c:d]; p = self.pred[e]; s = self.succ[e]
+                value = np.where(self.from_finish[e], EF[p], ES[p]) + self.lag[e] - np.where(self.to_finish[e], dur[s], 0.0)
+                np.maximum.at(ES, s, value)
+            EF[level_nodes] = ES[level_nodes] + dur[level_nodes]
+            a, c = b, d
+
+    def backward(self, nodes):
+        # Geç bitiş; kenarlar öncülün seviyesine göre, son seviyeden başa doğru işlenir
+        edges = self.out_order[_gather(self.out_ptr, nodes)]
+        nodes, edges, node_bounds, edge_bounds = self._by_level(nodes, edges, self.level[self.pred[edges]], True)
+        LF, dur = self.LF, self.duration
+        a = c = 0
+        for b, d in zip(node_bounds, edge_bounds):
+            level_nodes = nodes[a:b]
+            LF[level_nodes] = self.finish
+            if d > c:
+                e = edges[c:d]; p = self.pred[e]; s = self.succ[e]
+                value = LF[s] - np.where(self.to_finish[e], 0.0, dur[s]) - self.lag[e] + np.where(self.from_finish[e], 0.0, dur[p])
+                np.minimum.at(LF, p, value)
+            a, c = b, d
+
+    def _cone(self, rows, order, indptr, targets):
+        seen = np.zeros(self.n, dtype=bool); seen[rows] = True
+        frontier = np.unique(rows)
+        while frontier.size:
+            nxt = targets[order[_gather(indptr, frontier)]]
+            nxt = np.unique(nxt[~seen[nxt]])
+            seen[nxt] = True; frontier = nxt
+        return np.flatnonzero(seen)
+
+    def set_durations(self, changes):
+        # changes: {görev satır numarası: yeni süre (gün)}. Yeniden hesaplanan görev satırları döner;
+        # özetlerin süresi alt görevlerinden gelir, onlara verilen değişiklikler yok sayılır.
+        changes = {row: days for row, days in changes.items() if not self.summary[row]}
+        rows = np.fromiter(changes.keys(), dtype=np.int64, count=len(changes))
+        if not rows.size: return rows
+        self.duration[rows] = np.fromiter(changes.values(), dtype=float, count=len(changes))
+        downstream = self._cone(rows, self.out_order, self.out_ptr, self.succ)
+        self.forward(downstream)
+        finish = self.EF[self.tasks].max()
+        if finish != self.finish:
+            # Proje bitişi kaydı: her görevin geç bitişi etkilenebilir
+            self.finish = finish
+            self.backward(self.tasks)
+            self.roll_up()
+            return self.tasks
+        upstream = self._cone(rows, self.in_order, self.in_ptr, self.pred)
+        self.backward(upstream)
+        self.roll_up()
+        return np.union1d(downstream, upstream)
+
+    def set_scenario(self, changes):
+        # changes: senaryonun tamamı; içinde olmayan değiştirilmiş görevler taban süresine döner
+        edited = np.flatnonzero((self.duration != self.base_duration) & ~self.summary)
+        target = dict(zip(edited.tolist(), self.base_duration[edited].tolist())); target.update(changes)
+        return self.set_durations(target)
+
+    def reset(self):
+        return self.set_scenario({})
+
+    def apply(self, df):
+        # Hesaplanan farkları dışa aktarılan çerçeveye uygular (Süre, Bolluk, tarihler). Bolluk mutlak
+        # olarak değil fark olarak yazılır: motor kısıtları bilmediğinden taban bolluğu dışa aktarılandan
+        # sapabilir (slack_agreement), değişikliğin etkisi ise iki hesapta da aynıdır.
+        out = df.copy()
+        # Özetlerin süresi alt görevlerin kapsadığı aralıkla birlikte değişir
+        span = np.where(self.rolled, (self.EF - self.ES) - (self.base_EF - self.base_ES), 0.0)
+        changed = (self.duration != self.base_duration) | (span != 0)
+        if changed.any():
+            out['Süre_Num'] = np.where(changed, np.where(self.rolled, out['Süre_Num'].to_numpy(dtype=float) + span, self.duration),
+                                       out['Süre_Num'].to_numpy(dtype=float))
+        out['Bolluk_Num'] = out['Bolluk_Num'].to_numpy(dtype=float) + (self.slack() - self.base_slack)
+        out['Başlangıç_Date'] = shift_workdays(out['Başlangıç_Date'], np.where(self.pinned, 0.0, self.ES - self.base_ES), self.weekmask)
+        out['Bitiş_Date'] = shift_workdays(out['Bitiş_Date'], self.EF - self.base_EF, self.weekmask)
+        return out
@@ -1,17 +1,41 @@
 import sys
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import os
-from datetime import datetime, timedelta
+import json
+import time
+import threading
+from datetime import date, datetime
+from itertools import count
+APP_STARTED = time.time()
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
                              QPushButton, QFileDialog, QLabel, QTabWidget, 
-                             QHBoxLayout, QFrame, QTextEdit, QMessageBox)
+                             QHBoxLayout, QFrame, QTextEdit, QMessageBox, QProgressBar, QComboBox, QInputDialog,
+                             QDialog, QPlainTextEdit, QSpinBox, QLineEdit, QSlider, QCompleter)
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtCore import (Qt, QObject, QRunnable, QThreadPool, QTimer, QUrl, QFileSystemWatcher, QStringListModel,
+                          pyqtSignal, pyqtSlot)
+from PyQt6.QtGui import QIcon, QKeySequence, QShortcut
+QT_IMPORTED = time.time()
+
+from schedule_cache import ScheduleCache, default_cache_dir
+from instrumentation import (stage, record, add_listener, summarize, recent, capture_profile, profile_enabled, log_dir,
+                             startup_mark)
+
+# --- GECİKMELİ İÇE AKTARIM ---
+# pandas/numpy/plotly ve onlara dayanan çekirdek (project_core, cpm) soğuk açılışta saniyeler sürer.
+# Pencere önce gösterilir, çekirdek arka planda warmup_job ile içe aktarılır; ona ihtiyaç duyan
+# işlemler ProjectApp.when_core_ready ile sıraya girer. Chromium görünümleri de ilk içerikte kurulur.
+core = None; cpm = None
+STARTUP_TIMING_ARG = "--startup-timing"  # Çekirdek hazır olunca açılış sürelerini yazıp çıkar
+
+def import_core():
+    global core, cpm
+    if core is None:
+        import cpm as cpm_module
+        import project_core
+        cpm = cpm_module; core = project_core
+    return core
 
 # --- SİHİRLİ FONKSİYON ---
 def resource_path(relative_path):
@@ -19,6 +43,9 @@ def resource_path(relative_path):
     except Exception: base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+NO_BASELINE_HTML = "<h3 style='font-family:Segoe UI; padding:20px; color:#7f8c8d'>Kıyaslama verilerini görmek için Baseline dosyasını yükleyiniz.</h3>"
+NO_HISTORY_HTML = "<h3 style='font-family:Segoe UI; padding:20px; color:#7f8c8d'>Geçmiş kaydı yok. Yüklenen her güncel program durum tarihiyle geçmişe eklenir; eski güncellemeler için 'Geçmişe Dosya Ekle'yi kullanın.</h3>"
+
 # --- STİL ---
 STYLE_SHEET = """
     QMainWindow { background-color: #f4f7f6; }
@@ -30,50 +57,6 @@ STYLE_SHEET = """
     QTextEdit { font-family: 'Segoe UI'; line-height: 1.6; }
 """
 
-# --- YARDIMCI FONKSİYONLAR ---
-def format_date_tr(date_obj):
-    if pd.isna(date_obj): return "-"
-    months = {
-        1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan", 5: "Mayıs", 6: "Haziran",
-        7: "Temmuz", 8: "Ağustos", 9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-    }
-    return f"{date_obj.day} {months[date_obj.month]} {date_obj.year}"
-
-def format_date_short(date_obj):
-    if pd.isna(date_obj): return ""
-    months = {
-        1: "Oca", 2: "Şub", 3: "Mar", 4: "Nis", 5: "May", 6: "Haz",
-        7: "Tem", 8: "Ağu", 9: "Eyl", 10: "Eki", 11: "Kas", 12: "Ara"
-    }
-    return f"{date_obj.day} {months[date_obj.month]}"
-
-def parse_turkish_date(date_str):
-    if isinstance(date_str, (pd.Timestamp, datetime)): return date_str
-    if not isinstance(date_str, str) or str(date_str).lower() in ["yok", "nan", "nat", ""]: return pd.NaT
-    tr_months = {"Ocak":"January", "Şubat":"February", "Mart":"March", "Nisan":"April", "Mayıs":"May", "Haziran":"June", "Temmuz":"July", "Ağustos":"August", "Eylül":"September", "Ekim":"October", "Kasım":"November", "Aralık":"December"}
-    clean_str = str(date_str)
-    for tr, en in tr_months.items():
-        if tr in clean_str:
-            clean_str = clean_str.replace(tr, en)
-            break
-    try: return pd.to_datetime(clean_str)
-    except: return pd.NaT
-
-def clean_duration(val):
-    if isinstance(val, (int, float)): return float(val)
-    if isinstance(val, str):
-        val = val.lower().replace(" gün", "").replace("g", "").replace("day", "").replace("dy", "").replace(" ", "")
-        try: return float(val)
-        except: return 0.0
-    return 0.0
-
-def normalize_id(val):
-    try:
-        f_val = float(val)
-        if f_val.is_integer(): return str(int(f_val))
-        return str(f_val)
-    except: return str(val).strip()
-
 # --- KPI KART CLASS ---
 class KPICard(QFrame):
     def __init__(self, title, value, color="#0078D7"):
@@ -85,6 +68,568 @@ class KPICard(QFrame):
         lbl_v = QLabel(value); lbl_v.setStyleSheet(f"color: {color}; font-size: 22px; font-weight: bold;")
         layout.addWidget(lbl_t); layout.addWidget(lbl_v); self.setLayout(layout)
 
+# --- PLOTLY ÇALIŞMA ZAMANI ---
+# plotly.js paketle gelen kopyasından bir kez yerel klasöre yazılır (CDN/ağ gerekmez).
+# Her görünüm bu kabuk sayfayı bir kez yükler; sonraki çizimler Plotly.react ile yerinde yapılır.
+PLOT_SHELL = """<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<script src="{plotly_js}"></script>
+<script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+<style>
+    html, body { margin: 0; background: white; font-family: 'Segoe UI', sans-serif; }
+    #plot { width: 100%; height: 100vh; }
+    #msg { padding: 20px; display: none; }
+</style></head>
+<body><div id="msg"></div><div id="plot"></div>
+<script>
+    var plot = document.getElementById('plot'), msg = document.getElementById('msg'), bridge = null;
+    // Etkileşimli filtre: figürle gelen aday satırlar (fig.filter) ve son seçilen eşik/ufuk
+    var filterData = null, currentFilter = null, rendering = false;
+    // Arama seçimi: eksen satırı {pos, count, window} ya da tablo satırı {id, tables}; focusJump yeni
+    // seçimde bir kez sayfayı ona kaydırır/yakınlaştırır, sonraki çizimlerde yalnızca vurgu kalır
+    var currentFocus = null, focusJump = false, zoomed = false, baseShapes = [];
+    var CELL_FILL = '#ecf0f1', FOCUS_FILL = '#f9e79f';
+    var TR_MONTHS = ['Ocak', 'Şubat', 'Mart', 'Nisan', 'Mayıs', 'Haziran', 'Temmuz', 'Ağustos', 'Eylül', 'Ekim', 'Kasım', 'Aralık'];
+    if (typeof QWebChannel !== 'undefined' && window.qt && qt.webChannelTransport) {
+        new QWebChannel(qt.webChannelTransport, function (channel) { bridge = channel.objects.bridge; });
+    }
+    function bindEvents() {
+        if (plot._bound) return;
+        plot._bound = true;
+        plot.on('plotly_click', function (ev) {
+            if (bridge && ev.points.length) bridge.click(String(ev.points[0].y));
+        });
+    }
+    function renderFigure(fig) {
+        var layout = fig.layout || {};
+        msg.style.display = 'none'; plot.style.display = 'block';
+        plot.style.height = layout.height ? layout.height + 'px' : '100vh';
+        filterData = fig.filter || null; rendering = true;
+        var started = performance.now();
+        Plotly.react(plot, fig.data || [], layout, {responsive: true, displaylogo: false}).then(function () {
+            rendering = false; baseShapes = (layout.shapes || []).slice(); zoomed = false;
+            bindEvents();
+            if (bridge) bridge.reportRender(performance.now() - started);
+            applyFocus();
+        });
+    }
+    function formatDay(d) {
+        // project_core.format_date_tr ile aynı: "3 Kasım 2025"
+        if (d === null || d === undefined) return '-';
+        var t = new Date(d * 86400000);
+        return t.getUTCDate() + ' ' + TR_MONTHS[t.getUTCMonth()] + ' ' + t.getUTCFullYear();
+    }
+    function filterTable(table, f, until) {
+        // Bölümler sırayla; her bölümden eşik ve ufka uyan ilk filterData.rows satır
+        var cells = table.header.map(function () { return []; });
+        table.sections.forEach(function (s) {
+            for (var i = 0, taken = 0; i < s.slack.length && taken < filterData.rows; i++) {
+                if (s.slack[i] === null || s.slack[i] > f.slack) continue;
+                if (s.day && (s.day[i] === null || s.day[i] > until)) continue;
+                taken++;
+                s.cols.forEach(function (c, k) { cells[k].push(c.v ? c.v[i] : c.d ? formatDay(c.d[i]) : c.c); });
+            }
+        });
+        return cells[0].length ? {header: table.header, cells: cells} : {header: table.empty_header, cells: [[table.empty]]};
+    }
+    function pinFocus(r, table) {
+        // Aranan aktivite tabloda görünüyorsa satırı vurgulanır; tabloya giriyor ama eşik ya da ilk
+        // satırlar dışında kalıyorsa en üste sabitlenir. r.row: vurgulanan satır (-1 yok)
+        var f = currentFocus, row = -1, pin = null;
+        if (f && f.tables) {
+            if (r.header === table.header) row = r.cells[0].indexOf(f.id);
+            f.tables.forEach(function (p) { if (p.trace === table.trace) pin = p.cells; });
+            if (row < 0 && pin) {
+                if (r.header !== table.header) r = {header: table.header, cells: table.header.map(function () { return []; })};
+                pin.forEach(function (v, k) { r.cells[k].unshift(v); });
+                row = 0;
+            }
+        }
+        r.fill = r.cells.map(function (c) { return c.map(function (_, i) { return i === row ? FOCUS_FILL : CELL_FILL; }); });
+        r.row = row;
+        return r;
+    }
+    function applyFilter(f, jump) {
+        currentFilter = f;
+        if (!filterData || rendering) return;
+        var started = performance.now(), until = filterData.today === null ? null : filterData.today + f.horizon;
+        var headers = [], cells = [], fills = [], traces = [], layout = {}, shown = 0, target = null;
+        filterData.tables.forEach(function (t) {
+            var r = pinFocus(filterTable(t, f, until), t);
+            headers.push(r.header); cells.push(r.cells); fills.push(r.fill); traces.push(t.trace);
+            if (r.header === t.header) shown += r.cells[0].length;
+            if (r.row >= 0 && target === null) target = t.trace;
+        });
+        filterData.titles.forEach(function (t) {
+            layout['annotations[' + t.index + '].text'] = t.text.replace('{slack}', f.slack).replace('{horizon}', f.horizon);
+        });
+        Plotly.update(plot, {'header.values': headers, 'cells.values': cells, 'cells.fill.color': fills}, layout, traces).then(function () {
+            if (bridge) bridge.reportFilter(performance.now() - started, shown);
+            var domain = target === null ? null : plot.data[target].domain, height = plot.layout.height;
+            if (jump && domain && height) window.scrollTo(0, plot.offsetTop + (1 - domain.y[1]) * height);
+        });
+    }
+    function setFocus(f) {
+        currentFocus = f; focusJump = true;
+        if (!rendering) applyFocus();
+    }
+    function applyFocus() {
+        var f = currentFocus, jump = focusJump;
+        focusJump = false;
+        if (filterData) { if (currentFilter) applyFilter(currentFilter, jump); return; }
+        if (plot.style.display === 'none' || !plot.layout) return;
+        var axis = f && f.pos !== undefined, layout = plot.layout, update = {shapes: baseShapes.slice()};
+        if (!axis && !zoomed && !jump) return;
+        if (axis) {
+            update.shapes.push({type: 'rect', xref: 'paper', x0: 0, x1: 1, yref: 'y', y0: f.pos - 0.5, y1: f.pos + 0.5,
+                                fillcolor: 'rgba(241, 196, 15, 0.35)', line: {width: 0}, layer: 'below'});
+        }
+        if (jump && axis && f.window && f.count > 2 * f.window) {
+            // Eksen ters (autorange: reversed): aralık büyükten küçüğe
+            update['yaxis.range'] = [f.pos + f.window, f.pos - f.window]; zoomed = true;
+        } else if (jump && zoomed) {
+            update['yaxis.autorange'] = 'reversed'; zoomed = false;
+        }
+        Plotly.relayout(plot, update).then(function () {
+            if (!jump || !axis || !layout.height) return;
+            // Uzun sayfa (Gantt): satır ekranın ortasına kaydırılır; kategori i, çizim alanında (i + 0.5) / count
+            var m = layout.margin || {}, top = m.t || 0, h = layout.height - top - (m.b || 0);
+            window.scrollTo(0, plot.offsetTop + top + (f.pos + 0.5) * h / f.count - window.innerHeight / 2);
+        });
+    }
+    function renderMessage(html) {
+        filterData = null;
+        Plotly.purge(plot); plot._bound = false; plot.style.display = 'none';
+        msg.innerHTML = html; msg.style.display = 'block';
+    }
+</script></body></html>
+"""
+_plot_shell_path = None
+_plot_shell_lock = threading.Lock()
+
+def plot_shell_path():
+    # Açılışta arka planda (warmup_job) hazırlanır; ilk görünüm kurulurken beklenmesin
+    global _plot_shell_path
+    with _plot_shell_lock:
+        if _plot_shell_path is None:
+            import plotly
+            from plotly.offline import get_plotlyjs
+            folder = os.path.join(os.path.dirname(default_cache_dir()), "web"); os.makedirs(folder, exist_ok=True)
+            js_name = f"plotly-{plotly.__version__}.min.js"; js_path = os.path.join(folder, js_name)
+            if not os.path.exists(js_path):
+                tmp = js_path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f: f.write(get_plotlyjs())
+                os.replace(tmp, js_path)
+            shell_path = os.path.join(folder, f"plot_shell-{plotly.__version__}.html")
+            with open(shell_path, "w", encoding="utf-8") as f: f.write(PLOT_SHELL.replace("{plotly_js}", js_name))
+            _plot_shell_path = shell_path
+        return _plot_shell_path
+
+class PlotBridge(QObject):
+    # Sayfadan Python'a QWebChannel köprüsü: tıklanan noktanın y değeri (ör. Benzersiz_Kimlik)
+    clicked = pyqtSignal(str)
+    # Plotly.react süresi (ms): WebEngine tarafındaki çizim maliyeti ölçümlere katılır
+    rendered = pyqtSignal(float)
+    # Tarayıcıdaki filtre uygulaması: süre (ms) ve gösterilen satır sayısı
+    filtered = pyqtSignal(float, int)
+
+    @pyqtSlot(str)
+    def click(self, key): self.clicked.emit(key)
+
+    @pyqtSlot(float)
+    def reportRender(self, ms): self.rendered.emit(ms)
+
+    @pyqtSlot(float, int)
+    def reportFilter(self, ms, rows): self.filtered.emit(ms, rows)
+
+class PlotView(QWidget):
+    # Kalıcı sayfa; içerik ("fig", json) veya ("html", metin) yükü ile güncellenir.
+    # QWebEngineView (ve Chromium süreci) ilk figür geldiğinde kurulur; o zamana kadar HTML
+    # mesajlar basit bir etikette gösterilir, açılışta hiçbir WebEngine görünümü oluşturulmaz.
+    # Filtre ({"slack", "horizon"}) ve arama vurgusu (focus) tarayıcıda uygulanır; yeni figür geldiğinde de korunur.
+    clicked = pyqtSignal(str)
+
+    def __init__(self, placeholder=None, name="Grafik"):
+        super().__init__()
+        self.ready = False; self.payload = None; self.name = name; self.web = None; self.filter = None
+        self.focus = None; self.focus_jump = False
+        layout = QVBoxLayout(); layout.setContentsMargins(0, 0, 0, 0); self.setLayout(layout)
+        self.lbl_message = QLabel(placeholder or ""); self.lbl_message.setWordWrap(True)
+        self.lbl_message.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.addWidget(self.lbl_message)
+
+    def ensure_view(self):
+        if self.web is not None: return
+        with stage(f"{self.name}: WebEngine kurulumu"):
+            self.web = QWebEngineView(self)
+            self.bridge = PlotBridge(self); self.bridge.clicked.connect(self.clicked)
+            self.bridge.rendered.connect(lambda ms: record(f"{self.name}: tarayıcı çizimi", elapsed_ms=round(ms, 2), payload_bytes=len(self.payload[1])))
+            self.bridge.filtered.connect(lambda ms, rows: record(f"{self.name}: filtre", elapsed_ms=round(ms, 2), rows=rows))
+            self.channel = QWebChannel(self); self.channel.registerObject("bridge", self.bridge)
+            self.web.page().setWebChannel(self.channel)
+            self.web.loadFinished.connect(self.on_load_finished)
+            self.web.load(QUrl.fromLocalFile(plot_shell_path()))
+        self.lbl_message.hide(); self.layout().addWidget(self.web)
+
+    def on_load_finished(self, ok):
+        self.ready = ok
+        if ok and self.payload: self.show_payload(self.payload)
+
+    def show_payload(self, payload):
+        # Sayfa henüz yüklenmediyse yük saklanır, yükleme bitince basılır
+        self.payload = payload
+        kind, body = payload
+        if kind == "html" and self.web is None: self.lbl_message.setText(body); return
+        self.ensure_view()
+        if not self.ready: return
+        script = f"renderFigure({body})" if kind == "fig" else f"renderMessage({json.dumps(body)})"
+        if self.filter: script = f"currentFilter = {json.dumps(self.filter)}; {script}"
+        script = f"currentFocus = {json.dumps(self.focus)}; focusJump = {json.dumps(self.focus_jump)}; {script}"
+        self.focus_jump = False
+        self.web.page().runJavaScript(script)
+
+    def apply_filter(self, values):
+        # Sayfa yeniden yüklenmez, figür yeniden gönderilmez; yalnızca eşik değerleri gider
+        self.filter = values
+        if self.web is not None and self.ready: self.web.page().runJavaScript(f"applyFilter({json.dumps(values)})")
+
+    def set_focus(self, values):
+        # Arama seçimi: eksen satırı ({"pos", "count"}) ya da tablo satırı ({"id", "tables"}); sayfa bir kez
+        # ona kaydırılır. Yalnızca self.focus atanırsa sonraki çizimde kaydırmadan vurgulanır
+        self.focus = values
+        if self.web is not None and self.ready: self.web.page().runJavaScript(f"setFocus({json.dumps(values)})")
+        else: self.focus_jump = True
+
+class GanttView(QWidget):
+    # Sanal kaydırmalı Gantt: model bir kez arka planda kurulur, sayfa/seviye/aç-kapa/bolluk eşiği
+    # değişimlerinde yalnızca görünen pencere (GANTT_PAGE_SIZE satır) yeniden çizilir
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(); layout.setContentsMargins(0, 0, 0, 0); self.setLayout(layout)
+        bar = QHBoxLayout(); layout.addLayout(bar)
+        self.cmb_level = QComboBox(); self.cmb_level.addItem("Tüm seviyeler", None)
+        for d in range(1, 6): self.cmb_level.addItem(f"{d}. seviyeye kadar", d)
+        self.cmb_level.currentIndexChanged.connect(self.on_level_changed)
+        self.btn_prev = QPushButton("◀ Önceki"); self.btn_prev.clicked.connect(lambda: self.turn_page(-1))
+        self.btn_next = QPushButton("Sonraki ▶"); self.btn_next.clicked.connect(lambda: self.turn_page(1))
+        self.lbl_page = QLabel(""); self.lbl_page.setStyleSheet("color: #7f8c8d; margin: 0 10px;")
+        hint = QLabel("Alt kırılımı açıp kapatmak için çubuğa tıklayın"); hint.setStyleSheet("color: #95a5a6;")
+        bar.addWidget(QLabel("WBS:")); bar.addWidget(self.cmb_level); bar.addWidget(hint); bar.addStretch()
+        bar.addWidget(self.btn_prev); bar.addWidget(self.lbl_page); bar.addWidget(self.btn_next)
+        self.plot = PlotView(name=VIEW_TITLES["gantt"]); layout.addWidget(self.plot)
+        self.plot.clicked.connect(self.toggle)
+        self.model = None; self.toggled = set(); self.offset = 0; self.slack_limit = None
+        # Aranan aktivite (kimlik, İKY) ve modeldeki karşılığı (kendisi ya da en yakın görünür üst özet)
+        self.focus = None; self.focus_row = None
+
+    def set_content(self, result):
+        if isinstance(result, core.GanttModel):
+            self.model = result; self.toggled = set(); self.offset = 0
+            result.set_slack_limit(self.slack_limit); self.locate_focus(); self.render()
+        else:
+            self.model = None; self.focus_row = None; self.plot.focus = None; self.lbl_page.setText("")
+            self.plot.show_payload(to_payload(result))
+
+    def locate_focus(self):
+        # Aranan satırın ataları açılır ve onu içeren sayfa seçilir
+        m = self.model
+        self.focus_row = m.locate(*self.focus) if m is not None and self.focus else None
+        if self.focus_row is None: return
+        level = self.cmb_level.currentData()
+        self.toggled ^= set(m.closed_ancestors(self.focus_row, m.expanded(level, self.toggled)))
+        rows = m.visible_rows(m.expanded(level, self.toggled))
+        self.offset = int((rows < self.focus_row).sum()) // core.GANTT_PAGE_SIZE * core.GANTT_PAGE_SIZE
+
+    def set_focus(self, key, code=None):
+        # Dönüş: Gantt'ta vurgulanan satırın kimliği ya da None
+        self.focus = (key, code) if key is not None else None
+        self.locate_focus()
+        if self.model is not None: self.render()
+        self.plot.set_focus(self.plot.focus)
+        return self.model.ids[self.focus_row] if self.focus_row is not None else None
+
+    def render(self):
+        m = self.model
+        if m is None: return
+        expanded = m.expanded(self.cmb_level.currentData(), self.toggled)
+        rows = m.visible_rows(expanded)
+        page = core.GANTT_PAGE_SIZE
+        if not len(rows):
+            self.plot.focus = None
+            self.plot.show_payload(to_payload(core.gantt_empty_html(self.slack_limit)))
+            self.lbl_page.setText(""); self.btn_prev.setEnabled(False); self.btn_next.setEnabled(False)
+            return
+        self.offset = max(0, min(self.offset, (len(rows) - 1) // page * page))
+        window = rows[self.offset:self.offset + page]
+        hit = (window == self.focus_row).nonzero()[0] if self.focus_row is not None else ()
+        self.plot.focus = {"pos": int(hit[0]), "count": len(window)} if len(hit) else None
+        with stage("Gantt: sayfa çizimi", rows=len(window)) as st:
+            payload = to_payload(m.figure(window, expanded)); st.payload_bytes = len(payload[1])
+        self.plot.show_payload(payload)
+        self.lbl_page.setText(f"{self.offset + 1}-{self.offset + len(window)} / {len(rows)} satır")
+        self.btn_prev.setEnabled(self.offset > 0); self.btn_next.setEnabled(self.offset + page < len(rows))
+
+    def turn_page(self, step):
+        self.offset += step * core.GANTT_PAGE_SIZE; self.render()
+
+    def on_level_changed(self, _):
+        self.toggled = set(); self.offset = 0; self.render()
+
+    def set_slack_limit(self, limit):
+        self.slack_limit = limit
+        if self.model is None: return
+        with stage("Gantt: bolluk eşiği", rows=len(self.model)): self.model.set_slack_limit(limit)
+        self.toggled = set(); self.offset = 0; self.locate_focus(); self.render()
+
+    def toggle(self, key):
+        i = self.model.pos.get(key) if self.model else None
+        if i is None or not self.model.has_children[i]: return
+        self.toggled ^= {key}; self.render()
+
+class TrendsView(QWidget):
+    # Program geçmişi: proje, son N güncelleme ve isteğe bağlı tek aktivite seçilir; sorgu ve figür
+    # arka planda üretilir (ProjectApp.refresh_trends). Seçim değişince changed sinyali gider.
+    changed = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(); layout.setContentsMargins(0, 0, 0, 0); self.setLayout(layout)
+        bar = QHBoxLayout(); layout.addLayout(bar)
+        self.cmb_project = QComboBox(); self.cmb_project.setMinimumWidth(280)
+        self.spn_last = QSpinBox(); self.spn_last.setRange(1, 520); self.spn_last.setValue(5)
+        self.spn_last.setPrefix("Son "); self.spn_last.setSuffix(" güncelleme")
+        self.txt_uid = QLineEdit(); self.txt_uid.setFixedWidth(260)
+        self.txt_uid.setPlaceholderText("Aktivite Benzersiz Kimliği (Enter)")
+        self.btn_import = QPushButton("📥 Geçmişe Dosya Ekle")
+        self.btn_import.setStyleSheet("background-color: #16a085; color: white; padding: 6px 10px; border-radius: 5px; border:none;")
+        bar.addWidget(QLabel("Proje:")); bar.addWidget(self.cmb_project); bar.addWidget(self.spn_last); bar.addWidget(self.txt_uid)
+        bar.addStretch(); bar.addWidget(self.btn_import)
+        self.plot = PlotView(NO_HISTORY_HTML, name="Eğilimler"); layout.addWidget(self.plot)
+        self.cmb_project.currentIndexChanged.connect(lambda _: self.changed.emit())
+        self.spn_last.valueChanged.connect(lambda _: self.changed.emit())
+        self.txt_uid.returnPressed.connect(self.changed.emit)
+
+    def set_projects(self, projects, select=None):
+        current = select or self.cmb_project.currentText()
+        self.cmb_project.blockSignals(True)
+        self.cmb_project.clear(); self.cmb_project.addItems(projects)
+        if current in projects: self.cmb_project.setCurrentText(current)
+        self.cmb_project.blockSignals(False)
+
+    def query(self):
+        uid = self.txt_uid.text().strip()
+        return self.cmb_project.currentText(), self.spn_last.value(), core.normalize_id(uid) if uid else None
+
+# --- ARKA PLAN İŞLERİ ---
+# Ağır işler (Excel okuma, grafik üretimi) QThreadPool üzerinde çalışır; sonuçlar sinyallerle
+# ana iş parçacığına döner ve widget güncellemeleri yalnızca orada yapılır.
+class JobCancelled(Exception):
+    pass
+
+class PerfSignals(QObject):
+    # instrumentation dinleyicisi: kayıtlar hangi iş parçacığında oluşursa oluşsun ana iş parçacığına taşınır
+    record = pyqtSignal(object)
+
+class JobSignals(QObject):
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    done = pyqtSignal()
+
+class Job(QRunnable):
+    # fn(job, *args) arka planda çalışır; adımlar arasında job.report() ile ilerleme bildirir
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn; self.args = args; self.cancelled = False
+        self.signals = JobSignals()
+        self.setAutoDelete(False)
+
+    def cancel(self): self.cancelled = True
+
+    def report(self, percent, message):
+        if self.cancelled: raise JobCancelled()
+        self.signals.progress.emit(percent, message)
+
+    def run(self):
+        try:
+            result = self.fn(self, *self.args)
+            if not self.cancelled: self.signals.finished.emit(result)
+        except JobCancelled: pass
+        except Exception as e:
+            if not self.cancelled: self.signals.failed.emit(str(e))
+        finally: self.signals.done.emit()
+
+def warmup_job(job):
+    # Açılışta bir kez: çekirdek içe aktarılır, plotly iz sınıfları bir kez kurularak ısıtılır,
+    # plotly.js kabuk sayfası, önbellek ve geçmiş veritabanı hazırlanır.
+    # Dönüş: (ScheduleCache, HistoryStore); kurulamayan None olur
+    with stage("açılış: çekirdek içe aktarma"):
+        import_core()
+    with stage("açılış: plotly ısınma"):
+        import plotly.graph_objects as go
+        go.Figure([go.Bar(), go.Scatter(), go.Pie(), go.Table(), go.Indicator()]).to_json()
+        plot_shell_path()
+    try: cache = ScheduleCache(core.PARSER_VERSION)
+    except OSError: cache = None
+    try:
+        from history_store import HistoryStore
+        history = HistoryStore()
+    except Exception: history = None
+    return cache, history
+
+def record_history(history, path, df):
+    # Geçmişe kayıt yüklemeyi asla bozmaz; hata aşama kaydına düşer. Dönüş: eklenen proje adı ya da None
+    if history is None: return None
+    try:
+        with stage("geçmişe kayıt", rows=len(df), file=os.path.basename(path)):
+            _, project, created = history.ingest_file(path, df)
+        return project if created else None
+    except Exception: return None
+
+def load_job(job, path, cache, parser, history):
+    job.report(10, f"{os.path.basename(path)} okunuyor...")
+    with stage("yükleme", file=os.path.basename(path)) as st:
+        df, key = cache.load_keyed(path, parser) if cache else (parser(path), None)
+        st.rows = len(df)
+    # Tarih penceresi sorgularının ve aktivite aramasının indeksleri yüklemede kurulur; sekmeler onları paylaşır
+    core.get_index(df); core.get_search_index(df)
+    if history is not None: job.report(80, f"{os.path.basename(path)} geçmişe kaydediliyor...")
+    project = record_history(history, path, df)
+    job.report(100, f"{os.path.basename(path)} yüklendi")
+    return df, key, project
+
+def watch_job(job, path, df):
+    # İzleme başlangıcı: dosyanın ham satır özetleri (yüklü çerçeveyle eşleşmiyorsa None)
+    with stage("izleme: satır özetleri", rows=len(df), file=os.path.basename(path)):
+        return core.watch_hashes(path, df)
+
+def reload_job(job, path, df, hashes, cache):
+    # Değişen dosyanın yalnızca eklenen/değişen satırları ayrıştırılır. Dönüş: (df, özetler, fark, anahtar)
+    job.report(10, f"{os.path.basename(path)} değişti, okunuyor...")
+    with stage("yeniden yükleme", file=os.path.basename(path)) as st:
+        df, hashes, delta = core.reload_changed(path, df, hashes)
+        st.rows = len(df)
+        if delta: st.extra.update(delta["counts"])
+    core.get_index(df); core.get_search_index(df)
+    try: key = cache.key(path) if cache else None
+    except OSError: key = None
+    job.report(100, f"{os.path.basename(path)} güncellendi")
+    return df, hashes, delta, key
+
+def persist_job(job, path, df, key, cache, history):
+    # Yeniden yüklemeden sonra önbellek ve geçmiş arka planda yazılır; sekmeler bunu beklemez
+    if cache and key:
+        try: cache.put(key, df)
+        except OSError: pass
+    return record_history(history, path, df)
+
+def whatif_job(job, network, df, changes):
+    # changes: senaryonun tamamı {görev satırı: süre}. CPM ağı ilk senaryoda kurulur, sonra yeniden kullanılır.
+    # Dönüş: (ağ, senaryo çerçevesi ya da boş senaryoda None, yeniden hesaplanan görev sayısı, süre ms)
+    started = time.perf_counter()
+    if network is None:
+        job.report(10, "Senaryo: ağ kuruluyor...")
+        with stage("senaryo: ağ kurulumu", rows=len(df)): network = cpm.ScheduleNetwork(df)
+    job.report(50, "Senaryo hesaplanıyor...")
+    with stage("senaryo: hesap") as st:
+        affected = network.set_scenario(changes); st.rows = len(affected)
+    frame = None
+    if changes:
+        with stage("senaryo: uygulama", rows=len(df)): frame = core.finalize_frame(network.apply(df))
+    return network, frame, len(affected), (time.perf_counter() - started) * 1000
+
+def history_job(job, paths, cache, history):
+    # Eski güncellemelerin toplu eklenmesi: her dosya önbellekten ya da ayrıştırılarak okunur, bir kez yazılır
+    added = []; failed = []
+    for i, path in enumerate(paths):
+        job.report(int(100 * i / len(paths)), f"Geçmiş: {os.path.basename(path)} ({i + 1}/{len(paths)})")
+        try:
+            df = cache.load(path, core.process_data) if cache else core.process_data(path)
+            _, project, created = history.ingest_file(path, df)
+            if created: added.append(project)
+        except Exception as e:
+            failed.append(f"{os.path.basename(path)}: {e}")
+    return added, failed
+
+def trend_job(job, history, project, last_n, uid):
+    job.report(10, "Eğilimler sorgulanıyor...")
+    with stage("Eğilimler: sorgu") as st:
+        snaps = history.snapshots(project); slips = history.slipped(project, last_n)
+        activity = history.activity_history(project, uid) if uid else None
+        st.rows = len(slips)
+    with stage("Eğilimler: üretim"):
+        result = core.build_trends(snaps, slips, activity, uid, last_n)
+    with stage("Eğilimler: serileştirme") as st:
+        payload = to_payload(result); st.payload_bytes = len(payload[1])
+    return payload
+
+def to_payload(result, filter_data=None):
+    # Figürler arka planda JSON'a çevrilir; sayfaya yalnızca bu metin gönderilir.
+    # filter_data (aday satırlar) figür nesnesine "filter" anahtarıyla eklenir, tarayıcıda süzülür
+    if isinstance(result, str): return ("html", result)
+    body = result.to_json()
+    if filter_data: body = f'{body[:-1]}, "filter": {json.dumps(filter_data, ensure_ascii=False)}}}'
+    return ("fig", body)
+
+def render_job(job, view, df_c, df_b):
+    job.report(10, f"{VIEW_TITLES[view]} hazırlanıyor...")
+    with stage(f"{VIEW_TITLES[view]}: üretim", rows=len(df_c)):
+        result = VIEW_BUILDERS[view](df_c, df_b)
+    # Gantt modeli ve analiz metni olduğu gibi döner; Gantt penceresi ana iş parçacığında çizilir
+    if view == "notes" or isinstance(result, core.GanttModel): return result
+    filter_data = None
+    if view in VIEW_FILTERS:
+        with stage(f"{VIEW_TITLES[view]}: filtre adayları"): filter_data = VIEW_FILTERS[view](df_c, df_b)
+    with stage(f"{VIEW_TITLES[view]}: serileştirme") as st:
+        payload = to_payload(result[1] if view == "dash" else result, filter_data)
+        st.payload_bytes = len(payload[1])
+    return (result[0], payload) if view == "dash" else payload
+
+# --- SEKME ÇİZİM PLANLAYICI ---
+# Her sekme yalnızca bağlı olduğu girdiler değişince ve görünür olduğunda yeniden çizilir.
+# "today" girdisi günlük değişir; takvime bağlı sekmeler ertesi gün kendiliğinden kirlenir.
+VIEW_DEPS = {
+    "dash": ("current", "today"),
+    "comp": ("current", "baseline", "today"),
+    "gantt": ("current", "today"),
+    "time": ("current",),
+    "notes": ("current", "baseline", "today"),
+}
+VIEW_BUILDERS = {
+    "dash": lambda c, b: core.build_dashboard(c),
+    "comp": lambda c, b: core.build_comparison(c, b) if b is not None else NO_BASELINE_HTML,
+    "gantt": lambda c, b: core.build_gantt(c, slack_limit=None),
+    "time": lambda c, b: core.build_timeline(c),
+    "notes": lambda c, b: core.build_insights(c, b),
+}
+# Bolluk eşiği / ufuk filtresinin aday satırları; tablolar varsayılan değerlerle çizilir, sonra tarayıcıda süzülür
+VIEW_FILTERS = {
+    "dash": lambda c, b: core.dashboard_filter_data(c),
+    "comp": lambda c, b: core.comparison_filter_data(c, b) if b is not None else None,
+}
+# Yeniden yüklemede bir sekmenin etkilenip etkilenmediği: okuduğu satır kapsamı (summary/tasks/all)
+# ve sütunlar. Kapsamda satır eklenip silinmişse ya da değişen satırlarda bu sütunlardan biri
+# değişmişse sekme yeniden çizilir; aksi halde önceki çizimi yeni sürüme taşınır (ProjectApp.carry_views).
+VIEW_READS = {
+    "dash": ("all", {'Özet', 'Durum', 'Benzersiz_Kimlik', 'Ad', 'Başlangıç_Date', 'Bitiş_Date', 'Fiili_Başlangıç_Date',
+                     'Fiili_Bitiş_Date', 'Bolluk_Num', 'Tamamlanma_Yüzdesi'}),
+    "comp": ("tasks", {'Özet', 'Benzersiz_Kimlik', 'Ad', 'Başlangıç_Date', 'Bitiş_Date', 'Fiili_Başlangıç_Date', 'Fiili_Bitiş_Date',
+                       'Süre_Num', 'Bolluk_Num'}),
+    "gantt": ("summary", {'Özet', 'Kritik', 'Benzersiz_Kimlik', 'İKY', 'Ad', 'Başlangıç_Date', 'Bitiş_Date', 'Fiili_Bitiş_Date',
+                          'Süre_Num', 'Tamamlanma_Yüzdesi', 'Bolluk_Num'}),
+    "time": ("summary", {'Özet', 'Kritik', 'Ad', 'Başlangıç_Date', 'Bitiş_Date', 'Süre_Num', 'Tamamlanma_Yüzdesi'}),
+    "notes": ("tasks", {'Özet', 'Kritik', 'Benzersiz_Kimlik', 'Ad', 'Başlangıç_Date', 'Bitiş_Date', 'Fiili_Başlangıç_Date',
+                        'Fiili_Bitiş_Date', 'Süre_Num', 'Bolluk_Num'}),
+}
+VIEW_TITLES = {"dash": "Yönetici Özeti", "comp": "Kıyas Tablosu", "gantt": "Gantt", "time": "Zaman Çizelgesi", "notes": "Analiz & Notlar"}
+MEMO_PER_VIEW = 3
+FILTER_DEBOUNCE_MS = 200  # Gantt sayfası sürgü bırakılmadan her adımda yeniden çizilmesin
+WATCH_DEBOUNCE_MS = 800  # Kaydetme birden çok değişiklik bildirimi üretir; sonuncusundan sonra okunur
+WATCH_RETRIES = 3  # Dosya yazılırken okunamazsa (kilitli/yarım) yeniden deneme sayısı
+SEARCH_POPUP_ROWS = 12
+# Arama seçiminin vurgulanıp görünür alana getirildiği sekmeler
+FOCUS_VIEWS = ("gantt", "time", "comp")
+
 # --- ANA UYGULAMA ---
 class ProjectApp(QMainWindow):
     def __init__(self):
@@ -96,12 +641,37 @@ class ProjectApp(QMainWindow):
         except: pass
 
         self.df_current = None; self.df_baseline = None
+        # Senaryo: yüklenen çerçeve korunur, süre değişiklikleri CPM ağı üzerinden df_current'a yansır
+        self.df_loaded = None; self.loaded_version = None; self.network = None; self.scenario = {}; self.whatif_job = None
+        self.pool = QThreadPool.globalInstance(); self.jobs = set()
+        self.load_jobs = {False: None, True: None}
+        # Girdi sürümleri: dosya içerik anahtarı (önbellek varsa) ya da artan sayaç
+        self.versions = {"current": None, "baseline": None, "today": None}; self.version_counter = count(1)
+        self.memo = {view: {} for view in VIEW_DEPS}; self.shown = {}; self.view_jobs = {}
+        # Önbellek ve çekirdek warmup_job bitince hazırdır; o zamana kadar istekler bekletilir
+        self.cache = None; self.core_ready = False; self.core_waiters = []
+        # Program geçmişi: her kayıt sürümü artırır, Eğilimler sekmesi görünürken yeniden sorgulanır
+        self.history = None; self.history_version = 0; self.last_project = None
+        self.trends_projects = None; self.trends_shown = None; self.trends_job = None
+        # Aranan aktivite (kimlik, İKY) ve henüz ona kaydırılmamış sekmeler (çizildiklerinde kaydırılır)
+        self.focus = None; self.focus_pending = set()
+        # Dosya izleme (isteğe bağlı): yüklenen dosya yolları, ham satır özetleri ve dosya başına erteleme
+        self.paths = {False: None, True: None}; self.row_hashes = {False: None, True: None}
+        self.watch_retries = {False: 0, True: 0}
+        self.watcher = QFileSystemWatcher(self); self.watcher.fileChanged.connect(self.on_watched_file_changed)
+        self.watch_timers = {}
+        for is_base in (False, True):
+            timer = QTimer(self); timer.setSingleShot(True); timer.setInterval(WATCH_DEBOUNCE_MS)
+            timer.timeout.connect(lambda b=is_base: self.reload_file(b)); self.watch_timers[is_base] = timer
         main_widget = QWidget(); self.setCentralWidget(main_widget)
         self.main_layout = QVBoxLayout(); main_widget.setLayout(self.main_layout)
 
         self.create_top_bar()
+        self.create_filter_bar()
         self.tabs = QTabWidget(); self.main_layout.addWidget(self.tabs)
         self.setup_pages()
+        self.setup_diagnostics()
+        self.start_warmup()
 
     def create_top_bar(self):
         top = QFrame(); top.setStyleSheet("background-color: white; border-radius: 5px; margin-bottom: 5px;"); top.setFixedHeight(80)
@@ -120,416 +690,598 @@ class ProjectApp(QMainWindow):
         self.btn_base.clicked.connect(lambda: self.load_file(True))
         self.lbl_base = QLabel("Yüklü Değil"); self.lbl_base.setStyleSheet("color: #95a5a6;")
 
+        self.progress = QProgressBar(); self.progress.setFixedWidth(180); self.progress.setRange(0, 100)
+        self.lbl_status = QLabel(""); self.lbl_status.setStyleSheet("color: #7f8c8d; margin-right: 10px;")
+        self.btn_cancel = QPushButton("✖ İptal")
+        self.btn_cancel.setStyleSheet("background-color: #e74c3c; color: white; padding: 6px 10px; border-radius: 5px; border:none;")
+        self.btn_cancel.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_cancel.clicked.connect(self.cancel_jobs)
+        for w in (self.progress, self.btn_cancel): w.hide()
+
+        self.btn_whatif = QPushButton("🧮 Senaryo")
+        self.btn_whatif.setStyleSheet("background-color: #e67e22; color: white; padding: 10px; border-radius: 5px; border:none;")
+        self.btn_whatif.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_whatif.setToolTip("Bir görevin süresini değiştirip bolluk ve kritik hattı yeniden hesapla")
+        self.btn_whatif.clicked.connect(self.run_whatif); self.btn_whatif.setEnabled(False)
+        self.btn_reset_whatif = QPushButton("↺ Senaryoyu Sıfırla")
+        self.btn_reset_whatif.setStyleSheet("background-color: #95a5a6; color: white; padding: 10px; border-radius: 5px; border:none;")
+        self.btn_reset_whatif.clicked.connect(self.reset_whatif); self.btn_reset_whatif.hide()
+
+        self.btn_watch = QPushButton("👁 İzle"); self.btn_watch.setCheckable(True)
+        self.btn_watch.setStyleSheet("QPushButton { background-color: #95a5a6; color: white; padding: 10px; border-radius: 5px; border:none; }"
+                                     " QPushButton:checked { background-color: #16a085; }")
+        self.btn_watch.setToolTip("Yüklenen dosyalar kaydedildikçe değişen satırları otomatik yeniden yükle")
+        self.btn_watch.toggled.connect(self.toggle_watch)
+
         layout.addWidget(title); layout.addStretch()
+        layout.addWidget(self.lbl_status); layout.addWidget(self.progress); layout.addWidget(self.btn_cancel)
         layout.addWidget(self.btn_cur); layout.addWidget(self.lbl_cur)
-        layout.addWidget(self.btn_base); layout.addWidget(self.lbl_base)
+        layout.addWidget(self.btn_base); layout.addWidget(self.lbl_base); layout.addWidget(self.btn_watch)
+        layout.addWidget(self.btn_whatif); layout.addWidget(self.btn_reset_whatif)
         self.main_layout.addWidget(top)
 
+    def create_filter_bar(self):
+        # Bolluk eşiği ve ileriye bakış ufku: Yönetici Özeti ve Kıyas tabloları tarayıcıda süzülür
+        # (figür yeniden üretilmez), Gantt modeli yerinde süzülüp görünen sayfa yeniden çizilir.
+        # Aralık ve varsayılanlar çekirdekten gelir; çekirdek hazır olana kadar kapalıdır.
+        bar = QFrame(); bar.setStyleSheet("background-color: white; border-radius: 5px; margin-bottom: 5px;")
+        layout = QHBoxLayout(); layout.setContentsMargins(10, 2, 10, 2); bar.setLayout(layout)
+        self.sld_slack = QSlider(Qt.Orientation.Horizontal); self.sld_horizon = QSlider(Qt.Orientation.Horizontal)
+        self.lbl_slack = QLabel(""); self.lbl_horizon = QLabel("")
+        for lbl in (self.lbl_slack, self.lbl_horizon): lbl.setFixedWidth(130); lbl.setStyleSheet("color: #2c3e50; font-weight: bold;")
+        self.btn_filter_reset = QPushButton("↺ Varsayılan"); self.btn_filter_reset.clicked.connect(self.reset_filter)
+        self.btn_filter_reset.setStyleSheet("background-color: #95a5a6; color: white; padding: 4px 10px; border-radius: 5px; border:none;")
+        for sld in (self.sld_slack, self.sld_horizon):
+            sld.setFixedWidth(260); sld.setEnabled(False); sld.valueChanged.connect(lambda _: self.on_filter_changed())
+        self.btn_filter_reset.setEnabled(False)
+        self.gantt_filter_timer = QTimer(self); self.gantt_filter_timer.setSingleShot(True); self.gantt_filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.gantt_filter_timer.timeout.connect(lambda: self.gantt_view.set_slack_limit(self.sld_slack.value()))
+        layout.addWidget(QLabel("Kritik aktivite filtresi:")); layout.addWidget(self.sld_slack); layout.addWidget(self.lbl_slack)
+        layout.addWidget(self.sld_horizon); layout.addWidget(self.lbl_horizon); layout.addWidget(self.btn_filter_reset); layout.addStretch()
+
+        # Aktivite arama: öneriler yazdıkça güncel programın arama indeksinden gelir
+        self.txt_search = QLineEdit(); self.txt_search.setFixedWidth(340); self.txt_search.setClearButtonEnabled(True)
+        self.txt_search.setPlaceholderText("🔍 Aktivite ara: ad ya da Benzersiz Kimlik")
+        self.search_model = QStringListModel(self); self.search_rows = {}
+        self.completer = QCompleter(self.search_model, self)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.completer.setMaxVisibleItems(SEARCH_POPUP_ROWS)
+        self.txt_search.setCompleter(self.completer)
+        self.completer.activated.connect(self.on_search_chosen)
+        self.txt_search.textEdited.connect(self.on_search_edited)
+        self.txt_search.textChanged.connect(lambda text: None if text.strip() else self.set_focus(None))
+        self.txt_search.returnPressed.connect(self.on_search_return)
+        self.lbl_search = QLabel(""); self.lbl_search.setStyleSheet("color: #7f8c8d;")
+        layout.addWidget(self.lbl_search); layout.addWidget(self.txt_search)
+        self.main_layout.addWidget(bar)
+
+    def setup_filter(self):
+        for sld, limit in ((self.sld_slack, core.SLACK_LIMIT_MAX), (self.sld_horizon, core.LOOKAHEAD_MAX)):
+            sld.blockSignals(True); sld.setRange(0 if sld is self.sld_slack else 1, limit); sld.blockSignals(False); sld.setEnabled(True)
+        self.btn_filter_reset.setEnabled(True)
+        self.gantt_view.slack_limit = core.NEAR_CRITICAL_SLACK
+        self.reset_filter()
+
+    def reset_filter(self):
+        for sld, value in ((self.sld_slack, core.NEAR_CRITICAL_SLACK), (self.sld_horizon, core.LOOKAHEAD_DAYS)):
+            sld.blockSignals(True); sld.setValue(value); sld.blockSignals(False)
+        self.on_filter_changed()
+
+    def on_filter_changed(self):
+        values = {"slack": self.sld_slack.value(), "horizon": self.sld_horizon.value()}
+        self.lbl_slack.setText(f"Bolluk ≤ {values['slack']} gün"); self.lbl_horizon.setText(f"Ufuk: {values['horizon']} gün")
+        for view in ("dash", "comp"): self.plot_views[view].apply_filter(values)
+        if self.gantt_view.slack_limit != values["slack"]: self.gantt_filter_timer.start()
+
+    # --- AKTİVİTE ARAMA ---
+    # Sorgu ana iş parçacığında, yüklemede kurulan indekste çalışır (core.SearchIndex). Seçilen aktivite
+    # Gantt, Zaman Çizelgesi ve Kıyas sekmelerinde vurgulanır; çizimi güncel olan sekme hemen ona
+    # kaydırılır, diğerleri çizildiklerinde (apply_view). Gantt'ta ya da zaman çizelgesinde yoksa en yakın
+    # üst özeti, kıyas tablolarında eşik dışında kalıyorsa tablonun başına sabitlenmiş hâli gösterilir.
+    def on_search_edited(self, text):
+        df = self.df_loaded
+        if not text.strip() or df is None: self.search_model.setStringList([]); return
+        with stage("arama") as st:
+            rows = core.get_search_index(df).search(text); st.rows = len(rows)
+        ids = df['Benzersiz_Kimlik']; names = df['Ad']; codes = df['İKY'] if 'İKY' in df.columns else None
+        items = [f"{ids.iat[r]} · {names.iat[r]}" + (f"  [{codes.iat[r]}]" if codes is not None else "") for r in rows]
+        self.search_rows = dict(zip(items, rows)); self.search_model.setStringList(items)
+        if items: self.completer.complete()
+
+    def on_search_return(self):
+        if self.completer.popup().isVisible(): return
+        text = self.txt_search.text()
+        if text not in self.search_rows and self.search_model.rowCount(): text = self.search_model.stringList()[0]
+        self.on_search_chosen(text)
+
+    def on_search_chosen(self, text):
+        row = self.search_rows.get(text); df = self.df_loaded
+        if row is None or df is None: return
+        uid = df['Benzersiz_Kimlik'].iat[row]
+        code = df['İKY'].iat[row] if 'İKY' in df.columns else None
+        self.set_focus((uid, code if isinstance(code, str) else None))
+        info = f"{uid} · {df['Ad'].iat[row]}"
+        if self.shown.get("gantt") == self.view_signature("gantt"):
+            g = self.gantt_view; shown = g.model.ids[g.focus_row] if g.model is not None and g.focus_row is not None else None
+            if shown is None: info += " — Gantt'ta görünmüyor (tamamlanmış ya da bolluk eşiği dışında)"
+            elif shown != uid: info += f" — Gantt'ta üst özeti ({shown}) vurgulandı"
+        self.lbl_search.setText(info[:80]); self.lbl_search.setToolTip(info)
+        if self.view_tabs.get(self.tabs.currentWidget()) not in FOCUS_VIEWS: self.tabs.setCurrentWidget(self.gantt_view)
+
+    def set_focus(self, focus):
+        self.focus = focus; self.focus_pending = set(FOCUS_VIEWS); self.gantt_view.focus = focus
+        if focus is None: self.lbl_search.setText("")
+        for view in FOCUS_VIEWS:
+            if self.shown.get(view) != self.view_signature(view): continue
+            self.focus_pending.discard(view)
+            if view == "gantt": self.gantt_view.set_focus(*(focus or (None, None)))
+            else: self.plot_views[view].set_focus(self.focus_values(view))
+
+    def focus_values(self, view):
+        # Aranan aktivitenin zaman çizelgesi / kıyas karşılığı (tarayıcıya giden vurgu); Gantt kendi modelinde arar
+        key, code = self.focus or (None, None)
+        if key is None or self.df_current is None: return None
+        if view == "time": return core.timeline_focus(self.df_current, key, code)
+        if view == "comp" and self.df_baseline is not None: return core.comparison_focus(self.df_current, self.df_baseline, key)
+        return None
+
     def setup_pages(self):
         self.dash_tab = QWidget(); l1 = QVBoxLayout(); self.dash_tab.setLayout(l1)
         self.kpi_layout = QHBoxLayout(); l1.addLayout(self.kpi_layout)
-        self.web_dash = QWebEngineView(); l1.addWidget(self.web_dash)
+        self.web_dash = PlotView(name=VIEW_TITLES["dash"]); l1.addWidget(self.web_dash)
         self.tabs.addTab(self.dash_tab, "🚀 Yönetici Özeti")
 
         self.comp_tab = QWidget(); l2 = QVBoxLayout(); self.comp_tab.setLayout(l2)
-        self.web_comp = QWebEngineView(); self.web_comp.setHtml("<h3 style='font-family:Segoe UI; padding:20px; color:#7f8c8d'>Kıyaslama verilerini görmek için Baseline dosyasını yükleyiniz.</h3>")
+        self.web_comp = PlotView(NO_BASELINE_HTML, name=VIEW_TITLES["comp"])
         l2.addWidget(self.web_comp); self.tabs.addTab(self.comp_tab, "⚖️ Kıyas Tablosu")
 
-        self.web_gantt = QWebEngineView(); self.tabs.addTab(self.web_gantt, "📅 Kritik Hat (Gantt)")
-        self.web_time = QWebEngineView(); self.tabs.addTab(self.web_time, "⏳ Zaman Çizelgesi")
+        self.gantt_view = GanttView(); self.tabs.addTab(self.gantt_view, "📅 Kritik Hat (Gantt)")
+        self.web_time = PlotView(name=VIEW_TITLES["time"]); self.tabs.addTab(self.web_time, "⏳ Zaman Çizelgesi")
         
         self.txt_notes = QTextEdit(); self.txt_notes.setReadOnly(True)
         self.txt_notes.setStyleSheet("QTextEdit { background-color: white; color: #2c3e50; font-size: 15px; padding: 30px; border: none; }")
         self.tabs.addTab(self.txt_notes, "🤖 Analiz & Notlar")
 
+        self.trends_view = TrendsView(); self.tabs.addTab(self.trends_view, "📈 Eğilimler")
+        self.trends_view.changed.connect(self.refresh_trends)
+        self.trends_view.btn_import.clicked.connect(self.import_history)
+
+        self.view_tabs = {self.dash_tab: "dash", self.comp_tab: "comp", self.gantt_view: "gantt", self.web_time: "time", self.txt_notes: "notes"}
+        self.plot_views = {"dash": self.web_dash, "comp": self.web_comp, "gantt": self.gantt_view.plot, "time": self.web_time}
+        self.tabs.currentChanged.connect(lambda _: self.refresh_ui())
+        self.tabs.currentChanged.connect(lambda _: self.refresh_trends())
+
+    def setup_diagnostics(self):
+        # Aşama ölçümleri iş parçacıklarından sinyalle gelir, durum çubuğunda son aşama gösterilir.
+        # Gizli kısayollar: Ctrl+Shift+D tanılama paneli, Ctrl+Shift+P tek yenilemenin profili.
+        self.perf = PerfSignals(self); self.perf.record.connect(self.on_perf_record)
+        add_listener(self.perf.record.emit)
+        self.statusBar().setStyleSheet("color: #7f8c8d;")
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self).activated.connect(self.show_diagnostics)
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self).activated.connect(self.profile_refresh)
+        self.profile_pending = profile_enabled()
+
+    def start_warmup(self):
+        # İptal düğmesine bağlanmaz (start_job kullanılmaz): çekirdek olmadan hiçbir iş yapılamaz
+        job = Job(warmup_job); self.warmup = job
+        job.signals.finished.connect(self.on_core_ready)
+        job.signals.failed.connect(lambda msg: QMessageBox.critical(self, "Başlatma Hatası", msg))
+        self.lbl_status.setText("⏳ Bileşenler yükleniyor...")
+        self.pool.start(job)
+
+    def on_core_ready(self, result):
+        self.cache, self.history = result; self.core_ready = True
+        if not self.jobs: self.lbl_status.setText("")
+        startup_mark("çekirdek hazır")
+        self.setup_filter()
+        for fn in self.core_waiters: fn()
+        self.core_waiters = []
+        self.refresh_trends()
+        if STARTUP_TIMING_ARG in sys.argv:
+            for rec in recent:
+                if rec["stage"].startswith("açılış"): print(summarize(rec))
+            self.close()
+
+    def when_core_ready(self, fn):
+        if self.core_ready: fn()
+        else: self.core_waiters.append(fn)
+
+    def on_first_show(self):
+        # Olay döngüsünün ilk turu: pencere ekrana çizilmiştir
+        startup_mark("Python başladı", APP_STARTED); startup_mark("Qt içe aktarıldı", QT_IMPORTED)
+        startup_mark("pencere gösterildi")
+
+    def on_perf_record(self, rec):
+        self.statusBar().showMessage(summarize(rec))
+
+    def show_diagnostics(self):
+        dlg = QDialog(self); dlg.setWindowTitle("Tanılama - Aşama Ölçümleri"); dlg.resize(900, 500)
+        layout = QVBoxLayout(); dlg.setLayout(layout)
+        text = QPlainTextEdit(); text.setReadOnly(True)
+        text.setPlainText("\n".join(f"{rec['ts']}  {summarize(rec)}" for rec in reversed(recent)))
+        btn_profile = QPushButton("Profil Al (cProfile + tracemalloc)"); btn_profile.clicked.connect(self.profile_refresh)
+        layout.addWidget(QLabel(f"Günlük klasörü: {log_dir()}")); layout.addWidget(text); layout.addWidget(btn_profile)
+        dlg.exec()
+
+    def profile_refresh(self):
+        # Tüm sekmeleri ana iş parçacığında, profil altında bir kez üretir (tanılama amaçlı, arayüzü bekletir)
+        if self.df_current is None: self.statusBar().showMessage("Profil için önce güncel programı yükleyin"); return
+        df_c, df_b = self.df_current, self.df_baseline
+        def refresh_all():
+            for view, build in VIEW_BUILDERS.items():
+                with stage(f"{VIEW_TITLES[view]}: üretim (profil)", rows=len(df_c)):
+                    result = build(df_c, df_b)
+                if view == "dash": result = result[1]
+                if not isinstance(result, (str, core.GanttModel)): to_payload(result)
+        try:
+            _, path = capture_profile(refresh_all, "tüm sekmeler")
+            self.statusBar().showMessage(f"Profil kaydedildi: {path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Profil Hatası", str(e))
+
     def load_file(self, is_base):
-        path, _ = QFileDialog.getOpenFileName(self, "Dosya Seç", "", "Excel/CSV (*.xlsx *.csv)")
+        path, _ = QFileDialog.getOpenFileName(self, "Dosya Seç", "", "Proje Dosyaları (*.xlsx *.csv *.xml);;Excel/CSV (*.xlsx *.csv);;MS Project XML (*.xml)")
         if not path: return
-        try:
-            df = self.process_data(path)
-            if is_base:
-                self.df_baseline = df
-                self.lbl_base.setText(f"✅ {os.path.basename(path)}"); self.lbl_base.setStyleSheet("color: #27ae60; font-weight: bold;")
-                self.btn_base.setStyleSheet("background-color: #27ae60; color: white;")
-            else:
-                self.df_current = df
-                self.lbl_cur.setText(f"✅ {os.path.basename(path)}"); self.lbl_cur.setStyleSheet("color: #27ae60; font-weight: bold;")
-            self.refresh_ui()
-        except Exception as e: QMessageBox.critical(self, "Hata", str(e))
-
-    def process_data(self, path):
-        df = pd.read_csv(path) if path.endswith('.csv') else pd.read_excel(path)
-        df.columns = df.columns.str.strip()
-        
-        if 'Benzersiz_Kimlik' not in df.columns:
-             if 'Unique_ID' in df.columns: df.rename(columns={'Unique_ID': 'Benzersiz_Kimlik'}, inplace=True)
-             else: raise ValueError("Dosyada 'Benzersiz_Kimlik' sütunu bulunamadı!")
-        
-        df['Benzersiz_Kimlik'] = df['Benzersiz_Kimlik'].apply(normalize_id)
-        df['Başlangıç_Date'] = df['Başlangıç'].apply(parse_turkish_date)
-        df['Bitiş_Date'] = df['Bitiş'].apply(parse_turkish_date)
-        df['Fiili_Başlangıç_Date'] = df['Fiili_Başlangıç'].apply(parse_turkish_date)
-        df['Fiili_Bitiş_Date'] = df['Fiili_Bitiş'].apply(parse_turkish_date)
-        
-        df['Süre_Num'] = df['Süre'].apply(clean_duration)
-        df['Bolluk_Num'] = df['Toplam_Bolluk'].apply(clean_duration)
-        
-        # Kritiklik: Bolluk <= 0 ve Tamamlanmamış
-        df['Kritik'] = (df['Bolluk_Num'] <= 0) & (pd.isna(df['Fiili_Bitiş_Date']))
-        df['Durum'] = df.apply(lambda x: 'Kritik' if x['Kritik'] else ('Tamamlandı' if pd.notna(x['Fiili_Bitiş_Date']) else 'Normal'), axis=1)
-        return df
+        # Dosya seçilirken çekirdek hâlâ yükleniyor olabilir; yükleme onun ardından başlar
+        self.when_core_ready(lambda: self.start_load(path, is_base))
+
+    def start_load(self, path, is_base):
+        # Güncel ve baseline yüklemeleri birbirinden bağımsız işlerdir; aynı anda çalışabilirler
+        if self.load_jobs[is_base]: self.load_jobs[is_base].cancel()
+        # Geçmişe yalnızca güncel program yazılır; baseline bir durum güncellemesi değildir, eğilimlere karışmamalı
+        history = None if is_base else self.history
+        job = Job(load_job, path, self.cache, core.process_data, history); self.load_jobs[is_base] = job
+        job.signals.finished.connect(lambda res: self.on_file_loaded(res, path, is_base))
+        job.signals.failed.connect(lambda msg: QMessageBox.critical(self, "Hata", msg))
+        self.start_job(job)
+        # Görünür sekmenin Chromium görünümü dosya ayrıştırılırken kurulur (ikisi paralel ilerler)
+        view = self.view_tabs.get(self.tabs.currentWidget())
+        if view in self.plot_views and (view != "comp" or is_base or self.df_baseline is not None):
+            self.plot_views[view].ensure_view()
+
+    def on_file_loaded(self, result, path, is_base):
+        df, key, project = result
+        if project: self.on_history_changed([project])
+        self.versions["baseline" if is_base else "current"] = key or next(self.version_counter)
+        if is_base:
+            self.df_baseline = df
+            self.btn_base.setStyleSheet("background-color: #27ae60; color: white;")
+        else:
+            self.df_current = self.df_loaded = df; self.loaded_version = self.versions["current"]
+            self.drop_scenario(); self.btn_reset_whatif.hide()
+        self.show_file_label(path, is_base, df)
+        self.set_watched_path(is_base, path)
+        self.refresh_ui()
+
+    def show_file_label(self, path, is_base, df, reload_note=None):
+        mem = core.memory_report(df)
+        size_text = f"{core.format_bytes(mem['total'])}, {mem['rows']} satır"
+        tip = "\n".join(f"{c}: {core.format_bytes(b)}" for c, b in sorted(mem['columns'].items(), key=lambda kv: -kv[1]))
+        text = f"✅ {os.path.basename(path)} ({size_text})"
+        if reload_note: text += f" 🔄 {datetime.now():%H:%M:%S}"; tip = f"{reload_note}\n\n{tip}"
+        label = self.lbl_base if is_base else self.lbl_cur
+        label.setText(text); label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        label.setToolTip(tip)
+
+    # --- DOSYA İZLEME ---
+    # Kaydedilen dosya WATCH_DEBOUNCE_MS sessizlikten sonra yeniden okunur; yalnızca değişen satırlar
+    # ayrıştırılır (core.reload_changed) ve değişikliğin dokunmadığı sekmelerin çizimi korunur.
+    def toggle_watch(self, on):
+        if on:
+            for is_base, path in self.paths.items():
+                if path: self.set_watched_path(is_base, path)
+        else:
+            if self.watcher.files(): self.watcher.removePaths(self.watcher.files())
+            for timer in self.watch_timers.values(): timer.stop()
+            self.row_hashes = {False: None, True: None}
+
+    def set_watched_path(self, is_base, path):
+        old = self.paths[is_base]; self.paths[is_base] = path; self.row_hashes[is_base] = None
+        if old and old != path and old not in self.paths.values(): self.watcher.removePath(old)
+        if not self.btn_watch.isChecked(): return
+        if path not in self.watcher.files(): self.watcher.addPath(path)
+        # Özetler arka planda çıkarılır; hazır olmadan dosya değişirse ilk yeniden yükleme tam olur
+        df = self.df_baseline if is_base else self.df_loaded
+        job = Job(watch_job, path, df)
+        job.signals.finished.connect(lambda hashes: self.on_watch_ready(is_base, path, df, hashes))
+        self.start_job(job)
+
+    def on_watch_ready(self, is_base, path, df, hashes):
+        if self.paths[is_base] != path or df is not (self.df_baseline if is_base else self.df_loaded): return
+        self.row_hashes[is_base] = hashes
+        # Dosya yüklendikten sonra değişmiş: hemen yeniden yükle
+        if hashes is None: self.watch_timers[is_base].start()
+
+    def on_watched_file_changed(self, path):
+        # Bazı programlar kaydederken dosyayı silip yeniden yazar; izleyici yolu düşürür, yeniden eklenir
+        if os.path.exists(path) and path not in self.watcher.files(): self.watcher.addPath(path)
+        for is_base, p in self.paths.items():
+            if p == path: self.watch_timers[is_base].start()
+
+    def reload_file(self, is_base):
+        path = self.paths[is_base]
+        if not self.btn_watch.isChecked() or not path: return
+        if not os.path.exists(path): self.watch_timers[is_base].start(); return
+        if path not in self.watcher.files(): self.watcher.addPath(path)
+        self.when_core_ready(lambda: self.start_reload(is_base, path))
+
+    def start_reload(self, is_base, path):
+        df = self.df_baseline if is_base else self.df_loaded
+        if df is None: return
+        if self.load_jobs[is_base]: self.load_jobs[is_base].cancel()
+        job = Job(reload_job, path, df, self.row_hashes[is_base], self.cache); self.load_jobs[is_base] = job
+        job.signals.finished.connect(lambda res: self.on_file_reloaded(res, path, is_base))
+        job.signals.failed.connect(lambda msg: self.on_reload_failed(is_base, path, msg))
+        self.start_job(job)
+
+    def on_reload_failed(self, is_base, path, msg):
+        # Dosya hâlâ yazılıyor olabilir (kilitli ya da yarım); birkaç kez ertelenir, sonra vazgeçilir
+        self.watch_retries[is_base] += 1
+        if self.watch_retries[is_base] <= WATCH_RETRIES: self.watch_timers[is_base].start()
+        else:
+            self.watch_retries[is_base] = 0
+            self.statusBar().showMessage(f"⚠ {os.path.basename(path)} yeniden yüklenemedi: {msg}")
+
+    def on_file_reloaded(self, result, path, is_base):
+        df, hashes, delta, key = result
+        if self.paths[is_base] != path: return
+        self.watch_retries[is_base] = 0; self.row_hashes[is_base] = hashes
+        name = "baseline" if is_base else "current"
+        old_version = self.versions[name]; new_version = key or next(self.version_counter)
+        affected = self.affected_views(name, delta)
+        if is_base: self.df_baseline = df
+        else:
+            # Senaryo eski çerçevenin ağı üzerindeydi; yeni içerikle geçersizdir
+            if self.scenario: affected = set(VIEW_DEPS)
+            self.df_current = self.df_loaded = df; self.loaded_version = new_version
+            self.drop_scenario(); self.btn_reset_whatif.hide()
+        self.versions[name] = new_version
+        self.carry_views(name, old_version, new_version, affected)
+        counts = delta["counts"] if delta else None
+        detail = f"{counts['changed']} değişen, {counts['added']} eklenen, {counts['removed']} silinen satır" if counts else "tüm satırlar"
+        titles = ", ".join(VIEW_TITLES[v] for v in VIEW_DEPS if v in affected) or "yok"
+        note = f"Yeniden yüklendi: {detail}\nYenilenen sekmeler: {titles}"
+        self.show_file_label(path, is_base, df, note)
+        self.statusBar().showMessage(f"🔄 {os.path.basename(path)}: {detail}; yenilenen sekmeler: {titles}")
+        job = Job(persist_job, path, df, key, self.cache, None if is_base else self.history)
+        job.signals.finished.connect(lambda project: self.on_history_changed([project]) if project else None)
+        self.start_job(job)
+        self.refresh_ui()
+
+    def affected_views(self, name, delta):
+        # Yeniden yüklenen girdiye bağlı sekmelerden değişikliğin dokunduğu sekmeler
+        views = {v for v, deps in VIEW_DEPS.items() if name in deps}
+        if delta is None: return views
+        if name == "baseline":
+            # Baseline yalnızca kıyas birleşiminde okunur; herhangi bir değişiklik kıyası etkiler
+            touched = any(delta["rows"].values()) or any(delta["columns"].values())
+            return views if touched else set()
+        affected = set()
+        for view in views:
+            scope, columns = VIEW_READS[view]
+            scopes = core.DELTA_SCOPES if scope == "all" else (scope,)
+            if any(delta["rows"][s] or columns & delta["columns"][s] for s in scopes): affected.add(view)
+        return affected
+
+    def carry_views(self, name, old_version, new_version, affected):
+        # Etkilenmeyen sekmelerin çizimi (ve önbellek kaydı) yeni girdi sürümüne taşınır, yeniden üretilmez
+        if old_version == new_version: return
+        for view, deps in VIEW_DEPS.items():
+            if name not in deps or view in affected: continue
+            old_sig = tuple(old_version if d == name else self.versions[d] for d in deps)
+            new_sig = self.view_signature(view)
+            if old_sig in self.memo[view]: self.memo[view][new_sig] = self.memo[view][old_sig]
+            if self.shown.get(view) == old_sig: self.shown[view] = new_sig
+
+    def import_history(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "Geçmişe Eklenecek Güncellemeler", "", "Proje Dosyaları (*.xlsx *.csv *.xml)")
+        if paths: self.when_core_ready(lambda: self.start_history_import(paths))
+
+    def start_history_import(self, paths):
+        if self.history is None: QMessageBox.warning(self, "Geçmiş", "Geçmiş veritabanı açılamadı."); return
+        job = Job(history_job, paths, self.cache, self.history)
+        job.signals.finished.connect(self.on_history_imported)
+        job.signals.failed.connect(lambda msg: QMessageBox.critical(self, "Hata", msg))
+        self.start_job(job)
+
+    def on_history_imported(self, result):
+        added, failed = result
+        self.statusBar().showMessage(f"Geçmişe {len(added)} güncelleme eklendi")
+        if failed: QMessageBox.warning(self, "Geçmiş", "Eklenemeyen dosyalar:\n" + "\n".join(failed))
+        self.on_history_changed(added)
+
+    def on_history_changed(self, projects):
+        self.history_version += 1
+        if projects: self.last_project = projects[-1]
+        self.refresh_trends()
+
+    def refresh_trends(self):
+        # Eğilimler df_current'a bağlı değildir: dosya yüklenmeden de geçmişten çizilir
+        view = self.trends_view
+        if self.history is None or self.tabs.currentWidget() is not view: return
+        if self.trends_projects != self.history_version:
+            view.set_projects(self.history.projects(), self.last_project); self.trends_projects = self.history_version
+        project, last_n, uid = view.query()
+        if not project: return
+        sig = (self.history_version, project, last_n, uid)
+        if self.trends_shown == sig: return
+        running = self.trends_job
+        if running and not running.cancelled and running.signature == sig: return
+        if running: running.cancel()
+        job = Job(trend_job, self.history, project, last_n, uid); job.signature = sig; self.trends_job = job
+        job.signals.finished.connect(lambda res: self.on_trends_rendered(sig, res))
+        job.signals.done.connect(lambda j=job: self.forget_trends_job(j))
+        job.signals.failed.connect(lambda msg: QMessageBox.critical(self, "Arayüz Hatası", f"Hata: {msg}"))
+        self.start_job(job)
+
+    def on_trends_rendered(self, sig, payload):
+        self.trends_view.plot.show_payload(payload); self.trends_shown = sig
+
+    def forget_trends_job(self, job):
+        # Biten, hata veren ya da iptal edilen iş bırakılır; aynı sorgu sonra yeniden başlatılabilsin
+        if self.trends_job is job: self.trends_job = None
+
+    def run_whatif(self):
+        if self.df_loaded is None or self.whatif_job: return
+        uid, ok = QInputDialog.getText(self, "Senaryo", "Görevin Benzersiz Kimliği:")
+        if not ok or not uid.strip(): return
+        # Kimlik sözlüğü yüklemede kurulan arama indeksinden gelir; ağ henüz kurulmamış olabilir
+        row = core.get_search_index(self.df_loaded).id_rows.get(core.normalize_id(uid.strip()))
+        if row is None: QMessageBox.warning(self, "Senaryo", f"'{uid.strip()}' kimlikli görev bulunamadı."); return
+        task = self.df_loaded.iloc[row]
+        if task['Özet'] == 'Evet':
+            QMessageBox.warning(self, "Senaryo", f"'{task['Ad']}' bir özet satırıdır; süresi alt görevlerinden hesaplanır."); return
+        key = str(task['Benzersiz_Kimlik'])
+        duration = task['Süre_Num']
+        current = self.scenario.get(key, float(duration) if duration == duration else 0.0)
+        days, ok = QInputDialog.getDouble(self, "Senaryo", f"{task['Ad']}\nYeni süre (gün):", current, 0, 100000, 1)
+        if ok: self.start_whatif({**self.scenario, key: days})
+
+    def reset_whatif(self):
+        if self.whatif_job: return
+        if self.network is None: self.scenario = {}; self.apply_scenario(None, ""); return
+        self.start_whatif({})
+
+    def start_whatif(self, scenario):
+        # Ağ kurulumu, hesap ve çerçeveye uygulama arka planda yapılır; iş süresince ağ ona aittir.
+        # İptal ya da hata olursa ağ yarıda kalmış olabilir: bırakılır, sonraki adım onu baştan kurar.
+        df = self.df_loaded
+        id_rows = core.get_search_index(df).id_rows
+        changes = {id_rows[uid]: days for uid, days in scenario.items()}
+        job = Job(whatif_job, self.network, df, changes); self.whatif_job = job; self.network = None
+        for w in (self.btn_whatif, self.btn_reset_whatif): w.setEnabled(False)
+        job.signals.finished.connect(lambda res: self.on_whatif_done(df, scenario, res))
+        job.signals.failed.connect(lambda msg: QMessageBox.critical(self, "Senaryo", f"Hata: {msg}"))
+        job.signals.done.connect(lambda j=job: self.on_whatif_finished(j))
+        self.start_job(job)
+
+    def on_whatif_done(self, df, scenario, result):
+        network, frame, affected, elapsed = result
+        if df is not self.df_loaded: return
+        self.network = network; self.scenario = scenario
+        agreement = f"Motor bolluğu dışa aktarımla görevlerin %{network.slack_agreement * 100:.0f}'inde uyumlu; bolluğa fark uygulanır"
+        self.apply_scenario(frame, f"Son hesap: {affected} görev, {elapsed:.0f} ms\n{agreement}")
+
+    def on_whatif_finished(self, job):
+        if self.whatif_job is not job: return
+        self.whatif_job = None
+        for w in (self.btn_whatif, self.btn_reset_whatif): w.setEnabled(True)
+
+    def drop_scenario(self):
+        # Yeni dosya: ağ ve senaryo bırakılır, süren senaryo işi iptal edilir
+        if self.whatif_job: self.whatif_job.cancel(); self.whatif_job = None
+        self.network = None; self.scenario = {}
+        for w in (self.btn_whatif, self.btn_reset_whatif): w.setEnabled(True)
+
+    def apply_scenario(self, frame, info):
+        # Her senaryo adımı yeni bir 'current' sürümüdür; ona bağlı sekmeler yeniden çizilir
+        if self.scenario:
+            self.df_current = frame
+            self.versions["current"] = (self.loaded_version, next(self.version_counter))
+        else:
+            self.df_current = self.df_loaded; self.versions["current"] = self.loaded_version
+        self.btn_reset_whatif.setVisible(bool(self.scenario))
+        changes = "\n".join(f"{uid}: {days:g} gün" for uid, days in self.scenario.items())
+        self.btn_reset_whatif.setToolTip(f"{changes}\n{info}".strip())
+        self.refresh_ui()
+
+    def start_job(self, job):
+        self.jobs.add(job)
+        job.signals.progress.connect(self.on_job_progress)
+        job.signals.done.connect(lambda j=job: self.on_job_done(j))
+        self.progress.setValue(0); self.progress.show(); self.btn_cancel.show()
+        self.pool.start(job)
+
+    def on_job_progress(self, percent, message):
+        self.progress.setValue(percent); self.lbl_status.setText(message)
+
+    def on_job_done(self, job):
+        self.jobs.discard(job)
+        if not self.jobs:
+            for w in (self.progress, self.btn_cancel): w.hide()
+            self.lbl_status.setText("")
+
+    def cancel_jobs(self):
+        for job in list(self.jobs): job.cancel()
+        # İptal edilen çizimler unutulur; sekme yeniden açıldığında ya da yenilendiğinde baştan çizilir
+        self.view_jobs.clear(); self.trends_job = None
+        self.lbl_status.setText("İptal edildi")
+
+    def closeEvent(self, event):
+        for job in list(self.jobs) + [self.warmup]: job.cancel()
+        self.pool.waitForDone(3000)
+        if self.history is not None: self.history.close()
+        super().closeEvent(event)
 
     def refresh_ui(self):
+        # Yalnızca görünür sekme çizilir; diğerleri açıldıklarında (currentChanged) sırası gelir
+        if self.df_current is None: return
+        with stage("refresh_ui"):
+            self.versions["today"] = date.today().isoformat()
+            view = self.view_tabs.get(self.tabs.currentWidget())
+            if view: self.render_view(view)
+        if self.profile_pending:
+            self.profile_pending = False; self.profile_refresh()
+
+    def view_signature(self, view):
+        return tuple(self.versions[dep] for dep in VIEW_DEPS[view])
+
+    def render_view(self, view):
+        sig = self.view_signature(view)
+        if self.shown.get(view) == sig: return
+        if sig in self.memo[view]: self.apply_view(view, sig, self.memo[view][sig]); return
+
+        running = self.view_jobs.get(view)
+        if running and not running.cancelled and running.signature == sig: return
+        # Aynı sekmenin eski girdilerle süren çizimi artık geçersizdir
+        if running: running.cancel()
+        job = Job(render_job, view, self.df_current, self.df_baseline); job.signature = sig
+        self.view_jobs[view] = job
+        job.signals.finished.connect(lambda res: self.on_view_rendered(view, sig, res))
+        job.signals.failed.connect(lambda msg: QMessageBox.critical(self, "Arayüz Hatası", f"Hata: {msg}"))
+        job.signals.done.connect(lambda j=job: self.forget_view_job(view, j))
+        self.start_job(job)
+
+    def forget_view_job(self, view, job):
+        if self.view_jobs.get(view) is job: del self.view_jobs[view]
+
+    def on_view_rendered(self, view, sig, result):
+        memo = self.memo[view]; memo[sig] = result
+        while len(memo) > MEMO_PER_VIEW: memo.pop(next(iter(memo)))
+        self.apply_view(view, sig, result)
+
+    def apply_view(self, view, sig, result):
         try:
-            if self.df_current is None: return
-            self.update_dashboard(self.df_current)
-            self.update_gantt(self.df_current)
-            self.update_timeline(self.df_current)
-            self.generate_insights(self.df_current, self.df_baseline)
-            if self.df_baseline is not None: self.update_comparison(self.df_current, self.df_baseline)
+            with stage(f"{VIEW_TITLES[view]}: ekrana basma"):
+                if view in ("time", "comp"): self.plot_views[view].focus = self.focus_values(view)
+                if view == "dash": self.update_dashboard(*result)
+                elif view == "comp": self.update_comparison(result)
+                elif view == "gantt": self.update_gantt(result)
+                elif view == "time": self.update_timeline(result)
+                elif view == "notes": self.update_insights(result)
+                if view in self.focus_pending:
+                    # Seçimden sonraki ilk çizim: sayfa aranan satıra kaydırılır
+                    self.focus_pending.discard(view); self.plot_views[view].set_focus(self.plot_views[view].focus)
+            self.shown[view] = sig
         except Exception as e:
             QMessageBox.critical(self, "Arayüz Hatası", f"Hata: {str(e)}")
 
-    def update_dashboard(self, df):
+    def update_dashboard(self, kpis, payload):
         while self.kpi_layout.count():
             item = self.kpi_layout.takeAt(0)
             if item.widget(): item.widget().deleteLater()
-        
-        today = pd.Timestamp.now(); start = df['Başlangıç_Date'].min(); finish = df['Bitiş_Date'].max()
-        total = (finish-start).days; elapsed = max(0, (today-start).days)
-        summ = df[df['Benzersiz_Kimlik']=="1"]
-        prog = summ.iloc[0]['Tamamlanma_Yüzdesi']*100 if not summ.empty else df['Tamamlanma_Yüzdesi'].mean()*100
-        
-        self.kpi_layout.addWidget(KPICard("Toplam Süre", f"{total} GÜN"))
-        self.kpi_layout.addWidget(KPICard("Geçen Süre", f"{elapsed} GÜN", "#FF9800"))
-        self.kpi_layout.addWidget(KPICard("İlerleme", f"%{prog:.1f}", "#9C27B0"))
+        for title, value, color in kpis: self.kpi_layout.addWidget(KPICard(title, value, color))
         self.kpi_layout.addStretch()
+        self.web_dash.show_payload(payload)
 
-        fig = make_subplots(
-            rows=2, cols=2, 
-            specs=[[{"type":"indicator"}, {"type":"table", "rowspan":2}], [{"type":"domain"}, None]], 
-            column_widths=[0.4, 0.6],
-            subplot_titles=("", "Önümüzdeki 1 Hafta içerisinde başlaması ve/veya bitmesi planlanan kritik aktiviteler")
-        )
-
-        t_prog = min(100, (elapsed/total)*100) if total>0 else 0
-        fig.add_trace(go.Indicator(mode="gauge+number+delta", value=prog, delta={'reference': t_prog}, gauge={'axis':{'range':[None,100]}, 'bar':{'color':"#0078D7"}, 'threshold':{'line':{'color':'red','width':4}, 'value':t_prog}}), row=1, col=1)
-        
-        target_date = today + timedelta(days=7)
-        has_summary_col = 'Özet' in df.columns
-        
-        mask_start = (pd.isna(df['Fiili_Başlangıç_Date'])) & (df['Başlangıç_Date'] <= target_date) & (df['Bolluk_Num'] <= 30)
-        if has_summary_col: mask_start = mask_start & (df['Özet'] == 'Hayır')
-        start_crit = df[mask_start].sort_values('Başlangıç_Date').head(10)
-
-        mask_finish = (pd.isna(df['Fiili_Bitiş_Date'])) & (df['Bitiş_Date'] <= target_date) & (df['Bolluk_Num'] <= 30)
-        if has_summary_col: mask_finish = mask_finish & (df['Özet'] == 'Hayır')
-        finish_crit = df[mask_finish].sort_values('Bitiş_Date').head(10)
-
-        start_crit['Kategori'] = "🟢 BAŞLAMASI PLANLANAN"
-        start_crit['Tarih_Gosterim'] = start_crit['Başlangıç_Date']
-        
-        finish_crit['Kategori'] = "🔴 BİTMESİ PLANLANAN"
-        finish_crit['Tarih_Gosterim'] = finish_crit['Bitiş_Date']
-
-        comb = pd.concat([start_crit, finish_crit])
-
-        if not comb.empty:
-            tarihler = comb['Tarih_Gosterim'].apply(format_date_tr)
-            fig.add_trace(go.Table(
-                header=dict(values=["Aktivite ID", "Risk Türü", "Aktivite Adı", "Kritik Tarih", "Bolluk"], 
-                            fill_color='#2c3e50', font=dict(color='white')), 
-                cells=dict(values=[comb['Benzersiz_Kimlik'], comb['Kategori'], comb['Ad'].str.slice(0,40), tarihler, comb['Bolluk_Num']], 
-                           fill_color='#ecf0f1', font=dict(color='black'))
-            ), row=1, col=2)
-        else:
-            fig.add_trace(go.Table(header=dict(values=["Bilgi"]), cells=dict(values=[["Önümüzdeki hafta için kritik risk bulunamadı."]])), row=1, col=2)
-        
-        cnt = df['Durum'].value_counts()
-        fig.add_trace(go.Pie(labels=cnt.index, values=cnt.values, hole=.5, marker_colors=['#e74c3c', '#3498db', '#2ecc71']), row=2, col=1)
-        fig.update_layout(margin=dict(l=10, r=10, t=30, b=10), font={'family':"Segoe UI"})
-        self.web_dash.setHtml(fig.to_html(include_plotlyjs='cdn'))
-
-    def update_comparison(self, df_c, df_b):
-        merged = pd.merge(df_c, df_b, on="Benzersiz_Kimlik", how="inner", suffixes=('_cur', '_base'))
-        today = pd.Timestamp.now()
-
-        if 'Özet_cur' in merged.columns:
-            merged = merged[merged['Özet_cur'] == 'Hayır']
-
-        active_pool = merged[pd.isna(merged['Fiili_Bitiş_Date_cur'])]
-
-        start_delayed = active_pool[(active_pool['Başlangıç_Date_base'] < today) & (pd.isna(active_pool['Fiili_Başlangıç_Date_cur'])) & (active_pool['Başlangıç_Date_cur'] > active_pool['Başlangıç_Date_base']) & (active_pool['Bolluk_Num_cur'] <= 30)]
-        finish_delayed = active_pool[(active_pool['Bitiş_Date_base'] < today) & (active_pool['Bitiş_Date_cur'] > active_pool['Bitiş_Date_base']) & (active_pool['Bolluk_Num_cur'] <= 30)]
-
-        active_pool_copy = active_pool.copy()
-        active_pool_copy['Süre_Fark'] = active_pool_copy['Süre_Num_base'] - active_pool_copy['Süre_Num_cur']
-        compressed = active_pool_copy[(active_pool_copy['Süre_Fark'] > 0) & (active_pool_copy['Bolluk_Num_cur'] <= 30)]
-
-        active_pool_copy['Bolluk_Fark'] = active_pool_copy['Bolluk_Num_base'] - active_pool_copy['Bolluk_Num_cur']
-        worsening = active_pool_copy[(active_pool_copy['Bolluk_Fark'] > 0) & (active_pool_copy['Bolluk_Num_cur'] <= 30)]
-
-        fig = make_subplots(rows=2, cols=2, 
-            subplot_titles=("Başlaması Gecikenler (Bolluk<=30)", "Bitmesi Gecikenler (Bolluk<=30)", 
-                            "Süresi Kısılanlar (Bolluk<=30)", "Kritikliği Artanlar (Bolluk<=30)"), 
-            specs=[[{"type": "table"}, {"type": "table"}], [{"type": "table"}, {"type": "table"}]])
-
-        def add_comp_table(data, col1, header1, col2, header2, row, col):
-            if data.empty:
-                fig.add_trace(go.Table(header=dict(values=["Durum"], fill_color='#34495e', font=dict(color='white')), cells=dict(values=[["Kriterlere uygun veri yok"]], fill_color='#ecf0f1', font=dict(color='black'))), row=row, col=col)
-            else:
-                top = data.head(10)
-                v1 = top[col1].apply(format_date_tr) if 'Date' in col1 else top[col1]
-                v2 = top[col2].apply(format_date_tr) if 'Date' in col2 else top[col2]
-                fig.add_trace(go.Table(
-                    header=dict(values=["Aktivite ID", "Aktivite", header1, header2, "Bolluk"], fill_color='#34495e', font=dict(color='white')),
-                    cells=dict(values=[top['Benzersiz_Kimlik'], top['Ad_cur'].str.slice(0, 30), v1, v2, top['Bolluk_Num_cur']], fill_color='#ecf0f1', font=dict(color='black'))
-                ), row=row, col=col)
-
-        add_comp_table(start_delayed, 'Başlangıç_Date_base', 'Base Başlangıç', 'Başlangıç_Date_cur', 'Güncel Başlangıç', 1, 1)
-        add_comp_table(finish_delayed, 'Bitiş_Date_base', 'Base Bitiş', 'Bitiş_Date_cur', 'Güncel Bitiş', 1, 2)
-        add_comp_table(compressed, 'Süre_Num_base', 'Base Süre', 'Süre_Num_cur', 'Güncel Süre', 2, 1)
-        add_comp_table(worsening, 'Bolluk_Num_base', 'Base Bolluk', 'Bolluk_Num_cur', 'Güncel Bolluk', 2, 2)
-
-        fig.update_layout(height=800, margin=dict(l=10, r=10, t=50, b=10), font={'family': "Segoe UI"})
-        self.web_comp.setHtml(fig.to_html(include_plotlyjs='cdn'))
-
-    def update_gantt(self, df):
-        # 1. FILTRELEME
-        # Kriterler:
-        # - Özet = Evet (Sadece Özet Aktiviteler)
-        # - Bolluk_Num <= 30
-        # - Benzersiz_Kimlik != '1' (En üst proje başlığını hariç tut)
-        # - Fiili_Bitiş_Date BOŞ (Yani Tamamlanmamış olanlar)
-        
-        if 'Özet' not in df.columns:
-            self.web_gantt.setHtml("<h3>Veri hatası: 'Özet' sütunu bulunamadı.</h3>")
-            return
-            
-        mask = (df['Özet'] == 'Evet') & \
-               (df['Bolluk_Num'] <= 30) & \
-               (df['Benzersiz_Kimlik'] != '1') & \
-               (pd.isna(df['Fiili_Bitiş_Date']))
-               
-        data = df[mask].copy()
-        
-        if data.empty:
-            self.web_gantt.setHtml("<h3>Kriterlere uygun (Tamamlanmamış, Özet, Kritik) aktivite bulunamadı.</h3><p>Filtre: Özet='Evet', Bolluk<=30, ID!=1, Fiili Bitiş=Yok</p>")
-            return
-
-        # Sıralama (Gantt için yukarıdan aşağıya doğru tarih sırası)
-        data = data.sort_values('Başlangıç_Date', ascending=False)
-        
-        # Süre hesaplamaları
-        data['Delta'] = data['Bitiş_Date'] - data['Başlangıç_Date']
-        data['Tamamlanma_Yüzdesi'] = data['Tamamlanma_Yüzdesi'].fillna(0)
-        
-        # Tamamlanan kısmın bitiş tarihi
-        data['Progress_End'] = data['Başlangıç_Date'] + (data['Delta'] * data['Tamamlanma_Yüzdesi'])
-        
-        # Grafik
-        fig = go.Figure()
-
-        # A) PLAN ÇUBUĞU (Arka Plan - Açık Gri - Gövde)
-        fig.add_trace(go.Bar(
-            y=data['Ad'],
-            x=data['Delta'].dt.total_seconds() * 1000,
-            base=data['Başlangıç_Date'],
-            orientation='h',
-            marker=dict(color='#bdc3c7'),
-            name='Plan',
-            hoverinfo='all',
-            showlegend=False
-        ))
-        
-        # OK ŞEKLİ İÇİN ÜÇGEN BAŞLIK (Gri)
-        fig.add_trace(go.Scatter(
-            y=data['Ad'],
-            x=data['Bitiş_Date'],
-            mode='markers',
-            marker=dict(symbol='triangle-right', size=15, color='#bdc3c7'),
-            showlegend=False,
-            hoverinfo='skip'
-        ))
-
-        # B) İLERLEME ÇUBUĞU (Ön Plan - Koyu Renk)
-        progress_duration = (data['Progress_End'] - data['Başlangıç_Date']).dt.total_seconds() * 1000
-        fig.add_trace(go.Bar(
-            y=data['Ad'],
-            x=progress_duration,
-            base=data['Başlangıç_Date'],
-            orientation='h',
-            marker=dict(color='#2c3e50'),
-            text=(data['Tamamlanma_Yüzdesi'] * 100).astype(int).astype(str) + '%',
-            textposition='inside',
-            insidetextanchor='middle',
-            textfont=dict(color='white', weight='bold'),
-            name='İlerleme',
-            showlegend=False
-        ))
-
-        # C) TARİH ETİKETLERİ
-        # Başlangıç Tarihi (Sol Tarafta)
-        fig.add_trace(go.Scatter(
-            y=data['Ad'],
-            x=data['Başlangıç_Date'],
-            mode='text',
-            text=data['Başlangıç_Date'].apply(format_date_short),
-            textposition='middle left', 
-            textfont=dict(color='#7f8c8d', size=11),
-            showlegend=False
-        ))
-        
-        # Bitiş Tarihi (Sağ Tarafta)
-        fig.add_trace(go.Scatter(
-            y=data['Ad'],
-            x=data['Bitiş_Date'],
-            mode='text',
-            text=data['Bitiş_Date'].apply(format_date_short),
-            textposition='middle right', 
-            textfont=dict(color='#7f8c8d', size=11),
-            showlegend=False
-        ))
-
-        # D) LAYOUT AYARLARI
-        today = pd.Timestamp.now()
-        
-        # OTOMATİK ÖLÇEKLENDİRME İÇİN RANGE HESABI
-        start_min = data['Başlangıç_Date'].min()
-        end_max = data['Bitiş_Date'].max()
-        
-        # Biraz boşluk bırakalım (Padding)
-        total_span = end_max - start_min
-        buffer = total_span * 0.05
-        if buffer.days < 5: buffer = timedelta(days=5)
-        
-        xaxis_range = [start_min - buffer, end_max + buffer]
-
-        fig.update_layout(
-            barmode='overlay',
-            height=max(600, len(data)*40),
-            xaxis=dict(
-                side='top',
-                tickformat="%Y-Q%q", # Yıl-Çeyrek formatı
-                # dtick="M3" -> KALDIRILDI (Otomatik ölçek için)
-                range=xaxis_range, # Veriye göre dinamik aralık
-                gridcolor='#ecf0f1',
-                title=""
-            ),
-            yaxis=dict(
-                showgrid=False
-            ),
-            plot_bgcolor='white',
-            margin=dict(l=10, r=10, t=50, b=10),
-            font=dict(family="Segoe UI"),
-            shapes=[
-                dict(
-                    type="line",
-                    x0=today, x1=today,
-                    y0=0, y1=1,
-                    xref="x", yref="paper",
-                    line=dict(color="#e74c3c", width=2, dash="dot")
-                )
-            ],
-            annotations=[
-                dict(
-                    x=today, y=0,
-                    xref="x", yref="paper",
-                    text="BUGÜN",
-                    showarrow=False,
-                    yshift=10,
-                    font=dict(color="#e74c3c", size=10, weight="bold")
-                )
-            ]
-        )
-        self.web_gantt.setHtml(fig.to_html(include_plotlyjs='cdn'))
-
-    def update_timeline(self, df):
-        data = df[(df['Özet']=='Evet') & (df['Kritik']==True)]
-        if data.empty: self.web_time.setHtml("<h3>Veri Yok</h3>"); return
-        fig = px.scatter(data, x="Bitiş_Date", y="Ad", size="Süre_Num", color="Tamamlanma_Yüzdesi")
-        fig.update_yaxes(autorange="reversed")
-        for i,r in data.iterrows(): fig.add_shape(type="line", x0=r['Başlangıç_Date'], x1=r['Bitiş_Date'], y0=r['Ad'], y1=r['Ad'], line=dict(color='gray'))
-        self.web_time.setHtml(fig.to_html(include_plotlyjs='cdn'))
-
-    def generate_insights(self, df_curr, df_base=None):
-        html = """
-        <html><head><style>
-            body { font-family: 'Segoe UI', sans-serif; background-color: white; color: #2c3e50; padding: 20px; }
-            h2 { color: #0078D7; border-bottom: 2px solid #eee; padding-bottom: 10px; margin-bottom: 20px;}
-            h3 { color: #c0392b; margin-top: 30px; font-size: 18px; display: flex; align-items: center;}
-            .category { background: #ecf0f1; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 5px solid #bdc3c7; }
-            .cat-critical { border-left-color: #e74c3c; background: #fdedec; }
-            .cat-delay { border-left-color: #f39c12; background: #fef9e7; }
-            .cat-compare { border-left-color: #3498db; background: #ebf5fb; }
-            p { margin: 0 0 10px 0; line-height: 1.6; }
-            b { color: #2c3e50; }
-        </style></head><body>
-        """
-        html += "<h2>🤖 Proje Analiz Raporu</h2>"
-        
-        tasks_curr = df_curr[df_curr['Özet'] == 'Hayır'] if 'Özet' in df_curr.columns else df_curr
-
-        crit_active = tasks_curr[tasks_curr['Kritik'] == True]
-        html += "<div class='category cat-critical'>"
-        html += "<h3>🔥 Kritik Hat Analizi</h3>"
-        if crit_active.empty:
-            html += "<p>Projede şu an kritik hat üzerinde aktif (tamamlanmamış) bir aktivite bulunmamaktadır.</p>"
-        else:
-            count = len(crit_active)
-            html += f"<p>Proje genelinde bitiş tarihini doğrudan etkileyen <b>{count} adet</b> aktif kritik aktivite bulunmaktadır.</p>"
-            for _, row in crit_active.sort_values('Başlangıç_Date').head(3).iterrows():
-                tarih = format_date_tr(row['Bitiş_Date'])
-                html += f"<p>➡ <b>{row['Ad']}</b> aktivitesi şu an kritik yoldadır ve {tarih} tarihinde bitmesi planlanmaktadır.</p>"
-        html += "</div>"
-
-        today = pd.Timestamp.now()
-        delayed = tasks_curr[(tasks_curr['Bitiş_Date'] < today) & (pd.isna(tasks_curr['Fiili_Bitiş_Date']))]
-        
-        if not delayed.empty:
-            html += "<div class='category cat-delay'>"
-            html += "<h3>🚫 Mevcut Gecikmeler</h3>"
-            html += f"<p>Planlanan bitiş tarihi geçmiş olmasına rağmen henüz tamamlanmamış <b>{len(delayed)}</b> aktivite tespit edilmiştir.</p>"
-            for _, row in delayed.head(3).iterrows():
-                delay = (today - row['Bitiş_Date']).days
-                html += f"<p>➡ <b>{row['Ad']}</b> aktivitesinin {delay} gün önce bitmesi gerekiyordu.</p>"
-            html += "</div>"
-
-        if df_base is not None:
-            html += "<div class='category cat-compare'>"
-            html += "<h3>⚖️ Baseline Karşılaştırma Analizi</h3>"
-            
-            merged = pd.merge(df_curr, df_base, on="Benzersiz_Kimlik", how="inner", suffixes=('_cur', '_base'))
-            if 'Özet_cur' in merged.columns: merged = merged[merged['Özet_cur'] == 'Hayır']
-
-            merged['Start_Delay'] = (merged['Başlangıç_Date_cur'] - merged['Başlangıç_Date_base']).dt.days
-            merged['Süre_Fark'] = merged['Süre_Num_base'] - merged['Süre_Num_cur']
-            
-            active_pool = merged[pd.isna(merged['Fiili_Bitiş_Date_cur'])]
-
-            newly_critical = active_pool[(active_pool['Bolluk_Num_base'] > 0) & (active_pool['Bolluk_Num_cur'] <= 0)]
-            if not newly_critical.empty:
-                for _, row in newly_critical.head(3).iterrows():
-                    html += f"<p>⚠️ <b>{row['Ad_cur']}</b> aktivitesi önceki planda kritik değilken, şu an kritik yola girmiştir.</p>"
-            
-            compressed = active_pool[active_pool['Süre_Fark'] > 0]
-            if not compressed.empty:
-                for _, row in compressed.head(3).iterrows():
-                    html += f"<p>⚡ <b>{row['Ad_cur']}</b> aktivitesinin süresi <b>{int(row['Süre_Fark'])} gün</b> kısaltılmıştır.</p>"
-
-            start_delayed = active_pool[(active_pool['Başlangıç_Date_base'] < today) & (pd.isna(active_pool['Fiili_Başlangıç_Date_cur'])) & (active_pool['Başlangıç_Date_cur'] > active_pool['Başlangıç_Date_base'])]
-            if not start_delayed.empty:
-                row = start_delayed.iloc[0]
-                t1 = format_date_tr(row['Başlangıç_Date_base'])
-                t2 = format_date_tr(row['Başlangıç_Date_cur'])
-                html += f"<p>📉 <b>{row['Ad_cur']}</b> aktivitesinin başlaması gerekiyordu ({t1}) ancak güncel planda {t2} tarihine ötelenmiştir.</p>"
-
-            html += "</div>"
-        html += "</body></html>"
-        self.txt_notes.setHtml(html)
+    def update_comparison(self, payload): self.web_comp.show_payload(payload)
+    def update_gantt(self, result): self.gantt_view.set_content(result)
+    def update_timeline(self, payload): self.web_time.show_payload(payload)
+    def update_insights(self, html): self.txt_notes.setHtml(html)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = ProjectApp()
     window.show()
+    QTimer.singleShot(0, window.on_first_show)
     sys.exit(app.exec())
@@ -0,0 +1,239 @@
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import threading
+from datetime import date, datetime
+import pandas as pd
+
+from mspdi_reader import read_project_header
+from schedule_cache import default_cache_dir, file_digest
+from project_core import NEAR_CRITICAL_SLACK, epoch_days, float_list
+
+# --- PROGRAM GEÇMİŞİ (ÇOKLU SNAPSHOT) ---
+# Her işlenmiş program bir kez, durum tarihiyle birlikte yerel SQLite veritabanına yazılır; haftalık
+# güncellemeler arası eğilimler (bitiş kayması, bolluk erimesi, ilerleme eğrisi) Excel'i yeniden
+# ayrıştırmadan indeksli sorgularla okunur.
+#   snapshots : proje + durum tarihi başına bir satır ve proje düzeyi özetler (eğilim grafikleri buradan)
+#   activities: (snapshot, Benzersiz_Kimlik) birincil anahtarlı; (uid, snapshot) indeksi tek aktivitenin
+#               geçmişini, kısmi "kayanlar" indeksi son N güncellemede kayan aktiviteleri doğrudan bulur.
+# Önceki güncellemeye göre bitiş kayması ve bolluk değişimi kayıt sırasında hesaplanıp saklanır;
+# araya eski tarihli bir snapshot eklenirse ondan sonraki snapshot'ın farkları yeniden hesaplanır.
+# Tarihler 1970'ten beri gün sayısı (INTEGER) olarak tutulur.
+#   python history_store.py haftalik/*.xlsx --project "Sobalar"     (toplu geçmiş yükleme)
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    status_date INTEGER NOT NULL,
+    source TEXT,
+    digest TEXT,
+    ingested_at TEXT NOT NULL,
+    activities INTEGER NOT NULL,
+    finish INTEGER,
+    progress REAL,
+    critical INTEGER,
+    near_critical INTEGER,
+    negative_slack INTEGER,
+    mean_slack REAL,
+    UNIQUE (project, digest)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS snapshots_by_date ON snapshots (project, status_date);
+CREATE TABLE IF NOT EXISTS activities (
+    snapshot_id INTEGER NOT NULL,
+    uid TEXT NOT NULL,
+    name TEXT,
+    summary INTEGER NOT NULL,
+    start INTEGER,
+    finish INTEGER,
+    actual_finish INTEGER,
+    duration REAL,
+    slack REAL,
+    progress REAL,
+    finish_slip INTEGER,
+    slack_change REAL,
+    PRIMARY KEY (snapshot_id, uid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS activities_by_uid ON activities (uid, snapshot_id);
+CREATE INDEX IF NOT EXISTS activities_slipped ON activities (snapshot_id, finish_slip) WHERE finish_slip > 0;
+"""
+DATE_IN_NAME = [
+    (re.compile(r'(\d{4})[-_.](\d{1,2})[-_.](\d{1,2})'), (1, 2, 3)),  # 2025-11-03
+    (re.compile(r'(\d{1,2})[-_.](\d{1,2})[-_.](\d{4})'), (3, 2, 1)),  # 03.11.2025
+]
+EPOCH = date(1970, 1, 1)
+
+def default_history_path():
+    return os.path.join(os.path.dirname(default_cache_dir()), "history.sqlite")
+
+def _dates(values):
+    return pd.to_datetime(pd.Series(values, dtype='float64'), unit='D')
+
+def status_date_of(path):
+    # Durum tarihi: MS Project XML başlığındaki StatusDate, yoksa dosya adındaki tarih, yoksa dosya tarihi
+    if path.lower().endswith('.xml'):
+        try:
+            text = read_project_header(path).get('StatusDate')
+            if text: return datetime.fromisoformat(text[:10]).date()
+        except (OSError, ValueError, SyntaxError): pass
+    name = os.path.basename(path)
+    for pattern, (y, m, d) in DATE_IN_NAME:
+        match = pattern.search(name)
+        if not match: continue
+        try: return date(int(match.group(y)), int(match.group(m)), int(match.group(d)))
+        except ValueError: pass
+    return date.fromtimestamp(os.path.getmtime(path))
+
+def project_name_of(df, path):
+    # Proje özet satırı (Benzersiz_Kimlik "1", özet) adı; yoksa tarihleri atılmış dosya adı
+    top = df[df['Benzersiz_Kimlik'] == "1"]
+    if not top.empty and ('Özet' not in df.columns or top['Özet'].iloc[0] == 'Evet') and str(top['Ad'].iloc[0]).strip():
+        return str(top['Ad'].iloc[0]).strip()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for pattern, _ in DATE_IN_NAME: stem = pattern.sub("", stem)
+    return stem.strip(" _-.") or stem
+
+def summarize_snapshot(df):
+    # snapshots tablosundaki proje düzeyi özetler
+    tasks = df[df['Özet'] == 'Hayır'] if 'Özet' in df.columns else df
+    open_tasks = tasks[tasks['Fiili_Bitiş_Date'].isna()]
+    slack = open_tasks['Bolluk_Num']
+    top = df[df['Benzersiz_Kimlik'] == "1"]
+    progress = top['Tamamlanma_Yüzdesi'].iloc[0] if not top.empty else df['Tamamlanma_Yüzdesi'].mean()
+    finish = df['Bitiş_Date'].max()
+    return {"activities": len(df), "finish": None if pd.isna(finish) else (finish.date() - EPOCH).days,
+            "progress": None if pd.isna(progress) else float(progress), "critical": int(tasks['Kritik'].sum()),
+            "near_critical": int((slack <= NEAR_CRITICAL_SLACK).sum()), "negative_slack": int((slack < 0).sum()),
+            "mean_slack": None if slack.empty else float(slack.mean())}
+
+class HistoryStore:
+    # Tek bağlantı, kilitle korunur: kayıt ve sorgular arka plan işlerinden çağrılabilir
+    def __init__(self, path=None):
+        self.path = path or default_history_path()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL"); self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        with self.lock: self.conn.close()
+
+    # --- KAYIT ---
+    def ingest_file(self, path, df, project=None, status_date=None):
+        # Aynı içerikli dosya ikinci kez yazılmaz; dönüş (snapshot id, proje adı, yeni mi)
+        digest = file_digest(path)
+        project = project or project_name_of(df, path)
+        with self.lock:
+            row = self.conn.execute("SELECT id FROM snapshots WHERE project = ? AND digest = ?", (project, digest)).fetchone()
+        if row: return row[0], project, False
+        return self.ingest(df, project, status_date or status_date_of(path), source=os.path.basename(path), digest=digest), project, True
+
+    def ingest(self, df, project, status_date, source=None, digest=None):
+        # Aynı proje ve durum tarihli eski snapshot (düzeltilmiş güncelleme) yenisiyle değiştirilir
+        day = (status_date - EPOCH).days
+        summary = df['Özet'] == 'Evet' if 'Özet' in df.columns else pd.Series(False, index=df.index)
+        rows = list(zip(df['Benzersiz_Kimlik'].astype(str).tolist(), df['Ad'].astype(str).tolist(), summary.astype(int).tolist(),
+                        epoch_days(df['Başlangıç_Date']), epoch_days(df['Bitiş_Date']), epoch_days(df['Fiili_Bitiş_Date']),
+                        float_list(df['Süre_Num']), float_list(df['Bolluk_Num']), float_list(df['Tamamlanma_Yüzdesi'])))
+        rows.sort(key=lambda r: r[0])  # birincil anahtar sırasıyla eklemek B-ağacında sayfa bölünmesini azaltır
+        info = summarize_snapshot(df)
+        with self.lock, self.conn:
+            old = self.conn.execute("SELECT id FROM snapshots WHERE project = ? AND status_date = ?", (project, day)).fetchone()
+            if old:
+                self.conn.execute("DELETE FROM activities WHERE snapshot_id = ?", old)
+                self.conn.execute("DELETE FROM snapshots WHERE id = ?", old)
+            sid = self.conn.execute(
+                "INSERT INTO snapshots (project, status_date, source, digest, ingested_at, activities, finish, progress, critical,"
+                " near_critical, negative_slack, mean_slack) VALUES (:project, :day, :source, :digest, :now, :activities, :finish,"
+                " :progress, :critical, :near_critical, :negative_slack, :mean_slack)",
+                dict(info, project=project, day=day, source=source, digest=digest, now=datetime.now().isoformat(timespec="seconds"))).lastrowid
+            # Aynı Benzersiz_Kimlik iki kez geçerse son satır geçerlidir
+            self.conn.executemany("INSERT OR REPLACE INTO activities (snapshot_id, uid, name, summary, start, finish, actual_finish,"
+                                  " duration, slack, progress) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", ((sid,) + r for r in rows))
+            self._link(sid)
+            after = self.conn.execute("SELECT id FROM snapshots WHERE project = ? AND status_date > ? ORDER BY status_date LIMIT 1", (project, day)).fetchone()
+            if after: self._link(after[0])
+        return sid
+
+    def _link(self, sid):
+        # Önceki güncellemeye göre bitiş kayması (gün) ve bolluk değişimi
+        prev = self.conn.execute(
+            "SELECT p.id FROM snapshots s JOIN snapshots p ON p.project = s.project AND p.status_date < s.status_date"
+            " WHERE s.id = ? ORDER BY p.status_date DESC LIMIT 1", (sid,)).fetchone()
+        if prev is None:
+            self.conn.execute("UPDATE activities SET finish_slip = NULL, slack_change = NULL WHERE snapshot_id = ?", (sid,)); return
+        self.conn.execute(
+            "UPDATE activities SET"
+            " finish_slip = finish - (SELECT p.finish FROM activities p WHERE p.snapshot_id = :prev AND p.uid = activities.uid),"
+            " slack_change = slack - (SELECT p.slack FROM activities p WHERE p.snapshot_id = :prev AND p.uid = activities.uid)"
+            " WHERE snapshot_id = :sid", {"prev": prev[0], "sid": sid})
+
+    def delete(self, sid):
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT project, status_date FROM snapshots WHERE id = ?", (sid,)).fetchone()
+            if row is None: return
+            after = self.conn.execute("SELECT id FROM snapshots WHERE project = ? AND status_date > ? ORDER BY status_date LIMIT 1", row).fetchone()
+            self.conn.execute("DELETE FROM activities WHERE snapshot_id = ?", (sid,))
+            self.conn.execute("DELETE FROM snapshots WHERE id = ?", (sid,))
+            if after: self._link(after[0])
+
+    # --- SORGULAR ---
+    def _query(self, sql, params=()):
+        with self.lock: return pd.read_sql_query(sql, self.conn, params=params)
+
+    def projects(self):
+        with self.lock: return [r[0] for r in self.conn.execute("SELECT project FROM snapshots GROUP BY project ORDER BY MAX(status_date) DESC")]
+
+    def snapshots(self, project):
+        # Proje düzeyi eğilimler: durum tarihine göre sıralı
+        df = self._query("SELECT id, status_date, source, activities, finish, progress, critical, near_critical, negative_slack, mean_slack"
+                         " FROM snapshots WHERE project = ? ORDER BY status_date", (project,))
+        df['status_date'] = _dates(df['status_date']); df['finish'] = _dates(df['finish'])
+        return df
+
+    def activity_history(self, project, uid):
+        # Tek aktivitenin tüm güncellemelerdeki bitişi, bolluğu ve ilerlemesi (uid indeksi)
+        df = self._query("SELECT s.status_date, a.name, a.start, a.finish, a.actual_finish, a.duration, a.slack, a.progress,"
+                         " a.finish_slip, a.slack_change FROM activities a JOIN snapshots s ON s.id = a.snapshot_id"
+                         " WHERE a.uid = ? AND s.project = ? ORDER BY s.status_date", (str(uid), project))
+        for c in ('status_date', 'start', 'finish', 'actual_finish'): df[c] = _dates(df[c])
+        return df
+
+    def slipped(self, project, last_n=5, min_days=1):
+        # Son N güncellemenin her birinde bitişi önceki güncellemeye göre ileri kayan (özet olmayan) aktiviteler
+        df = self._query("SELECT s.status_date, a.uid, a.name, a.finish, a.finish_slip, a.slack, a.slack_change"
+                         " FROM (SELECT id, status_date FROM snapshots WHERE project = ? ORDER BY status_date DESC LIMIT ?) s"
+                         " JOIN activities a ON a.snapshot_id = s.id AND a.finish_slip > 0 AND a.finish_slip >= ?"
+                         " WHERE a.summary = 0 ORDER BY s.status_date DESC, a.finish_slip DESC", (project, int(last_n), int(min_days)))
+        df['status_date'] = _dates(df['status_date']); df['finish'] = _dates(df['finish'])
+        return df
+
+def main(argv=None):
+    from project_core import PARSER_VERSION, process_data
+    from schedule_cache import ScheduleCache
+    parser = argparse.ArgumentParser(description="Haftalık program dosyalarını geçmiş veritabanına bir kez yazar.")
+    parser.add_argument("files", nargs="+", help="Program dosyaları (.xlsx/.csv/.xml)")
+    parser.add_argument("--project", help="Proje adı (varsayılan: özet satırı adı ya da dosya adı)")
+    parser.add_argument("--db", help=f"Veritabanı (varsayılan: {default_history_path()})")
+    parser.add_argument("--no-cache", action="store_true", help="Ayrıştırma önbelleğini kullanma")
+    args = parser.parse_args(argv)
+    store = HistoryStore(args.db)
+    cache = None if args.no_cache else ScheduleCache(PARSER_VERSION)
+    failed = 0
+    for path in args.files:
+        try:
+            df = cache.load(path, process_data) if cache else process_data(path)
+            sid, project, created = store.ingest_file(path, df, args.project)
+            print(f"{'✔' if created else '='} {path} -> {project} #{sid} ({status_date_of(path).isoformat()})")
+        except Exception as e:
+            failed += 1; print(f"✖ {path}: {type(e).__name__}: {e}", file=sys.stderr)
+    store.close()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
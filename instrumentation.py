@@ -0,0 +1,213 @@
+import cProfile
+import ctypes
+import json
+import logging
+import logging.handlers
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from schedule_cache import default_cache_dir
+
+# --- AŞAMA ÖLÇÜMÜ ---
+# Yükleme -> ayrıştırma -> çizim zincirinin her aşaması süre, satır sayısı, bellek (RSS farkı) ve
+# yük boyutuyla kaydedilir. Kayıtlar bellekte son RECENT_LIMIT adet tutulur, dinleyicilere
+# (ör. durum çubuğu) iletilir ve dönen JSON satır günlüğüne (perf-<pid>.jsonl) yazılır. Her süreç kendi
+# dosyasını açar ve yalnızca onu döndürür: RotatingFileHandler süreçler arası güvenli değildir (Windows'ta
+# başka sürecin açık tuttuğu dosya yeniden adlandırılamaz) ve report_cli işçileri GUI ile aynı anda yazabilir.
+# İç içe aşamalar "yükleme > okuma" biçiminde adlandırılır (iş parçacığı başına yığın).
+# PROJE_PROFILE=1 ortam değişkeni ilk tam yenilemenin cProfile/tracemalloc görüntüsünü alır.
+# Bu modül pandas/plotly içe aktarmaz; açılış ölçümleri onlar yüklenmeden önce de kaydedilebilir.
+RECENT_LIMIT = 300
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+LOG_KEEP_DAYS = 7  # Başka süreçlerden kalan günlükler bu süreden eskiyse silinir
+PROFILE_ENV = "PROJE_PROFILE"
+
+recent = deque(maxlen=RECENT_LIMIT)
+_listeners = []
+_local = threading.local()
+_logger = None
+_logger_pid = None
+_logger_lock = threading.Lock()
+
+def log_dir():
+    return os.path.join(os.path.dirname(default_cache_dir()), "logs")
+
+def log_path():
+    return os.path.join(log_dir(), f"perf-{os.getpid()}.jsonl")
+
+def _prune_logs(folder, keep):
+    # Biten süreçlerin eski günlükleri; açık (başka süreçte yazılan) dosya silinemezse atlanır
+    limit = time.time() - LOG_KEEP_DAYS * 86400
+    for name in os.listdir(folder):
+        path = os.path.join(folder, name)
+        if not name.startswith("perf") or ".jsonl" not in name or path.startswith(keep): continue
+        try:
+            if os.path.getmtime(path) < limit: os.remove(path)
+        except OSError: pass
+
+def _get_logger():
+    global _logger, _logger_pid
+    with _logger_lock:
+        # fork ile başlayan işçi, ebeveynin dosya tutucusunu devralır; kendi dosyasıyla yeniden kurulur
+        if _logger is None or _logger_pid != os.getpid():
+            logger = logging.getLogger("ProjePaneli.perf"); logger.propagate = False
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler); handler.close()
+            try:
+                os.makedirs(log_dir(), exist_ok=True)
+                _prune_logs(log_dir(), log_path())
+                handler = logging.handlers.RotatingFileHandler(log_path(), maxBytes=LOG_MAX_BYTES,
+                                                               backupCount=LOG_BACKUPS, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(message)s")); logger.addHandler(handler)
+                logger.setLevel(logging.INFO)
+            except OSError:
+                logger.addHandler(logging.NullHandler())
+            _logger = logger; _logger_pid = os.getpid()
+        return _logger
+
+if sys.platform == "win32":
+    class _MemoryCounters(ctypes.Structure):
+        _fields_ = [("cb", ctypes.c_ulong), ("PageFaultCount", ctypes.c_ulong), ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t), ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t), ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t), ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    class _FileTime(ctypes.Structure):
+        _fields_ = [("low", ctypes.c_ulong), ("high", ctypes.c_ulong)]
+
+    def rss_bytes():
+        counters = _MemoryCounters(); counters.cb = ctypes.sizeof(counters)
+        try:
+            ok = ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb)
+        except (AttributeError, OSError): return None
+        return counters.WorkingSetSize if ok else None
+
+    def process_start_time():
+        # Sürecin oluşturulma anı (epoch sn); FILETIME 1601'den beri 100 ns birimindedir
+        created, exited, kernel, user = (_FileTime() for _ in range(4))
+        try:
+            ok = ctypes.windll.kernel32.GetProcessTimes(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(created),
+                                                        ctypes.byref(exited), ctypes.byref(kernel), ctypes.byref(user))
+        except (AttributeError, OSError): return None
+        if not ok: return None
+        return (((created.high << 32) | created.low) - 116444736000000000) / 1e7
+else:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    def rss_bytes():
+        try:
+            with open("/proc/self/statm") as f: return int(f.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError): return None
+
+    def process_start_time():
+        # /proc/self/stat 22. alan: sistem açılışından bu yana saat tıkı cinsinden başlangıç
+        try:
+            with open("/proc/self/stat") as f: ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+            with open("/proc/uptime") as f: uptime = float(f.read().split()[0])
+            return time.time() - uptime + ticks / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError, AttributeError): return None
+
+def add_listener(fn):
+    _listeners.append(fn)
+
+def record(name, **fields):
+    # Dışarıda ölçülmüş bir aşamayı (ör. tarayıcıdaki çizim süresi) kaydeder
+    rec = {"ts": datetime.now().isoformat(timespec="milliseconds"), "stage": name, "thread": threading.current_thread().name}
+    rec.update({k: v for k, v in fields.items() if v is not None})
+    recent.append(rec)
+    try: _get_logger().info(json.dumps(rec, ensure_ascii=False, default=str))
+    except Exception: pass
+    for fn in list(_listeners):
+        try: fn(rec)
+        except Exception: pass
+    return rec
+
+class Stage:
+    # stage() bağlamında ölçüm sırasında doldurulabilecek alanlar
+    def __init__(self, name):
+        self.name = name; self.rows = None; self.payload_bytes = None; self.extra = {}
+
+@contextmanager
+def stage(name, rows=None, **extra):
+    stack = getattr(_local, "stack", None)
+    if stack is None: stack = _local.stack = []
+    st = Stage(" > ".join(stack + [name])); st.rows = rows; st.extra.update(extra)
+    stack.append(name)
+    rss_before = rss_bytes(); started = time.perf_counter()
+    failed = None
+    try:
+        yield st
+    except BaseException as e:
+        failed = type(e).__name__; raise
+    finally:
+        elapsed = (time.perf_counter() - started) * 1000
+        stack.pop()
+        rss_after = rss_bytes()
+        mem_delta = rss_after - rss_before if rss_after is not None and rss_before is not None else None
+        record(st.name, elapsed_ms=round(elapsed, 2), rows=st.rows, payload_bytes=st.payload_bytes,
+               mem_delta=mem_delta, rss=rss_after, error=failed, **st.extra)
+
+def summarize(rec):
+    # Durum çubuğu için tek satırlık özet
+    parts = [rec["stage"]]
+    if "elapsed_ms" in rec: parts.append(f"{rec['elapsed_ms']:.0f} ms")
+    if "rows" in rec: parts.append(f"{rec['rows']} satır")
+    if "payload_bytes" in rec: parts.append(f"{rec['payload_bytes'] / 1024:.0f} KB yük")
+    if "mem_delta" in rec: parts.append(f"{rec['mem_delta'] / 2**20:+.1f} MB")
+    if "error" in rec: parts.append(f"hata: {rec['error']}")
+    return " · ".join(parts)
+
+# --- AÇILIŞ SÜRESİ ---
+def launch_time():
+    # Kullanıcının uygulamayı başlattığı an (epoch sn). PyInstaller --onefile paketinde önyükleyici
+    # önce dosyaları geçici _MEIxxxx klasörüne çıkarır, Python'u sonra ayrı bir süreçte başlatır;
+    # bu durumda klasörün oluşturulma anı alınır ki çıkarma süresi de ölçüme girsin.
+    started = process_start_time()
+    bundle = getattr(sys, "_MEIPASS", None)
+    if bundle and os.path.basename(bundle).startswith("_MEI"):
+        try:
+            created = os.stat(bundle).st_ctime
+            started = created if started is None else min(started, created)
+        except OSError: pass
+    return started
+
+def startup_mark(name, at=None):
+    # Açılış kilometre taşı: başlatmadan bu yana geçen süre (at verilmezse şimdi)
+    at = time.time() if at is None else at
+    launched = launch_time()
+    return record(f"açılış: {name}", elapsed_ms=round((at - launched) * 1000, 1) if launched else None)
+
+def profile_enabled():
+    return os.environ.get(PROFILE_ENV, "").strip() not in ("", "0")
+
+def capture_profile(fn, label="yenileme"):
+    # fn'i cProfile ve tracemalloc altında bir kez çalıştırır; .prof ve okunabilir .txt özet yazar
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    folder = log_dir(); os.makedirs(folder, exist_ok=True)
+    prof_path = os.path.join(folder, f"profile-{stamp}.prof"); text_path = os.path.join(folder, f"profile-{stamp}.txt")
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing: tracemalloc.start(25)
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+        try: result = fn()
+        finally: profiler.disable()
+        snapshot = tracemalloc.take_snapshot(); peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not was_tracing: tracemalloc.stop()
+    profiler.dump_stats(prof_path)
+    with open(text_path, "w", encoding="utf-8") as f:
+        f.write(f"{label} - {stamp}\ntracemalloc tepe: {peak / 2**20:.1f} MB\n\n")
+        pstats.Stats(profiler, stream=f).sort_stats("cumulative").print_stats(60)
+        f.write("\n--- En çok bellek ayıran satırlar ---\n")
+        for stat in snapshot.statistics("lineno")[:40]: f.write(f"{stat}\n")
+    record(f"profil: {label}", path=prof_path, peak_bytes=peak)
+    return result, text_path
@@ -0,0 +1,171 @@
+import re
+import warnings
+import xml.etree.ElementTree as ET
+import numpy as np
+import pandas as pd
+
+# --- MSPDI (MS PROJECT XML) OKUYUCU ---
+# Excel dışa aktarımına gerek kalmadan .xml dosyası iterparse ile akış halinde okunur; her görev
+# işlendikten sonra XML ağacından silinir, böylece bellek kullanımı dosya boyutundan bağımsız kalır.
+# Tarihler ISO biçiminde geldiği için metin ayrıştırması yapılmaz, doğrudan datetime64'e çevrilir.
+# Öncül bağlantıları Excel'deki "Öncüller" sözdizimiyle (ör. "3TB+19g,4") yazılır; böylece
+# iki kaynaktan gelen çerçeve aynı şemayı paylaşır.
+NS = "{http://schemas.microsoft.com/project}"
+DEFAULT_MINUTES_PER_DAY = 480
+# MSPDI bağlantı tipi -> MS Project Türkçe kısaltması (0=FF, 1=FS, 2=SF, 3=SS)
+LINK_TYPE_CODES = {0: 'TT', 1: 'TB', 2: 'BT', 3: 'BB'}
+# LinkLag, LagFormat'a göre okunur. Süre biçimlerinde (dk/sa/gün/hf/ay ve tahmini "?" karşılıkları)
+# çalışma dakikasının onda biridir -> iş günü ("g"); geçen süre biçimlerinde takvim dakikasının onda
+# biridir -> geçen gün ("eg"); yüzde biçimlerinde yüzdenin onda biridir -> öncül süresinin yüzdesi ("%").
+DEFAULT_LAG_FORMAT = 7
+DURATION_LAG_FORMATS = {3, 5, 7, 9, 11, 35, 37, 39, 41, 43}
+ELAPSED_LAG_FORMATS = {4, 6, 8, 10, 12, 36, 38, 40, 42, 44}
+PERCENT_LAG_FORMATS = {19, 20, 51, 52}
+ELAPSED_MINUTES_PER_DAY = 1440
+DURATION_PATTERN = re.compile(r'^\s*(-?)P(?:(\d+(?:\.\d+)?)D)?T?(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?\s*$')
+DATE_FIELDS = {'Start': 'Başlangıç_Date', 'Finish': 'Bitiş_Date', 'ActualStart': 'Fiili_Başlangıç_Date', 'ActualFinish': 'Fiili_Bitiş_Date'}
+CHUNK_ROWS = 50_000
+
+def parse_durations(values, minutes_per_day):
+    # "PT16H0M0S" -> 2.0 (iş günü); eksik/tanınmayan değerler NaN
+    parts = pd.Series(values, dtype=object).str.extract(DURATION_PATTERN)
+    sign = np.where(parts[0] == '-', -1.0, 1.0)
+    nums = parts[[1, 2, 3, 4]].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    minutes = np.nan_to_num(nums) @ np.array([minutes_per_day, 60, 1, 1 / 60])
+    return np.where(np.isnan(nums).all(axis=1), np.nan, sign * minutes / minutes_per_day)
+
+def _local(tag):
+    return tag[len(NS):] if tag.startswith(NS) else tag
+
+def _iter_tasks(path, header):
+    # Project/Tasks/Task öğelerini tamamlandıkça verir. Her ikinci düzey bölümün (Tasks, Resources,
+    # Assignments, Calendars...) çocukları bittikçe bölümden silinir; atama ve kaynak sayısı ne olursa
+    # olsun bellekte en fazla bir öğe tutulur
+    depth = 0; root = None; section = None
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1: root = elem
+            elif depth == 2: section = elem
+            continue
+        depth -= 1
+        if depth == 2:
+            if elem.tag == NS + "Task" and section.tag == NS + "Tasks": yield elem
+            section.clear()
+        elif depth == 1:
+            name = _local(elem.tag)
+            if name == "MinutesPerDay" and elem.text: header['minutes_per_day'] = float(elem.text)
+            # Başlık alanı ya da boşaltılmış bölüm kökten de bırakılır
+            root.clear()
+
+class _ChunkBuffer:
+    # Görev alanları CHUNK_ROWS satırda bir tipli sütunlara çevrilir; Python nesneleri birikmez
+    TEXT = ['Benzersiz_Kimlik', 'Kimlik', 'Ad', 'Özet', 'İKY']
+    RAW = TEXT + ['Tamamlanma_Yüzdesi', 'Süre', 'Toplam_Bolluk', 'Temel_Süre'] + list(DATE_FIELDS.values()) + ['Temel_Başlangıç_Date', 'Temel_Bitiş_Date']
+
+    def __init__(self, header):
+        self.header = header
+        self.rows = {c: [] for c in self.RAW}
+        self.links = {'row': [], 'uid': [], 'type': [], 'lag': [], 'format': []}
+        self.frames = []; self.link_frames = []; self.count = 0
+
+    def add(self, fields, base, preds):
+        r = self.rows
+        r['Benzersiz_Kimlik'].append(fields['UID'])
+        r['Kimlik'].append(fields.get('ID') or '')
+        r['Ad'].append(fields.get('Name') or '')
+        r['Özet'].append('Evet' if fields.get('Summary') == '1' else 'Hayır')
+        r['İKY'].append(fields.get('OutlineNumber') or '')
+        r['Tamamlanma_Yüzdesi'].append(fields.get('PercentComplete'))
+        r['Süre'].append(fields.get('Duration')); r['Toplam_Bolluk'].append(fields.get('TotalSlack'))
+        r['Temel_Süre'].append(base.get('Duration'))
+        for field, col in DATE_FIELDS.items(): r[col].append(fields.get(field))
+        r['Temel_Başlangıç_Date'].append(base.get('Start')); r['Temel_Bitiş_Date'].append(base.get('Finish'))
+        for uid, kind, lag, lag_format in preds:
+            self.links['row'].append(self.count); self.links['uid'].append(uid)
+            self.links['type'].append(kind); self.links['lag'].append(lag); self.links['format'].append(lag_format)
+        self.count += 1
+        if len(r['Benzersiz_Kimlik']) >= CHUNK_ROWS: self.flush()
+
+    def flush(self):
+        r = self.rows
+        if not r['Benzersiz_Kimlik']: return
+        mpd = self.header['minutes_per_day']
+        df = pd.DataFrame({c: r[c] for c in self.TEXT})
+        df['Tamamlanma_Yüzdesi'] = pd.to_numeric(pd.Series(r['Tamamlanma_Yüzdesi'], dtype=object), errors='coerce').fillna(0).to_numpy(dtype=float) / 100
+        for col in list(DATE_FIELDS.values()) + ['Temel_Başlangıç_Date', 'Temel_Bitiş_Date']:
+            # ISO metni doğrudan datetime64'e çevrilir; eksik tarihler (None) NaT olur
+            df[col] = np.array(r[col], dtype='datetime64[s]').astype('datetime64[ns]')
+        df['Süre_Num'] = parse_durations(r['Süre'], mpd)
+        df['Temel_Süre_Num'] = parse_durations(r['Temel_Süre'], mpd)
+        # TotalSlack dakikanın onda biri cinsindendir
+        df['Bolluk_Num'] = pd.to_numeric(pd.Series(r['Toplam_Bolluk'], dtype=object), errors='coerce').to_numpy(dtype=float) / 10 / mpd
+        self.frames.append(df)
+        self.link_frames.append(pd.DataFrame(self.links))
+        for values in list(r.values()) + list(self.links.values()): values.clear()
+
+    def result(self):
+        self.flush()
+        if not self.frames: raise ValueError("Dosyada görev bulunamadı!")
+        df = pd.concat(self.frames, ignore_index=True)
+        links = pd.concat(self.link_frames, ignore_index=True)
+        df.insert(df.columns.get_loc('İKY') + 1, 'Öncüller', _format_links(links, df, self.header['minutes_per_day']))
+        return df
+
+def _format_links(links, df, minutes_per_day):
+    # Öncül UID'leri görev numarasına (ID) çevrilip "3TB+19g" biçiminde satır başına birleştirilir
+    out = pd.Series(np.nan, index=df.index, dtype=object)
+    task_id = links['uid'].map(pd.Series(df['Kimlik'].to_numpy(), index=df['Benzersiz_Kimlik'].to_numpy()))
+    links = links[task_id.notna() & (task_id != '')].assign(task_id=task_id)
+    if links.empty: return out
+    raw = links['lag'].astype(float) / 10; fmt = links['format']
+    percent = fmt.isin(PERCENT_LAG_FORMATS); elapsed = fmt.isin(ELAPSED_LAG_FORMATS)
+    unknown = ~(percent | elapsed | fmt.isin(DURATION_LAG_FORMATS)) & (raw != 0)
+    if unknown.any():
+        # Tanınmayan biçimdeki gecikme yanlış birime çevrilmesin diye yok sayılır
+        warnings.warn(f"{int(unknown.sum())} öncül bağlantısının gecikme biçimi tanınmadı "
+                      f"(LagFormat {sorted(set(fmt[unknown].tolist()))}); bu gecikmeler yok sayıldı")
+    lag = np.select([percent, elapsed, unknown], [raw, raw / ELAPSED_MINUTES_PER_DAY, 0.0], raw / minutes_per_day)
+    lag = pd.Series(lag, index=links.index).round(2)
+    unit = np.select([percent, elapsed], ['%', 'eg'], 'g')
+    lag_text = pd.Series([f"{d:+.2f}".rstrip('0').rstrip('.') + u if d else '' for d, u in zip(lag.tolist(), unit.tolist())],
+                         index=links.index, dtype=object)
+    # Gecikmesiz bitiş-başlangıç bağlantısı MS Project'te yalnızca kimlikle gösterilir
+    code = links['type'].map(LINK_TYPE_CODES).fillna('TB').where((links['type'] != 1) | (lag != 0), '')
+    text = links['task_id'] + code + lag_text
+    joined = text.groupby(links['row'].to_numpy(), sort=False).agg(','.join)
+    out.loc[joined.index] = joined.to_numpy()
+    return out
+
+def read_project_header(path):
+    # Görevlerden önce gelen proje başlığı (Name, Title, StatusDate, ...) okunur; Tasks'a gelince durulur
+    header = {}; depth = 0
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2 and _local(elem.tag) in ("Tasks", "Resources", "Assignments"): break
+            continue
+        depth -= 1
+        if depth == 1 and elem.text and elem.text.strip(): header[_local(elem.tag)] = elem.text.strip()
+    return header
+
+def read_mspdi(path):
+    header = {'minutes_per_day': DEFAULT_MINUTES_PER_DAY}
+    buffer = _ChunkBuffer(header)
+    for task in _iter_tasks(path, header):
+        fields = {}; base = {}; preds = []
+        for child in task:
+            name = child.tag[len(NS):]
+            if name == "Baseline":
+                sub = {g.tag[len(NS):]: g.text for g in child}
+                if sub.get('Number', '0') == '0': base = sub
+            elif name == "PredecessorLink":
+                sub = {g.tag[len(NS):]: g.text for g in child}
+                preds.append((sub.get('PredecessorUID'), int(sub.get('Type') or 1), int(sub.get('LinkLag') or 0),
+                              int(sub.get('LagFormat') or DEFAULT_LAG_FORMAT)))
+            else:
+                fields[name] = child.text
+        # Proje özet görevi (UID 0) ve boş satırlar programın parçası değildir
+        if fields.get('UID') in (None, '0') or fields.get('IsNull') == '1': continue
+        buffer.add(fields, base, preds)
+    return buffer.result()
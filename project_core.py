@@ -0,0 +1,1080 @@
+import os
+import heapq
+import bisect
+import warnings
+import threading
+from html import escape
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from schedule_reader import read_schedule_table
+from mspdi_reader import read_mspdi
+from instrumentation import stage
+
+# --- PROJE ÇEKİRDEĞİ ---
+# Veri işleme, kıyas ve grafik üretimi Qt'den bağımsızdır: masaüstü uygulaması ve komut satırı
+# raporlayıcısı (report_cli.py) aynı fonksiyonları kullanır. Bu modül PyQt6 içe aktarmamalıdır.
+
+# process_data çıktısının şeması değiştiğinde artırılır (eski önbellek kayıtlarını geçersiz kılar)
+PARSER_VERSION = 4
+
+# --- YARDIMCI FONKSİYONLAR ---
+def format_date_tr(date_obj):
+    if pd.isna(date_obj): return "-"
+    months = {
+        1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan", 5: "Mayıs", 6: "Haziran",
+        7: "Temmuz", 8: "Ağustos", 9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
+    }
+    return f"{date_obj.day} {months[date_obj.month]} {date_obj.year}"
+
+def format_date_short(date_obj):
+    if pd.isna(date_obj): return ""
+    months = {
+        1: "Oca", 2: "Şub", 3: "Mar", 4: "Nis", 5: "May", 6: "Haz",
+        7: "Tem", 8: "Ağu", 9: "Eyl", 10: "Eki", 11: "Kas", 12: "Ara"
+    }
+    return f"{date_obj.day} {months[date_obj.month]}"
+
+def parse_turkish_date(date_str):
+    if isinstance(date_str, (pd.Timestamp, datetime)): return date_str
+    if not isinstance(date_str, str) or str(date_str).lower() in ["yok", "nan", "nat", ""]: return pd.NaT
+    tr_months = {"Ocak":"January", "Şubat":"February", "Mart":"March", "Nisan":"April", "Mayıs":"May", "Haziran":"June", "Temmuz":"July", "Ağustos":"August", "Eylül":"September", "Ekim":"October", "Kasım":"November", "Aralık":"December"}
+    clean_str = str(date_str)
+    for tr, en in tr_months.items():
+        if tr in clean_str:
+            clean_str = clean_str.replace(tr, en)
+            break
+    try: return pd.to_datetime(clean_str)
+    except: return pd.NaT
+
+def clean_duration(val):
+    if isinstance(val, (int, float)): return float(val)
+    if isinstance(val, str):
+        val = val.lower().replace(" gün", "").replace("g", "").replace("day", "").replace("dy", "").replace(" ", "")
+        try: return float(val)
+        except: return 0.0
+    return 0.0
+
+def normalize_id(val):
+    try:
+        f_val = float(val)
+        if f_val.is_integer(): return str(int(f_val))
+        return str(f_val)
+    except: return str(val).strip()
+
+# --- VEKTÖREL AYRIŞTIRMA ---
+# Yukarıdaki hücre bazlı yardımcıların sütun bazlı karşılıkları. Çıktıları birebir aynıdır;
+# eski fonksiyonlar referans (tests/test_parsing.py eşdeğerlik testleri) ve nadir uç durumlar için korunur.
+TR_MONTHS = {"Ocak":"January", "Şubat":"February", "Mart":"March", "Nisan":"April", "Mayıs":"May", "Haziran":"June", "Temmuz":"July", "Ağustos":"August", "Eylül":"September", "Ekim":"October", "Kasım":"November", "Aralık":"December"}
+TR_MONTH_PATTERN = "|".join(TR_MONTHS)
+EMPTY_DATE_TOKENS = ["yok", "nan", "nat", ""]
+
+def _to_datetime_fast(texts):
+    # Tüm metinler aynı formattaysa C hızında tek geçiş; değilse her metin ayrı çözümlenir
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        try: return pd.to_datetime(texts, errors='raise')
+        except (ValueError, TypeError): return pd.to_datetime(texts, errors='coerce', format='mixed')
+
+def parse_turkish_dates(series):
+    if pd.api.types.is_datetime64_any_dtype(series): return series
+    # Her farklı tarih metni yalnızca bir kez çözümlenir (memoization)
+    codes, uniques = pd.factorize(series)
+    uniq = pd.Series(uniques, dtype=object)
+    parsed = pd.Series(pd.NaT, index=uniq.index, dtype=object)
+
+    is_ts = uniq.map(lambda v: isinstance(v, (pd.Timestamp, datetime)))
+    parsed[is_ts] = uniq[is_ts]
+
+    texts = uniq[uniq.map(lambda v: isinstance(v, str))]
+    texts = texts[~texts.str.lower().isin(EMPTY_DATE_TOKENS)]
+    if not texts.empty:
+        texts = texts.str.replace(TR_MONTH_PATTERN, lambda m: TR_MONTHS[m.group(0)], n=1, regex=True)
+        parsed[texts.index] = _to_datetime_fast(texts).astype(object)
+
+    parsed = pd.to_datetime(parsed.tolist() + [pd.NaT])
+    return pd.Series(parsed.take(codes), index=series.index)
+
+def clean_durations(series):
+    if pd.api.types.is_numeric_dtype(series): return series.astype(float)
+    out = pd.Series(0.0, index=series.index)
+    missing = series.isna()
+    if missing.any(): out[missing] = series[missing].map(clean_duration)
+
+    codes, uniques = pd.factorize(series)
+    uniq = pd.Series(uniques, dtype=object)
+    values = pd.Series(0.0, index=uniq.index)
+    is_num = uniq.map(lambda v: isinstance(v, (int, float)))
+    values[is_num] = uniq[is_num].astype(float)
+
+    texts = uniq[uniq.map(lambda v: isinstance(v, str))]
+    if not texts.empty:
+        cleaned = (texts.str.lower().str.replace(" gün", "", regex=False).str.replace("g", "", regex=False)
+                   .str.replace("day", "", regex=False).str.replace("dy", "", regex=False).str.replace(" ", "", regex=False))
+        nums = pd.to_numeric(cleaned, errors='coerce')
+        # Sayıya çevrilemeyenler (ör. "nan", boş metin) referans fonksiyonla çözülür
+        failed = nums.isna()
+        if failed.any(): nums[failed] = texts[failed].map(clean_duration)
+        values[texts.index] = nums
+
+    present = codes >= 0
+    out[present] = values.to_numpy()[codes[present]]
+    return out
+
+def _format_float_ids(values):
+    integral = np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) < 2**63)
+    out = values.astype(str).astype(object)
+    out[integral] = values[integral].astype(np.int64).astype(str)
+    return out
+
+def normalize_ids(series):
+    out = pd.Series("", index=series.index, dtype=object)
+    if pd.api.types.is_numeric_dtype(series):
+        out[:] = _format_float_ids(series.to_numpy(dtype=float))
+        return out.astype(str)
+    missing = series.isna()
+    if missing.any(): out[missing] = series[missing].map(normalize_id)
+
+    codes, uniques = pd.factorize(series)
+    uniq = pd.Series(uniques, dtype=object)
+    nums = pd.to_numeric(uniq, errors='coerce').to_numpy(dtype=float)
+    values = np.empty(len(uniq), dtype=object)
+    ok = ~np.isnan(nums)
+    values[ok] = _format_float_ids(nums[ok])
+    # Sayısal olmayan kimlikler (ör. "A-12") referans fonksiyonla çözülür
+    values[~ok] = uniq[~ok].map(normalize_id).to_numpy()
+
+    present = codes >= 0
+    out[present] = values[codes[present]]
+    return out.astype(str)
+
+EPOCH = pd.Timestamp('1970-01-01')
+
+def epoch_days(series, fractional=False):
+    # Tarih sütunu -> 1970'ten beri gün listesi (JSON/SQLite için); NaT -> None
+    if fractional:
+        return float_list(((series - EPOCH) / pd.Timedelta(days=1)).round(4))
+    days = series.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    out = days.astype(np.int64).astype(object)
+    out[np.isnat(days)] = None
+    return out.tolist()
+
+def float_list(series):
+    # Sayısal sütun -> Python float listesi; NaN -> None
+    values = np.asarray(series, dtype=float).astype(object)
+    values[pd.isna(values)] = None
+    return values.tolist()
+
+# --- KOMPAKT ŞEMA ---
+# Ayrıştırılmış karşılığı olan ham metin sütunları tutulmaz; düşük kardinaliteli bayraklar kategorik,
+# sayısal sütunlar kayıpsız olduğu sürece float32 saklanır. Kimlikler düz metin kalır: her satırda
+# farklıdırlar ve farklı kategorili iki çerçevenin birleşimi object tipine geri düşer.
+RAW_TEXT_COLS = ['Başlangıç', 'Bitiş', 'Fiili_Başlangıç', 'Fiili_Bitiş', 'Süre', 'Toplam_Bolluk']
+FLAG_COLS = ['Özet', 'Durum']
+DOWNCAST_COLS = ['Tamamlanma_Yüzdesi', 'Süre_Num', 'Bolluk_Num']
+
+def compact_frame(df):
+    df = df.drop(columns=[c for c in RAW_TEXT_COLS if c in df.columns])
+    for c in FLAG_COLS:
+        if c in df.columns: df[c] = df[c].astype('category').cat.remove_unused_categories()
+    for c in DOWNCAST_COLS:
+        if c in df.columns and pd.api.types.is_float_dtype(df[c]):
+            small = df[c].to_numpy(dtype=np.float32)
+            if np.array_equal(small.astype(float), df[c].to_numpy(dtype=float), equal_nan=True): df[c] = small
+    return df
+
+def memory_report(df):
+    usage = df.memory_usage(deep=True)
+    return {"rows": len(df), "total": int(usage.sum()), "columns": {str(k): int(v) for k, v in usage.items()}}
+
+def format_bytes(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024: return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+# --- VERİ İŞLEME ---
+def process_frame(df):
+    # Ham tablo (yalnızca gerekli sütunlar) -> uygulamanın kullandığı tipli, kompakt çerçeve
+    with stage("tarih/süre ayrıştırma", rows=len(df)):
+        df['Benzersiz_Kimlik'] = normalize_ids(df['Benzersiz_Kimlik'])
+        df['Başlangıç_Date'] = parse_turkish_dates(df['Başlangıç'])
+        df['Bitiş_Date'] = parse_turkish_dates(df['Bitiş'])
+        df['Fiili_Başlangıç_Date'] = parse_turkish_dates(df['Fiili_Başlangıç'])
+        df['Fiili_Bitiş_Date'] = parse_turkish_dates(df['Fiili_Bitiş'])
+
+        df['Süre_Num'] = clean_durations(df['Süre'])
+        df['Bolluk_Num'] = clean_durations(df['Toplam_Bolluk'])
+    return finalize_frame(df)
+
+def finalize_frame(df):
+    # Kritiklik: Bolluk <= 0 ve Tamamlanmamış
+    finished = df['Fiili_Bitiş_Date'].notna()
+    df['Kritik'] = (df['Bolluk_Num'] <= 0) & ~finished
+    df['Durum'] = np.select([df['Kritik'], finished], ['Kritik', 'Tamamlandı'], default='Normal')
+    with stage("kompakt şema", rows=len(df)):
+        return compact_frame(df)
+
+def read_raw(path):
+    # MS Project XML'i doğrudan tipli sütunlara okunur; Excel/CSV metin ayrıştırmasından geçer.
+    # Dönüş: (ham çerçeve, onu işlenmiş çerçeveye çeviren fonksiyon)
+    is_xml = path.lower().endswith('.xml')
+    with stage("dosya okuma", file=os.path.basename(path)) as st:
+        raw = read_mspdi(path) if is_xml else read_schedule_table(path)
+        st.rows = len(raw)
+    return raw, (finalize_frame if is_xml else process_frame)
+
+def process_data(path):
+    raw, parse = read_raw(path)
+    return parse(raw)
+
+# --- ARTIMLI YENİDEN YÜKLEME ---
+# İzlenen dosya değişince ham satırlar Benzersiz_Kimlik başına özetlenir (hash); yalnızca eklenen ve
+# değişen satırlar ayrıştırılıp önceki işlenmiş çerçeveye yamanır. İşlenmiş çerçevenin satırları ham
+# tabloyla aynı sıradadır (process_frame satır atmaz), özetler de bu sırayla tutulur.
+# Kimlik tekrarı, satır sırası ya da sütun kümesi değişimi veya bilinmeyen önceki durumda tüm dosya
+# yeniden ayrıştırılır.
+# Not: okuma ve özetleme her seferinde tüm dosya içindir; kazanç ayrıştırmanın ve çizimin atlanmasıdır.
+DELTA_SCOPES = ("summary", "tasks")
+
+def row_hashes(raw):
+    # Ham satır özetleri, ham kimlik dizinli (normalize edilmez, hızlı yol); kimlikler tekil değilse None
+    ids = pd.Index(raw['Benzersiz_Kimlik'])
+    if not ids.is_unique: return None
+    hashes = pd.Series(pd.util.hash_pandas_object(raw, index=False, categorize=False).to_numpy(), index=ids)
+    # Özetler yalnızca aynı sütunlu tablolar arasında karşılaştırılabilir
+    hashes.attrs["columns"] = tuple(raw.columns)
+    return hashes
+
+def watch_hashes(path, df):
+    # İzleme başlarken: dosyanın şimdiki ham özetleri, df bu dosyadan üretilmişse; değilse None
+    # (dosya yüklendikten sonra değişmiş demektir, ilk yeniden yükleme tam ayrıştırma olur)
+    raw, _ = read_raw(path)
+    if len(raw) != len(df) or not np.array_equal(normalize_ids(raw['Benzersiz_Kimlik']).to_numpy(dtype=object),
+                                                 df['Benzersiz_Kimlik'].to_numpy(dtype=object)): return None
+    return row_hashes(raw)
+
+def _scope_masks(df):
+    summary = (df['Özet'] == 'Evet').to_numpy() if 'Özet' in df.columns else np.zeros(len(df), dtype=bool)
+    return {"summary": summary, "tasks": ~summary}
+
+def _changed_columns(old, new):
+    # Aynı kimlikli satır çiftleri (aynı sırada) arasında değeri değişen sütunlar
+    cols = set()
+    for c in new.columns:
+        if c not in old.columns: cols.add(c); continue
+        a = old[c].to_numpy(dtype=object); b = new[c].to_numpy(dtype=object)
+        if (~((a == b) | (pd.isna(a) & pd.isna(b)))).any(): cols.add(c)
+    return cols
+
+def reload_changed(path, df, hashes):
+    # df: önceki işlenmiş çerçeve, hashes: onun ham satır özetleri (watch_hashes ya da önceki
+    # reload_changed sonucu; bilinmiyorsa None). Dönüş: (çerçeve, özetler, fark)
+    # fark None ise tüm çerçeve değişmiş sayılır; aksi halde kapsam başına ("summary"/"tasks")
+    # eklenen/silinen satır olup olmadığı ("rows") ve değişen satırlarda değişen sütunlar ("columns")
+    raw, parse = read_raw(path)
+    with stage("satır özetleri", rows=len(raw)):
+        new_hashes = row_hashes(raw)
+    if new_hashes is None or hashes is None or len(hashes) != len(df) or hashes.attrs.get("columns") != tuple(raw.columns):
+        return parse(raw), new_hashes, None
+    old_pos = hashes.index.get_indexer(new_hashes.index)
+    same = (old_pos >= 0) & (hashes.to_numpy()[old_pos] == new_hashes.to_numpy())
+    kept = old_pos[same]
+    if np.any(np.diff(kept) < 0): return parse(raw), new_hashes, None
+    fresh = np.flatnonzero(~same)
+    with stage("artımlı ayrıştırma", rows=len(fresh)):
+        parsed = parse(raw.iloc[fresh].copy()) if len(fresh) else df.iloc[:0]
+        order = np.argsort(np.r_[np.flatnonzero(same), fresh], kind='stable')
+        new = compact_frame(pd.concat([df.iloc[kept], parsed]).iloc[order].reset_index(drop=True))
+
+    # Fark özeti: değişen satırlar eski ve yeni hâlleriyle kapsamlarına göre karşılaştırılır
+    changed = fresh[old_pos[fresh] >= 0]; added = fresh[old_pos[fresh] < 0]
+    removed = np.setdiff1d(np.arange(len(df)), old_pos[old_pos >= 0])
+    old_scope = _scope_masks(df); new_scope = _scope_masks(new)
+    delta = {"rows": {}, "columns": {}, "counts": {"added": len(added), "changed": len(changed), "removed": len(removed)}}
+    for s in DELTA_SCOPES:
+        delta["rows"][s] = bool(new_scope[s][added].any() or old_scope[s][removed].any())
+        in_scope = changed[new_scope[s][changed] | old_scope[s][old_pos[changed]]]
+        delta["columns"][s] = _changed_columns(df.iloc[old_pos[in_scope]], new.iloc[in_scope]) if len(in_scope) else set()
+    return new, new_hashes, delta
+
+# --- SORGU İNDEKSİ ---
+# Tarih penceresi sorguları ("önümüzdeki 7 günde başlayacaklar", "bitişi geçmiş ama bitmemişler") her
+# görünümde tüm çerçeveyi maskelemek yerine sıralı tarih dizilerinde ikili aramayla yanıtlanır:
+# O(log n + k). Her çerçeve (snapshot) için bir kez kurulur, görünümler arasında paylaşılır.
+# Bölümler: all (tüm satırlar), tasks (özet dışı), not_started / not_finished (fiili tarihi boş görevler),
+# critical (Kritik görevler). Bölüm satırları tarih sırasındadır (eşitlerde çerçeve sırası, NaT en sonda).
+INDEX_KEYS = [('Başlangıç_Date', 'all'), ('Bitiş_Date', 'all'), ('Başlangıç_Date', 'not_started'),
+              ('Bitiş_Date', 'not_finished'), ('Başlangıç_Date', 'critical')]
+INDEX_CACHE_SIZE = 4  # güncel, baseline ve senaryo çerçeveleri
+
+def _datetime64(value):
+    return pd.Timestamp(value).to_datetime64().astype('datetime64[ns]')
+
+class SortedDates:
+    def __init__(self, keys, rows):
+        # keys: tarih sırasındaki geçerli (NaT olmayan) tarihler; rows: tüm bölüm satırlarının konumları
+        self.keys = keys; self.rows = rows
+
+    def __len__(self): return len(self.rows)
+
+    def between(self, lo=None, hi=None):
+        # lo <= tarih <= hi olan satır konumları, tarih sırasıyla
+        i = 0 if lo is None else np.searchsorted(self.keys, _datetime64(lo), 'left')
+        j = len(self.keys) if hi is None else np.searchsorted(self.keys, _datetime64(hi), 'right')
+        return self.rows[i:max(i, j)]
+
+    def before(self, t):
+        # tarih < t olan satır konumları, tarih sırasıyla
+        return self.rows[:np.searchsorted(self.keys, _datetime64(t), 'left')]
+
+    def min(self): return pd.Timestamp(self.keys[0]) if len(self.keys) else pd.NaT
+    def max(self): return pd.Timestamp(self.keys[-1]) if len(self.keys) else pd.NaT
+
+    def mask_before(self, t, n):
+        # before() sonucunun n uzunluğunda boolean maske karşılığı
+        mask = np.zeros(n, dtype=bool); mask[self.before(t)] = True
+        return mask
+
+def sorted_dates(series):
+    values = series.to_numpy(dtype='datetime64[ns]'); rows = np.argsort(values, kind='stable')
+    keys = values[rows]
+    return SortedDates(keys[~np.isnat(keys)], rows)
+
+class ScheduleIndex:
+    def __init__(self, df):
+        n = len(df)
+        tasks = (df['Özet'] == 'Hayır').to_numpy() if 'Özet' in df.columns else np.ones(n, dtype=bool)
+        parts = {'all': np.ones(n, dtype=bool), 'tasks': tasks,
+                 'not_started': tasks & df['Fiili_Başlangıç_Date'].isna().to_numpy(),
+                 'not_finished': tasks & df['Fiili_Bitiş_Date'].isna().to_numpy(),
+                 'critical': tasks & df['Kritik'].to_numpy(dtype=bool)}
+        self.sorted = {}
+        for col in dict.fromkeys(c for c, _ in INDEX_KEYS):
+            # Sütun başına tek sıralama; bölümler bu sıradan maskeyle süzülür (yeniden sıralanmaz)
+            values = df[col].to_numpy(dtype='datetime64[ns]')
+            order = np.argsort(values, kind='stable').astype(np.int32 if n < 2**31 else np.int64)
+            for part in (p for c, p in INDEX_KEYS if c == col):
+                rows = order[parts[part][order]]
+                keys = values[rows]  # NaT'ler numpy sıralamasında sondadır; anahtarlar geçerli önektir
+                self.sorted[col, part] = SortedDates(keys[~np.isnat(keys)], rows)
+
+    def dates(self, col, part='all'):
+        return self.sorted[col, part]
+
+_index_lock = threading.Lock()
+_index_cache = []
+_search_cache = []
+
+def _frame_cached(cache, df, build, label):
+    # Çerçeve kimliğine göre küçük önbellek; çerçeveler yerinde değiştirilmez (senaryo yeni çerçeve üretir)
+    with _index_lock:
+        for frame, index in cache:
+            if frame is df: return index
+        with stage(label, rows=len(df)):
+            index = build(df)
+        cache.append((df, index)); del cache[:-INDEX_CACHE_SIZE]
+        return index
+
+def get_index(df):
+    return _frame_cached(_index_cache, df, ScheduleIndex, "sorgu indeksi")
+
+# --- AKTİVİTE ARAMA ---
+# Ad ve Benzersiz_Kimlik ile yazarken arama. Adlar Türkçe kurala göre küçültülür (İ->i, I->ı) ve
+# üçlü harf (trigram) ters indeksine girer: her trigram için onu içeren satırlar (artan sırada).
+# Sorgu kelimelerinin en seyrek trigramının listesi aday kümesidir; adaylar sırayla doğrulanır,
+# yeterli sonuç bulununca durulur. Kimlikler sözlükte, adlar ayrıca önek araması için sıralıdır.
+# İndeks yüklemede arka planda kurulur (get_search_index); sorgu ana iş parçacığında çalışır.
+SEARCH_LIMIT = 12
+SEARCH_NGRAM = 3
+SEARCH_INTERSECT_MIN = 2048  # en seyrek liste bundan uzunsa ikinci en seyrek listeyle kesiştirilir
+
+def fold_tr(text):
+    # str.lower 'İ'yi 'i̇' (i + nokta), 'I'yı 'i' yapar; önce Türkçe karşılıklarına çevrilir
+    return str(text).replace('İ', 'i').replace('I', 'ı').lower()
+
+class SearchIndex:
+    def __init__(self, df):
+        self.ids = df['Benzersiz_Kimlik'].astype(str).to_numpy(dtype=object)
+        self.id_rows = {}
+        for i, key in enumerate(self.ids.tolist()): self.id_rows.setdefault(key, i)
+        # Tüm adlar "\0" ayraçlı tek metinde katlanır; ayraç içeren trigramlar satır sınırını aştığı için atılır
+        text = fold_tr("\0".join(df['Ad'].fillna('').astype(str).tolist()))
+        self.names = text.split("\0"); n = len(self.names)
+        self.by_name = sorted(range(n), key=self.names.__getitem__); self.sorted_names = [self.names[i] for i in self.by_name]
+
+        # Kod noktaları sık alfabeye indirilir (ayraç 0 olur); trigram = üç harfin alfabe tabanında sayısı
+        cp = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        present = np.zeros(int(cp.max()) + 1 if len(cp) else 1, dtype=bool); present[cp] = True; present[0] = True
+        dense = np.cumsum(present) - 1
+        self.alphabet = {chr(c): int(dense[c]) for c in np.flatnonzero(present)}; self.base = len(self.alphabet)
+        letters = dense[cp].astype(np.int64)
+        lengths = np.fromiter(map(len, self.names), dtype=np.int64, count=n)
+        rows = np.repeat(np.arange(n, dtype=np.int64), lengths + 1)[:max(len(letters) - 2, 0)]
+        valid = (letters[:-2] != 0) & (letters[1:-1] != 0) & (letters[2:] != 0)
+        # Anahtar = trigram * n + satır: tek sıralama hem trigramları hem her listenin satırlarını sıralar
+        keys = np.sort(self.grams_of(letters)[valid] * n + rows[valid])
+        keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+        grams = keys // max(n, 1); self.postings = (keys - grams * n).astype(np.int32)
+        starts = np.flatnonzero(np.r_[True, grams[1:] != grams[:-1]]) if len(grams) else grams
+        self.grams = grams[starts]; self.offsets = np.r_[starts, len(grams)]
+
+    def __len__(self): return len(self.ids)
+
+    def grams_of(self, letters):
+        return (letters[:-2] * self.base + letters[1:-1]) * self.base + letters[2:]
+
+    def posting(self, code):
+        j = np.searchsorted(self.grams, code)
+        if j == len(self.grams) or self.grams[j] != code: return self.postings[:0]
+        return self.postings[self.offsets[j]:self.offsets[j + 1]]
+
+    def candidates(self, tokens):
+        # Kelimelerin tüm trigramları içinde en seyrek liste(ler); trigramı olmayan sorguda None.
+        # Alfabede olmayan harf içeren kelime hiçbir adda geçmez
+        lists = []
+        for t in (t for t in tokens if len(t) >= SEARCH_NGRAM):
+            if any(ch not in self.alphabet for ch in t): return self.postings[:0]
+            lists += [self.posting(code) for code in self.grams_of(np.array([self.alphabet[ch] for ch in t], dtype=np.int64))]
+        if not lists: return None
+        lists.sort(key=len)
+        if len(lists) > 1 and len(lists[0]) > SEARCH_INTERSECT_MIN:
+            return np.intersect1d(lists[0], lists[1], assume_unique=True)
+        return lists[0]
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        # Dönüş: satır konumları; önce tam kimlik, sonra adı sorguyla başlayanlar (alfabetik),
+        # sonra adında tüm sorgu kelimeleri geçenler (program sırasıyla)
+        query = query.strip(); text = fold_tr(query)
+        if not text: return []
+        out = []; seen = set()
+        def take(rows):
+            for r in rows:
+                r = int(r)
+                if r not in seen: seen.add(r); out.append(r)
+                if len(out) >= limit: return True
+            return False
+        hit = self.id_rows.get(normalize_id(query))
+        if hit is not None and take([hit]): return out
+        lo = bisect.bisect_left(self.sorted_names, text); hi = bisect.bisect_left(self.sorted_names, text + '\U0010ffff', lo)
+        if take(self.by_name[lo:min(hi, lo + limit)]): return out
+        tokens = text.split(); cand = self.candidates(tokens)
+        if cand is None: return out
+        names = self.names
+        take(r for r in cand.tolist() if all(t in names[r] for t in tokens))
+        return out
+
+def get_search_index(df):
+    return _frame_cached(_search_cache, df, SearchIndex, "arama indeksi")
+
+# --- KIYAS MOTORU ---
+# Güncel ve baseline programın tek birleşimi. Kıyas tablosu ve analiz notları aynı farkları
+# (gecikme, süre/bolluk değişimi, yeni kritikler) buradan okur; girdiler değişene kadar önbellektedir.
+NEAR_CRITICAL_SLACK = 30
+COMPARE_CUR_COLS = ['Benzersiz_Kimlik', 'Ad', 'Başlangıç_Date', 'Bitiş_Date', 'Fiili_Başlangıç_Date', 'Fiili_Bitiş_Date', 'Süre_Num', 'Bolluk_Num']
+COMPARE_BASE_COLS = ['Benzersiz_Kimlik', 'Başlangıç_Date', 'Bitiş_Date', 'Süre_Num', 'Bolluk_Num']
+
+class BaselineComparison:
+    def __init__(self, df_c, df_b, today):
+        self.today = today
+        tasks = df_c[df_c['Özet'] == 'Hayır'] if 'Özet' in df_c.columns else df_c
+        cur = tasks[COMPARE_CUR_COLS].rename(columns=lambda c: c if c == 'Benzersiz_Kimlik' else c + '_cur')
+        base = df_b[COMPARE_BASE_COLS].rename(columns=lambda c: c if c == 'Benzersiz_Kimlik' else c + '_base')
+        m = pd.merge(cur, base, on="Benzersiz_Kimlik", how="inner")
+        m.index = pd.Index(m['Benzersiz_Kimlik'], name=None)
+
+        m['Start_Delay'] = (m['Başlangıç_Date_cur'] - m['Başlangıç_Date_base']).dt.days
+        m['Süre_Fark'] = m['Süre_Num_base'] - m['Süre_Num_cur']
+        m['Bolluk_Fark'] = m['Bolluk_Num_base'] - m['Bolluk_Num_cur']
+        # Baseline tarihleri birleşim başına bir kez sıralanır; "baseline'da bugünden önce" tek ikili aramadır
+        self.base_dates = {col: sorted_dates(m[col]) for col in ('Başlangıç_Date_base', 'Bitiş_Date_base')}
+        base_started = self.base_dates['Başlangıç_Date_base'].mask_before(today, len(m))
+        base_finished = self.base_dates['Bitiş_Date_base'].mask_before(today, len(m))
+        m['Başlama_Gecikti'] = base_started & m['Fiili_Başlangıç_Date_cur'].isna() & (m['Başlangıç_Date_cur'] > m['Başlangıç_Date_base'])
+        m['Bitiş_Gecikti'] = base_finished & (m['Bitiş_Date_cur'] > m['Bitiş_Date_base'])
+        m['Yeni_Kritik'] = (m['Bolluk_Num_base'] > 0) & (m['Bolluk_Num_cur'] <= 0)
+        self.merged = m
+        # Tamamlanmamış aktiviteler: tüm kıyas kuralları bu havuz üzerinde çalışır
+        self.active = m[m['Fiili_Bitiş_Date_cur'].isna()]
+
+    def select(self, flag, slack_limit=None):
+        # slack_limit: yalnızca güncel bolluğu bu eşiğin altındakiler (ör. NEAR_CRITICAL_SLACK)
+        a = self.active
+        mask = a[flag] if isinstance(flag, str) else flag(a)
+        if slack_limit is not None: mask = mask & (a['Bolluk_Num_cur'] <= slack_limit)
+        return a[mask]
+
+_comparison_lock = threading.Lock()
+_comparison_cache = None
+
+def get_comparison(df_c, df_b):
+    # Tek girdilik önbellek: aynı çerçeve nesneleri ve aynı gün için birleşim yeniden yapılmaz
+    global _comparison_cache
+    today = pd.Timestamp.now()
+    with _comparison_lock:
+        c = _comparison_cache
+        if c is None or c[0] is not df_c or c[1] is not df_b or c[2].today.date() != today.date():
+            with stage("kıyas birleşimi", rows=len(df_c)):
+                _comparison_cache = c = (df_c, df_b, BaselineComparison(df_c, df_b, today))
+        return c[2]
+
+# --- ETKİLEŞİMLİ FİLTRE ---
+# Bolluk eşiği ve ileriye bakış ufku arayüzden değiştirilebilir. Tablolar verilen değerlerle Python'da
+# çizilir (rapor bu hâlini kullanır); masaüstünde aday aktiviteler *_filter_data ile sütunsal JSON
+# olarak figürle birlikte sayfaya bir kez gider ve eşik değiştikçe süzme tarayıcıda yapılır
+# (desktop_app PLOT_SHELL applyFilter). Adaylar SLACK_LIMIT_MAX / LOOKAHEAD_MAX ile sınırlıdır.
+LOOKAHEAD_DAYS = 7
+SLACK_LIMIT_MAX = 365
+LOOKAHEAD_MAX = 90
+FILTER_TABLE_ROWS = 10
+RISK_TITLE = "Önümüzdeki {horizon} gün içerisinde başlaması ve/veya bitmesi planlanan kritik aktiviteler (Bolluk<={slack})"
+RISK_HEADER = ["Aktivite ID", "Risk Türü", "Aktivite Adı", "Kritik Tarih", "Bolluk"]
+RISK_EMPTY = "Seçilen ufuk ve bolluk eşiği için kritik risk bulunamadı."
+# (kategori, indeks bölümü, plan sütunu)
+RISK_SECTIONS = [("🟢 BAŞLAMASI PLANLANAN", 'not_started', 'Başlangıç_Date'),
+                 ("🔴 BİTMESİ PLANLANAN", 'not_finished', 'Bitiş_Date')]
+# (başlık, seçim, sütun 1, başlık 1, sütun 2, başlık 2) — kıyas tablolarının sırası alt grafik sırasıdır
+COMPARISON_TABLES = [
+    ("Başlaması Gecikenler", 'Başlama_Gecikti', 'Başlangıç_Date_base', 'Base Başlangıç', 'Başlangıç_Date_cur', 'Güncel Başlangıç'),
+    ("Bitmesi Gecikenler", 'Bitiş_Gecikti', 'Bitiş_Date_base', 'Base Bitiş', 'Bitiş_Date_cur', 'Güncel Bitiş'),
+    ("Süresi Kısılanlar", lambda a: a['Süre_Fark'] > 0, 'Süre_Num_base', 'Base Süre', 'Süre_Num_cur', 'Güncel Süre'),
+    ("Kritikliği Artanlar", lambda a: a['Bolluk_Fark'] > 0, 'Bolluk_Num_base', 'Base Bolluk', 'Bolluk_Num_cur', 'Güncel Bolluk'),
+]
+COMPARISON_HEADER = ["Aktivite ID", "Aktivite", "{0}", "{1}", "Bolluk"]
+COMPARISON_EMPTY = "Kriterlere uygun veri yok"
+
+def risk_candidates(df, today):
+    # Başlaması/bitmesi ufuk içinde (ya da geçmişte kalmış) olup henüz gerçekleşmemiş, özet dışı
+    # aktiviteler; plan tarihine göre sıralı. Dönüş: [(kategori, çerçeve, tarih sütunu)]
+    index = get_index(df); until = today + timedelta(days=LOOKAHEAD_MAX); out = []
+    for label, part, planned in RISK_SECTIONS:
+        c = df.iloc[index.dates(planned, part).between(hi=until)]
+        out.append((label, c[c['Bolluk_Num'] <= SLACK_LIMIT_MAX], planned))
+    return out
+
+def threshold_frontier(slack, rows):
+    # Sıralı adaylardan herhangi bir eşikte ilk `rows` satıra girebilecekler: i. satır ancak
+    # kendisinden önce bolluğu <= olan satır sayısı `rows`'dan azsa görünebilir. Ufuk da tarih
+    # sırasıyla yalnızca kesen bir süzgeç olduğundan aynı ölçüt geçerlidir. Gönderilen yük küçülür.
+    keep = np.zeros(len(slack), dtype=bool); smallest = []
+    for i, s in enumerate(np.asarray(slack, dtype=float).tolist()):
+        if s != s: continue
+        if len(smallest) < rows: heapq.heappush(smallest, -s)
+        elif s < -smallest[0]: heapq.heapreplace(smallest, -s)
+        else: continue
+        keep[i] = True
+    return keep
+
+def _table_column(values, is_date):
+    return {"d": epoch_days(values)} if is_date else {"v": float_list(values)}
+
+def dashboard_filter_data(df):
+    today = pd.Timestamp.now(); sections = []
+    for label, c, col in risk_candidates(df, today):
+        c = c[threshold_frontier(c['Bolluk_Num'], FILTER_TABLE_ROWS)]
+        sections.append({"slack": float_list(c['Bolluk_Num']), "day": epoch_days(c[col], fractional=True),
+                         "cols": [{"v": c['Benzersiz_Kimlik'].astype(str).tolist()}, {"c": label}, {"v": c['Ad'].astype(str).str.slice(0, 40).tolist()},
+                                  _table_column(c[col], True), _table_column(c['Bolluk_Num'], False)]})
+    return {"today": epoch_days(pd.Series([today]), fractional=True)[0], "rows": FILTER_TABLE_ROWS,
+            "tables": [{"trace": 1, "header": RISK_HEADER, "empty_header": ["Bilgi"], "empty": RISK_EMPTY, "sections": sections}],
+            "titles": [{"index": 0, "text": RISK_TITLE}]}
+
+def comparison_filter_data(df_c, df_b):
+    comp = get_comparison(df_c, df_b)
+    tables = []; titles = []
+    for i, (title, flag, col1, header1, col2, header2) in enumerate(COMPARISON_TABLES):
+        c = comp.select(flag, SLACK_LIMIT_MAX)
+        c = c[threshold_frontier(c['Bolluk_Num_cur'], FILTER_TABLE_ROWS)]
+        tables.append({"trace": i, "header": [h.format(header1, header2) for h in COMPARISON_HEADER], "empty_header": ["Durum"],
+                       "empty": COMPARISON_EMPTY,
+                       "sections": [{"slack": float_list(c['Bolluk_Num_cur']),
+                                     "cols": [{"v": c['Benzersiz_Kimlik'].astype(str).tolist()}, {"v": c['Ad_cur'].astype(str).str.slice(0, 30).tolist()},
+                                              _table_column(c[col1], 'Date' in col1), _table_column(c[col2], 'Date' in col2),
+                                              _table_column(c['Bolluk_Num_cur'], False)]}]})
+        titles.append({"index": i, "text": f"{title} (Bolluk<={{slack}})"})
+    return {"today": None, "rows": FILTER_TABLE_ROWS, "tables": tables, "titles": titles}
+
+def _focus_cell(value, is_date):
+    if is_date: return format_date_tr(value)
+    return None if pd.isna(value) else float(value)
+
+def comparison_focus(df_c, df_b, uid):
+    # Aranan aktivitenin girdiği kıyas tablolarındaki satırı (eşik dışında kalsa da); tarayıcıda tablonun
+    # başına sabitlenip vurgulanır (PLOT_SHELL pinFocus). Kıyasa girmiyorsa None
+    a = get_comparison(df_c, df_b).active
+    if uid not in a.index: return None
+    row = a.loc[[uid]].iloc[:1]; r = row.iloc[0]; tables = []
+    for i, (_, flag, col1, _, col2, _) in enumerate(COMPARISON_TABLES):
+        if not bool((row[flag] if isinstance(flag, str) else flag(row)).iloc[0]): continue
+        tables.append({"trace": i, "cells": [uid, str(r['Ad_cur'])[:30], _focus_cell(r[col1], 'Date' in col1),
+                                             _focus_cell(r[col2], 'Date' in col2), _focus_cell(r['Bolluk_Num_cur'], False)]})
+    return {"id": uid, "tables": tables} if tables else None
+
+# --- GÖRÜNÜM ÜRETİCİLERİ ---
+# Widget'lara dokunmazlar; arka plan iş parçacığında çalışıp Plotly figürü (veya mesaj HTML'i)
+# ve KPI verisi döndürürler.
+# Sonuçlar ana iş parçacığında ProjectApp.update_* metotlarıyla ekrana basılır.
+def build_dashboard(df, slack_limit=NEAR_CRITICAL_SLACK, horizon=LOOKAHEAD_DAYS):
+    index = get_index(df)
+    today = pd.Timestamp.now(); start = index.dates('Başlangıç_Date').min(); finish = index.dates('Bitiş_Date').max()
+    total = (finish-start).days; elapsed = max(0, (today-start).days)
+    summ = df[df['Benzersiz_Kimlik']=="1"]
+    prog = summ.iloc[0]['Tamamlanma_Yüzdesi']*100 if not summ.empty else df['Tamamlanma_Yüzdesi'].mean()*100
+    
+    kpis = [("Toplam Süre", f"{total} GÜN", "#0078D7"), ("Geçen Süre", f"{elapsed} GÜN", "#FF9800"), ("İlerleme", f"%{prog:.1f}", "#9C27B0")]
+
+    fig = make_subplots(
+        rows=2, cols=2, 
+        specs=[[{"type":"indicator"}, {"type":"table", "rowspan":2}], [{"type":"domain"}, None]], 
+        column_widths=[0.4, 0.6],
+        subplot_titles=("", RISK_TITLE.format(horizon=horizon, slack=slack_limit))
+    )
+
+    t_prog = min(100, (elapsed/total)*100) if total>0 else 0
+    fig.add_trace(go.Indicator(mode="gauge+number+delta", value=prog, delta={'reference': t_prog}, gauge={'axis':{'range':[None,100]}, 'bar':{'color':"#0078D7"}, 'threshold':{'line':{'color':'red','width':4}, 'value':t_prog}}), row=1, col=1)
+    
+    target_date = today + timedelta(days=horizon)
+    cols = ['Benzersiz_Kimlik', 'Ad', 'Bolluk_Num']
+    picks = []
+    for label, part, col in RISK_SECTIONS:
+        c = df.iloc[index.dates(col, part).between(hi=target_date)]
+        picks.append((label, c[c['Bolluk_Num'] <= slack_limit].head(FILTER_TABLE_ROWS), col))
+    comb = pd.concat([p[cols].assign(Kategori=label, Tarih_Gosterim=p[col]) for label, p, col in picks])
+
+    if not comb.empty:
+        tarihler = comb['Tarih_Gosterim'].apply(format_date_tr)
+        fig.add_trace(go.Table(
+            header=dict(values=RISK_HEADER, 
+                        fill_color='#2c3e50', font=dict(color='white')), 
+            cells=dict(values=[comb['Benzersiz_Kimlik'], comb['Kategori'], comb['Ad'].str.slice(0,40), tarihler, comb['Bolluk_Num']], 
+                       fill_color='#ecf0f1', font=dict(color='black'))
+        ), row=1, col=2)
+    else:
+        fig.add_trace(go.Table(header=dict(values=["Bilgi"], fill_color='#2c3e50', font=dict(color='white')),
+                               cells=dict(values=[[RISK_EMPTY]], fill_color='#ecf0f1', font=dict(color='black'))), row=1, col=2)
+    
+    cnt = df['Durum'].value_counts(); cnt = cnt[cnt > 0]
+    fig.add_trace(go.Pie(labels=cnt.index.astype(str), values=cnt.values, hole=.5, marker_colors=['#e74c3c', '#3498db', '#2ecc71']), row=2, col=1)
+    fig.update_layout(margin=dict(l=10, r=10, t=30, b=10), font={'family':"Segoe UI"})
+    return kpis, fig
+
+def build_comparison(df_c, df_b, slack_limit=NEAR_CRITICAL_SLACK):
+    comp = get_comparison(df_c, df_b)
+    fig = make_subplots(rows=2, cols=2, 
+        subplot_titles=[f"{t[0]} (Bolluk<={slack_limit})" for t in COMPARISON_TABLES], 
+        specs=[[{"type": "table"}, {"type": "table"}], [{"type": "table"}, {"type": "table"}]])
+
+    def add_comp_table(data, col1, header1, col2, header2, row, col):
+        if data.empty:
+            fig.add_trace(go.Table(header=dict(values=["Durum"], fill_color='#34495e', font=dict(color='white')), cells=dict(values=[[COMPARISON_EMPTY]], fill_color='#ecf0f1', font=dict(color='black'))), row=row, col=col)
+        else:
+            top = data.head(FILTER_TABLE_ROWS)
+            v1 = top[col1].apply(format_date_tr) if 'Date' in col1 else top[col1]
+            v2 = top[col2].apply(format_date_tr) if 'Date' in col2 else top[col2]
+            fig.add_trace(go.Table(
+                header=dict(values=[h.format(header1, header2) for h in COMPARISON_HEADER], fill_color='#34495e', font=dict(color='white')),
+                cells=dict(values=[top['Benzersiz_Kimlik'], top['Ad_cur'].str.slice(0, 30), v1, v2, top['Bolluk_Num_cur']], fill_color='#ecf0f1', font=dict(color='black'))
+            ), row=row, col=col)
+
+    for i, (_, flag, col1, header1, col2, header2) in enumerate(COMPARISON_TABLES):
+        add_comp_table(comp.select(flag, slack_limit), col1, header1, col2, header2, i // 2 + 1, i % 2 + 1)
+
+    fig.update_layout(height=800, margin=dict(l=10, r=10, t=50, b=10), font={'family': "Segoe UI"})
+    return fig
+
+# --- GANTT MOTORU ---
+# Satırlar Benzersiz_Kimlik ile anahtarlanır (aynı adlı aktiviteler ayrı satırdır) ve İKY (WBS)
+# koduna göre ağaçlanır. Kapalı bir düğüm alt kırılımlarını özetler (gizli sayısı, en düşük bolluk).
+# Her çizimde yalnızca görünen pencere (GANTT_PAGE_SIZE satır) figüre girer; yük, program ne kadar
+# büyük olursa olsun sınırlıdır.
+GANTT_PAGE_SIZE = 40
+GANTT_ROW_HEIGHT = 32
+
+def _wbs_sort_key(code):
+    return tuple((int(p), "") if p.isdigit() else (float("inf"), p) for p in code.split("."))
+
+def wbs_tree(codes):
+    # codes: İKY metinleri. Dönüş: (sıra, ebeveyn konumu [-1 kök], derinlik) — konumlar sıralı düzene göredir
+    order = sorted(range(len(codes)), key=lambda i: _wbs_sort_key(codes[i]))
+    codes = [codes[i] for i in order]
+    pos = {}
+    for i, code in enumerate(codes): pos.setdefault(code, i)
+    parent = np.full(len(codes), -1, dtype=np.int64)
+    for i, code in enumerate(codes):
+        parts = code.split(".")
+        # Filtre dışında kalan ara seviyeler atlanır; en yakın mevcut ata ebeveyn olur
+        for k in range(len(parts) - 1, 0, -1):
+            p = pos.get(".".join(parts[:k]))
+            if p is not None and p != i: parent[i] = p; break
+    depth = np.zeros(len(codes), dtype=np.int64)
+    for i in range(len(codes)):
+        if parent[i] >= 0: depth[i] = depth[parent[i]] + 1
+    return np.asarray(order, dtype=np.int64), parent, depth
+
+class GanttModel:
+    def __init__(self, data):
+        self.code_pos = {}
+        if 'İKY' in data.columns:
+            codes = data['İKY'].astype(str).str.strip().tolist()
+            order, self.parent, self.depth = wbs_tree(codes)
+            for i, j in enumerate(order.tolist()): self.code_pos.setdefault(codes[j], i)
+        else:
+            order = np.argsort(data['Başlangıç_Date'].to_numpy(), kind='stable')
+            self.parent = np.full(len(data), -1, dtype=np.int64); self.depth = np.zeros(len(data), dtype=np.int64)
+        data = data.iloc[order]
+        self.ids = data['Benzersiz_Kimlik'].astype(str).to_numpy(dtype=object)
+        self.names = data['Ad'].astype(str).to_numpy(dtype=object)
+        self.start = data['Başlangıç_Date'].reset_index(drop=True)
+        self.finish = data['Bitiş_Date'].reset_index(drop=True)
+        self.progress = data['Tamamlanma_Yüzdesi'].fillna(0).to_numpy(dtype=float)
+        self.slack = data['Bolluk_Num'].to_numpy(dtype=float)
+        self.pos = {key: i for i, key in enumerate(self.ids)}
+        self.max_depth = int(self.depth.max()) if len(self.depth) else 0
+        self.levels = [np.flatnonzero(self.depth == d) for d in range(self.max_depth + 1)]
+        self.set_slack_limit(None)
+
+        # Eksen aralığı tüm küme için sabittir; sayfalar arasında ölçek kaymaz
+        start_min, end_max = self.start.min(), self.finish.max()
+        buffer = (end_max - start_min) * 0.05
+        if buffer.days < 5: buffer = timedelta(days=5)
+        self.x_range = [start_min - buffer, end_max + buffer]
+
+    def __len__(self): return len(self.ids)
+
+    def set_slack_limit(self, limit):
+        # Bolluk eşiği (None = hepsi). Eşiği geçemeyen özetler gizlenir ama ağaçta saydam kalır:
+        # altlarındaki uygun düğümler en yakın uygun ataya bağlanır (wbs_tree'deki atlama gibi).
+        # Model yeniden kurulmaz; yalnızca seviye başına vektörel geçişler yapılır.
+        self.slack_limit = limit
+        self.passes = np.ones(len(self.ids), dtype=bool) if limit is None else self.slack <= limit
+        # Üstten alta: görünen derinlik (uygun ata sayısı)
+        self.view_depth = np.zeros(len(self.ids), dtype=np.int64)
+        for idx in self.levels[1:]:
+            p = self.parent[idx]
+            self.view_depth[idx] = self.view_depth[p] + self.passes[p]
+        # Alttan üste özet: gizli alt aktivite sayısı ve alt ağacın en düşük bolluğu (yalnızca uygunlar)
+        count = self.passes.astype(np.int64)
+        self.min_slack = np.where(self.passes, self.slack, np.inf)
+        for idx in reversed(self.levels[1:]):
+            np.add.at(count, self.parent[idx], count[idx])
+            np.minimum.at(self.min_slack, self.parent[idx], self.min_slack[idx])
+        self.descendants = count - self.passes
+        self.has_children = self.passes & (self.descendants > 0)
+        self.visible_count = int(self.passes.sum())
+
+    def expanded(self, depth_limit=None, toggled=()):
+        # depth_limit: bu derinliğin altındaki düğümler açık (None = hepsi açık); toggled: elle ters çevrilenler
+        exp = np.ones(len(self.ids), dtype=bool) if depth_limit is None else self.view_depth < depth_limit
+        for key in toggled:
+            i = self.pos.get(key)
+            if i is not None: exp[i] = not exp[i]
+        return exp
+
+    def locate(self, key, code=None):
+        # Aranan aktivitenin konumu; modelde yoksa (görev ya da tamamlanmış) İKY'deki en yakın üst özet,
+        # eşiği geçemiyorsa en yakın uygun ata. Bulunamazsa None
+        i = self.pos.get(key)
+        if i is None and code:
+            parts = str(code).strip().split(".")
+            for k in range(len(parts) - 1, 0, -1):
+                i = self.code_pos.get(".".join(parts[:k]))
+                if i is not None: break
+        while i is not None and i >= 0 and not self.passes[i]: i = int(self.parent[i])
+        return i if i is not None and i >= 0 else None
+
+    def closed_ancestors(self, i, expanded):
+        # i'yi gizleyen (uygun ve kapalı) ataların kimlikleri
+        keys = []; p = self.parent[i]
+        while p >= 0:
+            if self.passes[p] and not expanded[p]: keys.append(self.ids[p])
+            p = self.parent[p]
+        return keys
+
+    def visible_rows(self, expanded):
+        # Eşik dışı atalar kapalı sayılmaz; yalnızca uygun ve kapalı bir ata alt ağacı gizler
+        reach = self.parent < 0
+        for idx in self.levels[1:]:
+            p = self.parent[idx]
+            reach[idx] = reach[p] & (expanded[p] | ~self.passes[p])
+        return np.flatnonzero(reach & self.passes)
+
+    def row_labels(self, rows, expanded):
+        labels = []
+        for i in rows:
+            mark = ("▾ " if expanded[i] else "▸ ") if self.has_children[i] else "\u00a0\u00a0"
+            label = "\u00a0" * 4 * int(self.view_depth[i]) + mark + str(self.names[i])[:60]
+            if self.has_children[i] and not expanded[i]: label += f" (+{self.descendants[i]})"
+            labels.append(label)
+        return labels
+
+    def figure(self, rows, expanded):
+        ids = self.ids[rows]; start = self.start.iloc[rows]; finish = self.finish.iloc[rows]
+        progress = self.progress[rows]
+        delta = finish - start
+        progress_end = start + delta * progress
+        hover = [f"<b>{n}</b><br>ID: {k}<br>Bolluk: {s:g} gün<br>Alt kırılımda en düşük bolluk: {m:g} gün"
+                 for n, k, s, m in zip(self.names[rows], ids, self.slack[rows], self.min_slack[rows])]
+
+        fig = go.Figure()
+        # A) PLAN ÇUBUĞU (Arka Plan - Açık Gri - Gövde)
+        fig.add_trace(go.Bar(y=ids, x=delta.dt.total_seconds() * 1000, base=start, orientation='h',
+                             marker=dict(color='#bdc3c7'), name='Plan', hovertext=hover, hoverinfo='text', showlegend=False))
+        # OK ŞEKLİ İÇİN ÜÇGEN BAŞLIK (Gri)
+        fig.add_trace(go.Scatter(y=ids, x=finish, mode='markers', marker=dict(symbol='triangle-right', size=15, color='#bdc3c7'),
+                                 showlegend=False, hoverinfo='skip'))
+        # B) İLERLEME ÇUBUĞU (Ön Plan - Koyu Renk)
+        fig.add_trace(go.Bar(y=ids, x=(progress_end - start).dt.total_seconds() * 1000, base=start, orientation='h',
+                             marker=dict(color='#2c3e50'), text=[f"{int(p * 100)}%" for p in progress],
+                             textposition='inside', insidetextanchor='middle', textfont=dict(color='white', weight='bold'),
+                             name='İlerleme', hoverinfo='skip', showlegend=False))
+        # C) TARİH ETİKETLERİ
+        fig.add_trace(go.Scatter(y=ids, x=start, mode='text', text=start.apply(format_date_short), textposition='middle left',
+                                 textfont=dict(color='#7f8c8d', size=11), hoverinfo='skip', showlegend=False))
+        fig.add_trace(go.Scatter(y=ids, x=finish, mode='text', text=finish.apply(format_date_short), textposition='middle right',
+                                 textfont=dict(color='#7f8c8d', size=11), hoverinfo='skip', showlegend=False))
+
+        # D) LAYOUT AYARLARI
+        today = pd.Timestamp.now()
+        fig.update_layout(
+            barmode='overlay',
+            height=max(300, len(rows) * GANTT_ROW_HEIGHT + 80),
+            xaxis=dict(side='top', tickformat="%Y-Q%q", range=self.x_range, gridcolor='#ecf0f1', title=""),
+            yaxis=dict(showgrid=False, type='category', autorange='reversed', tickmode='array',
+                       tickvals=list(ids), ticktext=self.row_labels(rows, expanded)),
+            plot_bgcolor='white',
+            margin=dict(l=10, r=10, t=50, b=10),
+            font=dict(family="Segoe UI"),
+            shapes=[dict(type="line", x0=today, x1=today, y0=0, y1=1, xref="x", yref="paper",
+                         line=dict(color="#e74c3c", width=2, dash="dot"))],
+            annotations=[dict(x=today, y=0, xref="x", yref="paper", text="BUGÜN", showarrow=False, yshift=10,
+                              font=dict(color="#e74c3c", size=10, weight="bold"))]
+        )
+        return fig
+
+def build_gantt(df, slack_limit=NEAR_CRITICAL_SLACK):
+    # 1. FILTRELEME
+    # Kriterler:
+    # - Özet = Evet (Sadece Özet Aktiviteler)
+    # - Benzersiz_Kimlik != '1' (En üst proje başlığını hariç tut)
+    # - Fiili_Bitiş_Date BOŞ (Yani Tamamlanmamış olanlar)
+    # - Bolluk_Num <= slack_limit: model tüm adaylarla kurulur, eşik GanttModel.set_slack_limit ile
+    #   uygulanır; arayüzde eşik değişince model yeniden kurulmaz (orada slack_limit=None ile kurulur)
+    if 'Özet' not in df.columns:
+        return "<h3>Veri hatası: 'Özet' sütunu bulunamadı.</h3>"
+
+    mask = (df['Özet'] == 'Evet') & \
+           (df['Benzersiz_Kimlik'] != '1') & \
+           (pd.isna(df['Fiili_Bitiş_Date']))
+    if not mask.any():
+        return "<h3>Kriterlere uygun (Tamamlanmamış, Özet) aktivite bulunamadı.</h3><p>Filtre: Özet='Evet', ID!=1, Fiili Bitiş=Yok</p>"
+    model = GanttModel(df[mask]); model.set_slack_limit(slack_limit)
+    return model if model.visible_count else gantt_empty_html(slack_limit)
+
+def gantt_empty_html(slack_limit):
+    return f"<h3>Kriterlere uygun (Tamamlanmamış, Özet, Kritik) aktivite bulunamadı.</h3><p>Filtre: Özet='Evet', Bolluk<={slack_limit:g}, ID!=1, Fiili Bitiş=Yok</p>"
+
+TIMELINE_WEBGL_MIN_ROWS = 1000
+
+def iso_dates(series):
+    # Tarih sütununu tek seferde ISO metnine çevirir; NaT -> None (grafikte boşluk)
+    out = np.datetime_as_string(series.to_numpy(dtype='datetime64[s]'), unit='s').astype(object)
+    out[series.isna().to_numpy()] = None
+    return out
+
+TIMELINE_FOCUS_ROWS = 15  # aranan aktivite seçilince y ekseni bu kadar satır yukarı/aşağı yakınlaşır
+
+def timeline_rows(df):
+    return df[(df['Özet']=='Evet') & (df['Kritik']==True)]
+
+def build_timeline(df):
+    data = timeline_rows(df)
+    if data.empty: return "<h3>Veri Yok</h3>"
+    # Sabit sayıda iz: tüm başlangıç-bitiş çizgileri tek bir çizgi izinde (aralarında None boşluğu),
+    # bitiş noktaları tek bir işaret izinde. Büyük verilerde WebGL (Scattergl) kullanılır.
+    n = len(data)
+    scatter = go.Scattergl if n > TIMELINE_WEBGL_MIN_ROWS else go.Scatter
+    names = data['Ad'].to_numpy(dtype=object)
+    starts, finishes = iso_dates(data['Başlangıç_Date']), iso_dates(data['Bitiş_Date'])
+
+    seg_x = np.full(n * 3, None, dtype=object); seg_x[0::3] = starts; seg_x[1::3] = finishes
+    seg_y = np.full(n * 3, None, dtype=object); seg_y[0::3] = names; seg_y[1::3] = names
+
+    sizes = data['Süre_Num'].to_numpy(dtype=float)
+    fig = go.Figure()
+    fig.add_trace(scatter(x=seg_x, y=seg_y, mode='lines', line=dict(color='gray', width=1), hoverinfo='skip', showlegend=False, connectgaps=False))
+    fig.add_trace(scatter(
+        x=finishes, y=names, mode='markers', showlegend=False,
+        marker=dict(size=sizes, sizemode='area', sizeref=(np.nanmax(sizes) or 1) / 20 ** 2, sizemin=0,
+                    color=data['Tamamlanma_Yüzdesi'].to_numpy(dtype=float), coloraxis='coloraxis'),
+        hovertemplate="Bitiş_Date=%{x}<br>Ad=%{y}<br>Süre_Num=%{marker.size}<br>Tamamlanma_Yüzdesi=%{marker.color}<extra></extra>"
+    ))
+    fig.update_layout(coloraxis=dict(colorbar=dict(title=dict(text='Tamamlanma_Yüzdesi'))), xaxis_title="Bitiş_Date", yaxis_title="Ad")
+    fig.update_yaxes(autorange="reversed")
+    return fig
+
+def timeline_focus(df, uid, code=None):
+    # Aranan aktivitenin (yoksa İKY'deki en yakın üst özetin) zaman çizelgesi y kategorisindeki sırası.
+    # Kategoriler adların ilk geçiş sırasıdır (build_timeline). Dönüş: {"id", "pos", "count", "window"} ya da None
+    data = timeline_rows(df)
+    if data.empty: return None
+    ids = data['Benzersiz_Kimlik'].to_numpy(dtype=object); hit = np.flatnonzero(ids == uid)
+    if not len(hit) and code and 'İKY' in data.columns:
+        codes = data['İKY'].astype(str).str.strip().to_numpy(dtype=object); parts = str(code).strip().split(".")
+        for k in range(len(parts) - 1, 0, -1):
+            hit = np.flatnonzero(codes == ".".join(parts[:k]))
+            if len(hit): break
+    if not len(hit): return None
+    names = pd.Index(pd.unique(data['Ad'].to_numpy(dtype=object)))
+    pos = int(names.get_indexer([data['Ad'].iloc[hit[0]]])[0])
+    return {"id": ids[hit[0]], "pos": pos, "count": len(names), "window": TIMELINE_FOCUS_ROWS}
+
+def build_insights(df_curr, df_base=None):
+    html = """
+    <html><head><style>
+        body { font-family: 'Segoe UI', sans-serif; background-color: white; color: #2c3e50; padding: 20px; }
+        h2 { color: #0078D7; border-bottom: 2px solid #eee; padding-bottom: 10px; margin-bottom: 20px;}
+        h3 { color: #c0392b; margin-top: 30px; font-size: 18px; display: flex; align-items: center;}
+        .category { background: #ecf0f1; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 5px solid #bdc3c7; }
+        .cat-critical { border-left-color: #e74c3c; background: #fdedec; }
+        .cat-delay { border-left-color: #f39c12; background: #fef9e7; }
+        .cat-compare { border-left-color: #3498db; background: #ebf5fb; }
+        p { margin: 0 0 10px 0; line-height: 1.6; }
+        b { color: #2c3e50; }
+    </style></head><body>
+    """
+    html += "<h2>🤖 Proje Analiz Raporu</h2>"
+    
+    index = get_index(df_curr)
+
+    crit_active = index.dates('Başlangıç_Date', 'critical')
+    html += "<div class='category cat-critical'>"
+    html += "<h3>🔥 Kritik Hat Analizi</h3>"
+    if not len(crit_active):
+        html += "<p>Projede şu an kritik hat üzerinde aktif (tamamlanmamış) bir aktivite bulunmamaktadır.</p>"
+    else:
+        count = len(crit_active)
+        html += f"<p>Proje genelinde bitiş tarihini doğrudan etkileyen <b>{count} adet</b> aktif kritik aktivite bulunmaktadır.</p>"
+        for _, row in df_curr.iloc[crit_active.rows[:3]].iterrows():
+            tarih = format_date_tr(row['Bitiş_Date'])
+            html += f"<p>➡ <b>{row['Ad']}</b> aktivitesi şu an kritik yoldadır ve {tarih} tarihinde bitmesi planlanmaktadır.</p>"
+    html += "</div>"
+
+    today = pd.Timestamp.now()
+    # Bitişi geçmiş, tamamlanmamış görevler; en çok gecikenler önce
+    delayed = index.dates('Bitiş_Date', 'not_finished').before(today)
+    
+    if len(delayed):
+        html += "<div class='category cat-delay'>"
+        html += "<h3>🚫 Mevcut Gecikmeler</h3>"
+        html += f"<p>Planlanan bitiş tarihi geçmiş olmasına rağmen henüz tamamlanmamış <b>{len(delayed)}</b> aktivite tespit edilmiştir.</p>"
+        for _, row in df_curr.iloc[delayed[:3]].iterrows():
+            delay = (today - row['Bitiş_Date']).days
+            html += f"<p>➡ <b>{row['Ad']}</b> aktivitesinin {delay} gün önce bitmesi gerekiyordu.</p>"
+        html += "</div>"
+
+    if df_base is not None:
+        html += "<div class='category cat-compare'>"
+        html += "<h3>⚖️ Baseline Karşılaştırma Analizi</h3>"
+        
+        comp = get_comparison(df_curr, df_base)
+        newly_critical = comp.select('Yeni_Kritik')
+        if not newly_critical.empty:
+            for _, row in newly_critical.head(3).iterrows():
+                html += f"<p>⚠️ <b>{row['Ad_cur']}</b> aktivitesi önceki planda kritik değilken, şu an kritik yola girmiştir.</p>"
+        
+        compressed = comp.select(lambda a: a['Süre_Fark'] > 0)
+        if not compressed.empty:
+            for _, row in compressed.head(3).iterrows():
+                html += f"<p>⚡ <b>{row['Ad_cur']}</b> aktivitesinin süresi <b>{int(row['Süre_Fark'])} gün</b> kısaltılmıştır.</p>"
+
+        start_delayed = comp.select('Başlama_Gecikti')
+        if not start_delayed.empty:
+            row = start_delayed.iloc[0]
+            t1 = format_date_tr(row['Başlangıç_Date_base'])
+            t2 = format_date_tr(row['Başlangıç_Date_cur'])
+            html += f"<p>📉 <b>{row['Ad_cur']}</b> aktivitesinin başlaması gerekiyordu ({t1}) ancak güncel planda {t2} tarihine ötelenmiştir.</p>"
+
+        html += "</div>"
+    html += "</body></html>"
+    return html
+
+# --- EĞİLİMLER (PROGRAM GEÇMİŞİ) ---
+# history_store sorgu sonuçlarından (DataFrame) çizilir; ayrıştırma ya da veritabanı erişimi yapmaz.
+TREND_SLIP_ROWS = 10  # Kayanlar tablosunda güncelleme başına gösterilen en çok kayan aktivite
+
+def build_trends(snaps, slips, history=None, activity=None, last_n=5):
+    if snaps.empty: return "<h3 style='font-family:Segoe UI; padding:20px; color:#7f8c8d'>Bu proje için geçmiş kaydı yok. Program yüklendikçe geçmişe eklenir.</h3>"
+    has_history = history is not None and not history.empty
+    rows = 4 if has_history else 3
+    specs = [[{}, {}], [{"secondary_y": True}, {}], [{"type": "table", "colspan": 2}, None]]
+    titles = ["Proje Bitiş Tarihi", "İlerleme Eğrisi (%)", "Bolluk Erimesi (açık aktiviteler)", f"Son {last_n} Güncellemede Kayan Aktivite Sayısı", "En Çok Kayanlar"]
+    if has_history:
+        specs.append([{"colspan": 2, "secondary_y": True}, None]); titles.append(f"Aktivite {activity}: {history['name'].iloc[-1]}")
+    fig = make_subplots(rows=rows, cols=2, specs=specs, subplot_titles=titles, vertical_spacing=0.08,
+                        row_heights=[0.22, 0.22, 0.3, 0.26][:rows])
+    dates = iso_dates(snaps['status_date'])
+    fig.add_trace(go.Scatter(x=dates, y=iso_dates(snaps['finish']), mode='lines+markers', name="Bitiş", line=dict(color='#c0392b')), row=1, col=1)
+    fig.add_trace(go.Scatter(x=dates, y=snaps['progress'] * 100, mode='lines+markers', name="İlerleme", line=dict(color='#9C27B0')), row=1, col=2)
+    fig.add_trace(go.Scatter(x=dates, y=snaps['mean_slack'], mode='lines+markers', name="Ort. bolluk (gün)", line=dict(color='#0078D7')), row=2, col=1)
+    fig.add_trace(go.Bar(x=dates, y=snaps['critical'], name="Kritik", marker_color='#e74c3c', opacity=0.5), row=2, col=1, secondary_y=True)
+
+    # Kayan sayısı: son N güncellemenin hepsi gösterilir (kayan yoksa 0)
+    recent = snaps['status_date'].iloc[-last_n:]
+    counts = slips.groupby('status_date').size().reindex(recent, fill_value=0)
+    fig.add_trace(go.Bar(x=iso_dates(recent), y=counts.to_numpy(), name="Kayan", marker_color='#f39c12'), row=2, col=2)
+    top = slips.groupby('status_date', sort=False).head(TREND_SLIP_ROWS)
+    if top.empty:
+        fig.add_trace(go.Table(header=dict(values=["Bilgi"]), cells=dict(values=[["Son güncellemelerde bitişi kayan aktivite yok."]])), row=3, col=1)
+    else:
+        fig.add_trace(go.Table(
+            header=dict(values=["Güncelleme", "Aktivite ID", "Aktivite", "Kayma (gün)", "Yeni Bitiş", "Bolluk", "Bolluk Değişimi"], fill_color='#2c3e50', font=dict(color='white')),
+            cells=dict(values=[top['status_date'].apply(format_date_short), top['uid'], top['name'].str.slice(0, 40), top['finish_slip'],
+                               top['finish'].apply(format_date_tr), top['slack'], top['slack_change']], fill_color='#ecf0f1', font=dict(color='black'))
+        ), row=3, col=1)
+    if has_history:
+        hist_dates = iso_dates(history['status_date'])
+        fig.add_trace(go.Scatter(x=hist_dates, y=history['slack'], mode='lines+markers', name="Bolluk (gün)", line=dict(color='#0078D7')), row=4, col=1)
+        fig.add_trace(go.Scatter(x=hist_dates, y=iso_dates(history['finish']), mode='lines+markers', name="Bitiş", line=dict(color='#c0392b', dash='dot')), row=4, col=1, secondary_y=True)
+    fig.update_layout(height=1350 if has_history else 1050, margin=dict(l=10, r=10, t=50, b=10), font={'family': "Segoe UI"}, showlegend=False)
+    return fig
+
+# --- HTML RAPOR ---
+# Tek dosyalık rapor: plotly.js sayfaya bir kez gömülür, açmak için ağ bağlantısı veya uygulama gerekmez.
+# Gantt, masaüstündeki sayfalama yerine REPORT_GANTT_DEPTH seviyesine kadar açık tek figürdür.
+REPORT_GANTT_DEPTH = 2
+REPORT_STYLE = """
+    body { font-family: 'Segoe UI', sans-serif; background-color: #f3f3f3; color: #2c3e50; margin: 0; padding: 20px; }
+    h1 { font-size: 22px; margin: 0 0 15px 0; } h2 { color: #0078D7; font-size: 18px; margin: 30px 0 10px 0; }
+    .kpis { display: flex; gap: 15px; } .section { background: white; border-radius: 8px; padding: 10px; }
+    .kpi { background: white; border-radius: 8px; border: 1px solid #e0e0e0; width: 220px; padding: 15px; }
+    .kpi .t { color: #7f8c8d; font-size: 12px; font-weight: bold; } .kpi .v { font-size: 22px; font-weight: bold; }
+    iframe { width: 100%; height: 600px; border: none; }
+"""
+
+def build_report(df_c, df_b=None, title="Proje Raporu"):
+    kpis, dash_fig = build_dashboard(df_c)
+    gantt = build_gantt(df_c)
+    if isinstance(gantt, GanttModel):
+        expanded = gantt.expanded(REPORT_GANTT_DEPTH)
+        gantt = gantt.figure(gantt.visible_rows(expanded), expanded)
+    sections = [("🚀 Yönetici Özeti", dash_fig)]
+    if df_b is not None: sections.append(("⚖️ Kıyas Tablosu", build_comparison(df_c, df_b)))
+    sections += [("📅 Kritik Hat (Gantt)", gantt), ("⏳ Zaman Çizelgesi", build_timeline(df_c))]
+
+    cards = "".join(f"<div class='kpi' style='border-left: 5px solid {color}'><div class='t'>{escape(t)}</div>"
+                    f"<div class='v' style='color: {color}'>{escape(v)}</div></div>" for t, v, color in kpis)
+    body = [f"<h1>{escape(title)}</h1>", f"<div class='kpis'>{cards}</div>"]
+    include_js = True
+    for name, content in sections:
+        if isinstance(content, str): html = content
+        else:
+            html = content.to_html(full_html=False, include_plotlyjs=include_js, config={"displaylogo": False})
+            include_js = False
+        body.append(f"<h2>{name}</h2><div class='section'>{html}</div>")
+    # Analiz notları kendi stilleriyle gelir; sayfanın geri kalanını etkilememesi için iframe içinde
+    body.append(f"<h2>🤖 Analiz & Notlar</h2><div class='section'><iframe srcdoc=\"{escape(build_insights(df_c, df_b))}\"></iframe></div>")
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{escape(title)}</title>"
+            f"<style>{REPORT_STYLE}</style></head><body>{''.join(body)}</body></html>")
@@ -0,0 +1,91 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from project_core import PARSER_VERSION, process_data, build_report
+from schedule_cache import ScheduleCache
+
+# --- TOPLU RAPOR (KOMUT SATIRI) ---
+# Masaüstü oturumu gerektirmez, PyQt6 içe aktarılmaz. Her proje ayrı bir süreçte işlenir; süreçler
+# arasında yalnızca dosya yolları taşınır, böylece iş hacmi çekirdek sayısıyla birlikte artar.
+#   python report_cli.py guncel_A.xlsx -p guncel_B.xlsx baseline_B.xlsx -l projeler.txt -o raporlar -j 8
+# Liste dosyasında her satır "güncel;baseline" (baseline isteğe bağlı), '#' ile başlayanlar yorumdur.
+
+def read_list(path):
+    pairs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"): continue
+            current, _, baseline = line.partition(";")
+            pairs.append((current.strip(), baseline.strip() or None))
+    return pairs
+
+def output_paths(pairs, out_dir):
+    # Aynı adlı dosyalar farklı klasörlerden gelebilir; rapor adları çakışmasın
+    used = set(); paths = []
+    for current, _ in pairs:
+        stem = os.path.splitext(os.path.basename(current))[0]; name = stem; i = 2
+        while name.lower() in used: name = f"{stem}_{i}"; i += 1
+        used.add(name.lower()); paths.append(os.path.join(out_dir, f"{name}_rapor.html"))
+    return paths
+
+def make_report(current, baseline, out_path, use_cache):
+    started = time.perf_counter()
+    cache = None
+    if use_cache:
+        try: cache = ScheduleCache(PARSER_VERSION)
+        except OSError: cache = None
+    load = (lambda p: cache.load(p, process_data)) if cache else process_data
+    df_c = load(current)
+    df_b = load(baseline) if baseline else None
+    title = os.path.splitext(os.path.basename(current))[0]
+    html = build_report(df_c, df_b, title=title)
+    with open(out_path, "w", encoding="utf-8") as f: f.write(html)
+    return time.perf_counter() - started
+
+def safe_report(*task):
+    # Bir projedeki hata diğerlerini durdurmaz; (süre, hata metni) döner
+    try: return make_report(*task), None
+    except Exception as e: return None, f"{type(e).__name__}: {e}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Güncel/baseline program çiftlerinden tek dosyalık HTML raporlar üretir.")
+    parser.add_argument("current", nargs="*", help="Baseline'sız güncel program dosyaları (.xlsx/.csv/.xml)")
+    parser.add_argument("-p", "--pair", nargs=2, action="append", default=[], metavar=("GÜNCEL", "BASELINE"), help="Güncel ve baseline dosya çifti (tekrarlanabilir)")
+    parser.add_argument("-l", "--list", dest="list_file", help="Her satırı 'güncel;baseline' olan liste dosyası")
+    parser.add_argument("-o", "--output", default="raporlar", help="Raporların yazılacağı klasör (varsayılan: raporlar)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Paralel süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--no-cache", action="store_true", help="Ayrıştırma önbelleğini kullanma")
+    args = parser.parse_args(argv)
+
+    pairs = [(c, None) for c in args.current] + [tuple(p) for p in args.pair]
+    if args.list_file: pairs += read_list(args.list_file)
+    if not pairs: parser.error("En az bir güncel program dosyası verilmelidir.")
+    os.makedirs(args.output, exist_ok=True)
+    outputs = output_paths(pairs, args.output)
+    tasks = [(c, b, out, not args.no_cache) for (c, b), out in zip(pairs, outputs)]
+
+    started = time.perf_counter(); failed = 0
+    workers = max(1, min(args.jobs, len(tasks)))
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if pool:
+            futures = {pool.submit(safe_report, *task): task for task in tasks}
+            outcomes = ((futures[f], f.result()) for f in as_completed(futures))
+        else:
+            outcomes = ((task, safe_report(*task)) for task in tasks)
+        for (current, _, out, _), (elapsed, error) in outcomes:
+            if error: failed += 1; print(f"✖ {current}: {error}", file=sys.stderr)
+            else: print(f"✔ {out} ({elapsed:.1f} sn)")
+    finally:
+        if pool: pool.shutdown()
+    print(f"{len(tasks) - failed}/{len(tasks)} rapor, {workers} süreç, {time.perf_counter() - started:.1f} sn")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import pickle
+import threading
+from importlib.util import find_spec
+
+# --- AYRIŞTIRILMIŞ PROGRAM ÖNBELLEĞİ ---
+# process_data çıktısı, kaynak dosyanın içerik özeti (hash) ve boyutuyla anahtarlanıp
+# kullanıcıya özel bir klasörde sütunsal formatta (Feather, pyarrow yoksa pickle) saklanır.
+# Ayrıştırıcı sürümü anahtarın parçasıdır; sürüm değişince eski kayıtlar kullanılmaz ve silinir.
+# pandas/pyarrow burada içe aktarılmaz (masaüstü uygulamasının açılışını yavaşlatır); pyarrow'un
+# yalnızca kurulu olup olmadığına bakılır, okuma sırasında içe aktarılır.
+
+HAS_ARROW = find_spec("pyarrow") is not None  # Feather için gerekli, yoksa pickle kullanılır
+
+DEFAULT_LIMIT_BYTES = 512 * 1024 * 1024
+
+def default_cache_dir():
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ProjePaneli", "cache")
+
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""): h.update(chunk)
+    return h.hexdigest()
+
+class ScheduleCache:
+    def __init__(self, version, directory=None, limit_bytes=DEFAULT_LIMIT_BYTES):
+        self.version = str(version)
+        self.directory = directory or default_cache_dir()
+        self.limit_bytes = limit_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._drop_stale_versions()
+
+    def key(self, path):
+        return f"v{self.version}-{os.path.getsize(path)}-{file_digest(path)}"
+
+    def _entries(self):
+        for name in os.listdir(self.directory):
+            if name.endswith((".feather", ".pkl")): yield os.path.join(self.directory, name)
+
+    def _drop_stale_versions(self):
+        prefix = f"v{self.version}-"
+        for entry in self._entries():
+            if not os.path.basename(entry).startswith(prefix): self._remove(entry)
+
+    def _remove(self, entry):
+        try: os.remove(entry)
+        except OSError: pass
+
+    def get(self, key):
+        for ext in (".feather", ".pkl"):
+            entry = os.path.join(self.directory, key + ext)
+            if not os.path.exists(entry): continue
+            try:
+                if ext == ".feather":
+                    if not HAS_ARROW: continue
+                    import pandas as pd
+                    df = pd.read_feather(entry)
+                else:
+                    with open(entry, "rb") as f: df = pickle.load(f)
+            except Exception:
+                # Bozuk/yarım kalmış kayıt: sil ve yeniden ayrıştır
+                self._remove(entry); continue
+            os.utime(entry)  # LRU için son kullanım zamanı
+            return df
+        return None
+
+    def put(self, key, df):
+        # Aynı anda iki yükleme aynı dosyayı yazabilir; geçici dosya iş parçacığına özeldir
+        tmp = os.path.join(self.directory, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        entry = None
+        if HAS_ARROW:
+            try:
+                df.to_feather(tmp); entry = os.path.join(self.directory, key + ".feather")
+            except Exception:
+                # Karışık tipli sütunlar Arrow'a çevrilemeyebilir; pickle'a düş
+                entry = None
+        if entry is None:
+            with open(tmp, "wb") as f: pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+            entry = os.path.join(self.directory, key + ".pkl")
+        os.replace(tmp, entry)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for entry in self._entries():
+            try:
+                st = os.stat(entry); entries.append((st.st_mtime, st.st_size, entry))
+            except OSError: pass
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.limit_bytes: break
+            self._remove(entry); total -= size
+
+    def load(self, path, loader):
+        return self.load_keyed(path, loader)[0]
+
+    def load_keyed(self, path, loader):
+        # Önbellekte varsa oradan, yoksa loader(path) ile ayrıştırıp kaydeder; (df, anahtar) döner
+        try: key = self.key(path)
+        except OSError: return loader(path), None
+        df = self.get(key)
+        if df is not None: return df, key
+        df = loader(path)
+        try: self.put(key, df)
+        except OSError: pass
+        return df, key
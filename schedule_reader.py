@@ -0,0 +1,88 @@
+import importlib.util
+import numpy as np
+import pandas as pd
+
+# --- SÜTUN BUDAMALI OKUYUCU ---
+# MS Project dışa aktarımlarında 60+ alan bulunur; uygulama yalnızca aşağıdakileri kullanır.
+# Gerekli sütunlar okumaya başlamadan başlıktan çözülür, eksikse dosyanın geri kalanı hiç okunmaz.
+REQUIRED_COLUMNS = ['Benzersiz_Kimlik', 'Ad', 'Tamamlanma_Yüzdesi', 'Süre', 'Başlangıç', 'Bitiş',
+                    'Fiili_Başlangıç', 'Fiili_Bitiş', 'Toplam_Bolluk']
+OPTIONAL_COLUMNS = ['Özet', 'İKY', 'Öncüller']
+COLUMN_ALIASES = {'Unique_ID': 'Benzersiz_Kimlik'}
+# Metin olarak okunup sonradan ayrıştırılan sütunlar (CSV'de tip tahmini yapılmaz)
+TEXT_COLUMNS = ['Ad', 'Süre', 'Başlangıç', 'Bitiş', 'Fiili_Başlangıç', 'Fiili_Bitiş', 'Toplam_Bolluk', 'Özet', 'İKY', 'Öncüller']
+CSV_CHUNK_ROWS = 50_000
+
+HAS_CALAMINE = importlib.util.find_spec("python_calamine") is not None
+
+def resolve_columns(header):
+    # header: dosyadaki ham başlıklar. Dönüş: {uygulamadaki ad: ham başlık}
+    stripped = {str(h).strip(): h for h in header if h is not None}
+    if 'Benzersiz_Kimlik' not in stripped:
+        for alias, target in COLUMN_ALIASES.items():
+            if alias in stripped: stripped[target] = stripped.pop(alias)
+    if 'Benzersiz_Kimlik' not in stripped: raise ValueError("Dosyada 'Benzersiz_Kimlik' sütunu bulunamadı!")
+    for col in REQUIRED_COLUMNS:
+        if col not in stripped: raise ValueError(f"Dosyada '{col}' sütunu bulunamadı!")
+    return {col: stripped[col] for col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS if col in stripped}
+
+def read_csv_pruned(path):
+    mapping = resolve_columns(pd.read_csv(path, nrows=0).columns)
+    raw_names = list(mapping.values())
+    dtype = {mapping[c]: str for c in TEXT_COLUMNS if c in mapping}
+    chunks = pd.read_csv(path, usecols=raw_names, dtype=dtype, chunksize=CSV_CHUNK_ROWS)
+    df = pd.concat(chunks, ignore_index=True)
+    return df.rename(columns={raw: col for col, raw in mapping.items()})[list(mapping)]
+
+def _infer_numeric(series):
+    # pd.read_excel gibi: hücreler metin olarak saklansa da sütunun tamamı sayıysa sayıya çevrilir
+    if pd.api.types.is_numeric_dtype(series): return series
+    try: return pd.to_numeric(series)
+    except (ValueError, TypeError): return series
+
+def read_xlsx_pruned(path):
+    from openpyxl import load_workbook
+    # read_only: satırlar akış halinde okunur, çalışma sayfası belleğe kurulmaz
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        ws.reset_dimensions()
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        mapping = resolve_columns(header)
+        positions = {raw: i for i, raw in enumerate(header) if raw is not None}
+        picks = [(col, positions[raw]) for col, raw in mapping.items()]
+        columns = {col: [] for col, _ in picks}
+        for row in rows:
+            values = [row[i] if i < len(row) else None for _, i in picks]
+            if all(v is None for v in values): continue
+            for (col, _), v in zip(picks, values): columns[col].append(np.nan if v is None else v)
+    finally:
+        wb.close()
+    # Kırpma sayı çıkarımından önce: calamine de boşluklu hücreleri pandas'a kırpılmış verir
+    return pd.DataFrame({col: _infer_numeric(_strip(pd.Series(values))) for col, values in columns.items()})
+
+def read_xlsx_calamine(path):
+    # python-calamine kuruluysa Rust tabanlı motor; usecols ile yalnızca gerekli sütunlar dönüştürülür
+    mapping = resolve_columns(pd.read_excel(path, engine="calamine", nrows=0).columns)
+    wanted = set(mapping.values())
+    df = pd.read_excel(path, engine="calamine", usecols=lambda c: c in wanted)
+    return df.rename(columns={raw: col for col, raw in mapping.items()})[list(mapping)]
+
+def _strip(series):
+    # calamine hücre metninin baş/son boşluklarını atar (xml:space="preserve" olmayan hücrelerde XML
+    # kuralı), openpyxl ve CSV korur. Hangi motor kurulu olursa olsun aynı çerçeve çıksın diye metin
+    # hücreleri her okuyucuda kırpılır; yalnızca boşluktan oluşan hücreler boş sayılır.
+    if not pd.api.types.is_string_dtype(series): return series
+    text = series.str.strip()
+    return text.mask(text == '')
+
+def strip_text(df):
+    for col in TEXT_COLUMNS:
+        if col in df.columns: df[col] = _strip(df[col])
+    return df
+
+def read_schedule_table(path):
+    if path.lower().endswith('.csv'): return strip_text(read_csv_pruned(path))
+    if HAS_CALAMINE: return strip_text(read_xlsx_calamine(path))
+    return strip_text(read_xlsx_pruned(path))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modüller depo kökünde; testler paket kurulmadan kökten çalışır (python -m pytest tests)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
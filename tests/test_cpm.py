@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from cpm import CALENDAR_WEEKMASK, WEEKMASK, ScheduleNetwork
+
+# --- KÜÇÜK PROGRAM ---
+# 1 Proje (özet) > 1.1 Yapı (özet) > 1.1.1 A (5g) -> 1.1.2 B (3g); 1.2 C (2g, bağımsız); 1.3 D (B'nin ardılı, 2g)
+# Öncüller MS Project satır numarasıdır (özetler de sayılır). Pazartesi 2025-03-03'ten Pzt-Cum takvim.
+ROWS = [
+    # kimlik, İKY, özet, ad, süre, bolluk, başlangıç, bitiş, öncüller
+    (1, "1", "Evet", "Proje", 10, 0, "2025-03-03", "2025-03-14", None),
+    (2, "1.1", "Evet", "Yapı", 8, 0, "2025-03-03", "2025-03-12", None),
+    (3, "1.1.1", "Hayır", "A", 5, 0, "2025-03-03", "2025-03-07", None),
+    (4, "1.1.2", "Hayır", "B", 3, 0, "2025-03-10", "2025-03-12", "3"),
+    (5, "1.2", "Hayır", "C", 2, 8, "2025-03-03", "2025-03-04", None),
+    (6, "1.3", "Hayır", "D", 2, 0, "2025-03-13", "2025-03-14", "4"),
+]
+
+def schedule(rows=ROWS):
+    df = pd.DataFrame(rows, columns=['Benzersiz_Kimlik', 'İKY', 'Özet', 'Ad', 'Süre_Num', 'Bolluk_Num',
+                                     'Başlangıç_Date', 'Bitiş_Date', 'Öncüller'])
+    df['Süre_Num'] = df['Süre_Num'].astype(float); df['Bolluk_Num'] = df['Bolluk_Num'].astype(float)
+    df['Başlangıç_Date'] = pd.to_datetime(df['Başlangıç_Date']) + pd.Timedelta(hours=8)
+    df['Bitiş_Date'] = pd.to_datetime(df['Bitiş_Date']) + pd.Timedelta(hours=17)
+    df['Fiili_Başlangıç_Date'] = pd.NaT
+    return df
+
+def test_base_slack_matches_export():
+    net = ScheduleNetwork(schedule())
+    assert net.weekmask == WEEKMASK
+    assert net.slack_agreement == 1.0
+    assert net.slack().tolist() == [0, 0, 0, 0, 8, 0]
+
+def test_summaries_stay_out_of_network():
+    net = ScheduleNetwork(schedule())
+    assert not np.isin([0, 1], np.r_[net.pred, net.succ]).any()
+    assert net.rolled.tolist() == [True, True, False, False, False, False]
+
+def test_critical_edit_moves_project_summary():
+    df = schedule(); net = ScheduleNetwork(df)
+    net.set_durations({2: 10})  # A: 5 -> 10 gün
+    out = net.apply(df)
+    assert out['Bitiş_Date'].iloc[0] == pd.Timestamp("2025-03-21 17:00")
+    assert out['Bitiş_Date'].iloc[1] == pd.Timestamp("2025-03-19 17:00")
+    assert out['Süre_Num'].iloc[0] == 15
+    # Kritik hat uzadı: proje özeti kritik kalır, bağımsız C'nin bolluğu uzama kadar artar
+    assert out['Bolluk_Num'].iloc[0] == 0
+    assert out['Bolluk_Num'].iloc[4] == 13
+
+def test_summary_edits_are_ignored_and_reset_restores():
+    df = schedule(); net = ScheduleNetwork(df)
+    assert net.set_durations({0: 50}).size == 0
+    net.set_durations({2: 10}); net.reset()
+    out = net.apply(df)
+    pd.testing.assert_frame_equal(out, df, check_dtype=False)
+
+def test_summary_predecessor_expands_to_its_tasks():
+    # E, Yapı özetinin bitişine bağlı: özet bitişi en geç alt görevinin (B) bitişidir
+    rows = ROWS + [(7, "1.4", "Hayır", "E", 1, 2, "2025-03-13", "2025-03-13", "2")]
+    df = schedule(rows); net = ScheduleNetwork(df)
+    assert net.summary_links == 0
+    net.set_durations({3: 5})  # B: 3 -> 5 gün
+    out = net.apply(df)
+    assert out['Başlangıç_Date'].iloc[6] == pd.Timestamp("2025-03-17 08:00")
+
+def test_calendar_day_schedule_uses_seven_day_week():
+    rows = [(1, "1", "Evet", "Proje", 10, 0, "2025-03-01", "2025-03-10", None),
+            (2, "1.1", "Hayır", "A", 4, 0, "2025-03-01", "2025-03-04", None),
+            (3, "1.2", "Hayır", "B", 6, 0, "2025-03-05", "2025-03-10", "2")]
+    df = schedule(rows); net = ScheduleNetwork(df)
+    assert net.weekmask == CALENDAR_WEEKMASK
+    assert net.slack_agreement == 1.0
+    net.set_durations({1: 6})
+    assert net.apply(df)['Bitiş_Date'].iloc[0] == pd.Timestamp("2025-03-12 17:00")
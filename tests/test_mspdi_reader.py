@@ -0,0 +1,69 @@
+import tracemalloc
+import warnings
+
+import pytest
+
+from cpm import parse_links
+from mspdi_reader import read_mspdi
+
+# --- ÖNCÜL GECİKME BİÇİMLERİ ---
+# LinkLag, LagFormat'a göre çevrilmelidir: süre (çalışma dakikası), geçen süre (takvim dakikası), yüzde
+TASK = """<Task><UID>{uid}</UID><ID>{uid}</ID><Name>Görev {uid}</Name><OutlineNumber>{uid}</OutlineNumber>
+<Summary>0</Summary><PercentComplete>0</PercentComplete><Duration>PT40H0M0S</Duration>
+<Start>2025-03-03T08:00:00</Start><Finish>2025-03-07T17:00:00</Finish><TotalSlack>0</TotalSlack>{links}</Task>"""
+LINK = "<PredecessorLink><PredecessorUID>1</PredecessorUID><Type>1</Type><LinkLag>{lag}</LinkLag>{fmt}</PredecessorLink>"
+
+def project(tmp_path, links):
+    tasks = [TASK.format(uid=1, links="")]
+    for i, (lag, fmt) in enumerate(links, start=2):
+        tasks.append(TASK.format(uid=i, links=LINK.format(lag=lag, fmt=f"<LagFormat>{fmt}</LagFormat>" if fmt else "")))
+    path = tmp_path / "plan.xml"
+    path.write_text('<?xml version="1.0" encoding="UTF-8"?><Project xmlns="http://schemas.microsoft.com/project">'
+                    '<MinutesPerDay>480</MinutesPerDay><Tasks>' + "".join(tasks) + '</Tasks></Project>', encoding="utf-8")
+    return str(path)
+
+def test_lag_formats(tmp_path):
+    links = [(9600, 7), (9600, None), (4800, 9), (28800, 8), (500, 19), (250, 20), (0, 19)]
+    df = read_mspdi(project(tmp_path, links))
+    assert df['Öncüller'].tolist()[1:] == ["1TB+2g", "1TB+2g", "1TB+1g", "1TB+2eg", "1TB+50%", "1TB+25%", "1"]
+
+def test_percent_lag_uses_predecessor_duration(tmp_path):
+    df = read_mspdi(project(tmp_path, [(500, 19)]))
+    _, _, _, _, lag = parse_links(df)
+    assert lag.tolist() == [2.5]
+
+def test_unknown_lag_format_is_ignored_with_warning(tmp_path):
+    path = project(tmp_path, [(9600, 99)])
+    with pytest.warns(UserWarning, match="LagFormat"):
+        df = read_mspdi(path)
+    assert df['Öncüller'].tolist()[1] == "1"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        read_mspdi(project(tmp_path, [(9600, 7)]))
+
+# --- AKIŞ HALİNDE OKUMA ---
+# Atama/kaynak bölümleri öğe öğe bırakılmalı: tepe bellek atama sayısıyla büyümemeli
+ASSIGNMENT = ("<Assignment><UID>{uid}</UID><TaskUID>{task}</TaskUID><ResourceUID>1</ResourceUID><Work>PT8H0M0S</Work>"
+              "<Start>2025-03-03T08:00:00</Start><Finish>2025-03-07T17:00:00</Finish><Units>1</Units></Assignment>")
+
+def large_project(path, tasks, assignments):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?><Project xmlns="http://schemas.microsoft.com/project">'
+                '<MinutesPerDay>480</MinutesPerDay><Tasks>')
+        f.writelines(TASK.format(uid=i, links="") for i in range(1, tasks + 1))
+        f.write('</Tasks><Resources><Resource><UID>1</UID><Name>Ekip</Name></Resource></Resources><Assignments>')
+        f.writelines(ASSIGNMENT.format(uid=i, task=i % tasks + 1) for i in range(assignments))
+        f.write('</Assignments></Project>')
+    return str(path)
+
+def peak_bytes(path):
+    tracemalloc.start()
+    try:
+        read_mspdi(path); return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_assignments_do_not_grow_memory(tmp_path):
+    small = peak_bytes(large_project(tmp_path / "small.xml", 200, 1_000))
+    large = peak_bytes(large_project(tmp_path / "large.xml", 200, 50_000))
+    assert large < small + 2 * 2**20
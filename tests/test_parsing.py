@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_core import (clean_duration, clean_durations, normalize_id, normalize_ids, parse_turkish_date,
+                          parse_turkish_dates)
+
+# --- VEKTÖREL / HÜCRE BAZLI EŞDEĞERLİK ---
+# Sütun bazlı ayrıştırıcılar her hücrede eski hücre bazlı yardımcılarla aynı sonucu vermelidir
+DATES = ["Mart 20, 2026 8:00 AM", "Şubat 3, 2025 5:00 PM", "Ağustos 16, 2024 8:00 AM", "Aralık 31, 2025 5:00 PM",
+         "Mayıs 1, 2025 8:00 AM", "Mart 20, 2026 8:00 AM", "11/8/2025", "Yok", "yok", "NaN", "", None, np.nan,
+         pd.Timestamp("2025-06-02 08:00"), datetime(2025, 7, 1, 17), "geçersiz"]
+DURATIONS = ["12 gün", "3,5g", "3.5g", "0 gün", "35g", "-4g", "5 days", "2dy", "", "nan", "abc", None, np.nan, 7, 2.5]
+IDS = [1, "2", "3.0", 4.0, "A-12", " A-12 ", "B7", "1.5", None, np.nan, "", "007"]
+
+def same_dates(series):
+    expected = [parse_turkish_date(v) for v in series]
+    got = parse_turkish_dates(series).tolist()
+    assert len(got) == len(expected)
+    for value, g, e in zip(series, got, expected):
+        assert (pd.isna(g) and pd.isna(e)) or g == e, value
+
+@pytest.mark.parametrize("values", [DATES, DATES[:6], [m for m in DATES if isinstance(m, str)]])
+def test_dates_match_per_cell(values):
+    same_dates(pd.Series(values, dtype=object))
+
+def test_every_turkish_month():
+    months = ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"]
+    series = pd.Series([f"{m} 9, 2025 8:00 AM" for m in months])
+    same_dates(series)
+    assert parse_turkish_dates(series).dt.month.tolist() == list(range(1, 13))
+
+@pytest.mark.parametrize("values", [DURATIONS, ["3,5g", "1 gün"], [1.0, 2.5, np.nan]])
+def test_durations_match_per_cell(values):
+    series = pd.Series(values, dtype=object if any(isinstance(v, str) for v in values) else float)
+    expected = [clean_duration(v) for v in series]
+    got = clean_durations(series).tolist()
+    np.testing.assert_array_equal(got, expected)
+
+@pytest.mark.parametrize("values", [IDS, [1, 2, 3], [1.0, 2.5, np.nan], ["A-12", "A-13"]])
+def test_ids_match_per_cell(values):
+    series = pd.Series(values)
+    assert normalize_ids(series).tolist() == [normalize_id(v) for v in series]
@@ -0,0 +1,104 @@
+import pandas as pd
+
+from project_core import process_data, reload_changed, watch_hashes
+
+# --- ARTIMLI YENİDEN YÜKLEME ---
+# Düzenlenen CSV dışa aktarımı artımlı yüklendiğinde tam ayrıştırmayla aynı çerçeve çıkmalı;
+# fark özeti (satır sayıları, kapsam başına eklenen/silinen satır ve değişen sütunlar) doğru olmalı
+COLUMNS = ['Benzersiz_Kimlik', 'Özet', 'İKY', 'Ad', 'Tamamlanma_Yüzdesi', 'Süre', 'Başlangıç', 'Bitiş',
+           'Fiili_Başlangıç', 'Fiili_Bitiş', 'Toplam_Bolluk', 'Öncüller']
+ROWS = [
+    [1, 'Evet', '1', 'Proje', 0.4, '10 gün', 'Mart 3, 2025 8:00 AM', 'Mart 14, 2025 5:00 PM', '3/3/2025', 'Yok', '0g', None],
+    [2, 'Evet', '1.1', 'Yapı', 0.6, '8 gün', 'Mart 3, 2025 8:00 AM', 'Mart 12, 2025 5:00 PM', '3/3/2025', 'Yok', '0g', None],
+    [3, 'Hayır', '1.1.1', 'Kazı', 1.0, '5 gün', 'Mart 3, 2025 8:00 AM', 'Mart 7, 2025 5:00 PM', '3/3/2025', '3/7/2025', '0g', None],
+    [4, 'Hayır', '1.1.2', 'Temel', 0.2, '3 gün', 'Mart 10, 2025 8:00 AM', 'Mart 12, 2025 5:00 PM', '3/10/2025', 'Yok', '0g', '3'],
+    [5, 'Hayır', '1.2', 'Çatı', 0.0, '2 gün', 'Mart 13, 2025 8:00 AM', 'Mart 14, 2025 5:00 PM', 'Yok', 'Yok', '0g', '4'],
+    [6, 'Hayır', '1.3', 'Peyzaj', 0.0, '2 gün', 'Mart 3, 2025 8:00 AM', 'Mart 4, 2025 5:00 PM', 'Yok', 'Yok', '8g', None],
+]
+
+def write(path, rows, columns=COLUMNS):
+    pd.DataFrame(rows, columns=COLUMNS)[columns].to_csv(path, index=False)
+    return str(path)
+
+def loaded(tmp_path):
+    # Yüklenmiş ve izlenmeye başlanmış dosya: (yol, çerçeve, ham özetler)
+    path = write(tmp_path / "plan.csv", ROWS)
+    df = process_data(path)
+    return path, df, watch_hashes(path, df)
+
+def reload(path, rows, df, hashes, columns=COLUMNS):
+    write(path, rows, columns)
+    new, _, delta = reload_changed(path, df, hashes)
+    pd.testing.assert_frame_equal(new, process_data(path))
+    return delta
+
+def edited(rows, uid, **values):
+    rows = [list(r) for r in rows]
+    for r in rows:
+        if r[0] == uid: r[:] = [values.get(c, v) for c, v in zip(COLUMNS, r)]
+    return rows
+
+def test_unchanged_file(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    assert hashes is not None
+    delta = reload(path, ROWS, df, hashes)
+    assert delta == {"rows": {"summary": False, "tasks": False}, "columns": {"summary": set(), "tasks": set()},
+                     "counts": {"added": 0, "changed": 0, "removed": 0}}
+
+def test_task_rename(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    delta = reload(path, edited(ROWS, 5, Ad='Çatı Kaplaması'), df, hashes)
+    assert delta["counts"] == {"added": 0, "changed": 1, "removed": 0}
+    assert delta["rows"] == {"summary": False, "tasks": False}
+    assert delta["columns"] == {"summary": set(), "tasks": {'Ad'}}
+
+def test_summary_dates(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    delta = reload(path, edited(ROWS, 2, Bitiş='Mart 13, 2025 5:00 PM', Süre='9 gün'), df, hashes)
+    assert delta["counts"] == {"added": 0, "changed": 1, "removed": 0}
+    assert delta["columns"] == {"summary": {'Bitiş_Date', 'Süre_Num'}, "tasks": set()}
+
+def test_slack_change_updates_status(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    delta = reload(path, edited(ROWS, 6, Toplam_Bolluk='0g'), df, hashes)
+    assert delta["columns"]["tasks"] == {'Bolluk_Num', 'Kritik', 'Durum'}
+
+def test_add_and_remove(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    rows = [r for r in ROWS if r[0] != 6] + [[7, 'Hayır', '1.4', 'Teslim', 0.0, '1 gün', 'Mart 14, 2025 8:00 AM',
+                                              'Mart 14, 2025 5:00 PM', 'Yok', 'Yok', '0g', '5']]
+    delta = reload(path, rows, df, hashes)
+    assert delta["counts"] == {"added": 1, "changed": 0, "removed": 1}
+    assert delta["rows"] == {"summary": False, "tasks": True}
+
+def test_edit_add_remove_together(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    rows = edited([r for r in ROWS if r[0] != 2], 4, Tamamlanma_Yüzdesi=0.5)
+    rows.insert(2, [8, 'Hayır', '1.1.3', 'Perde', 0.0, '2 gün', 'Mart 10, 2025 8:00 AM', 'Mart 11, 2025 5:00 PM',
+                    'Yok', 'Yok', '1g', '3'])
+    delta = reload(path, rows, df, hashes)
+    assert delta["counts"] == {"added": 1, "changed": 1, "removed": 1}
+    assert delta["rows"] == {"summary": True, "tasks": True}
+    assert delta["columns"]["tasks"] == {'Tamamlanma_Yüzdesi'}
+
+def test_successive_reloads_chain_hashes(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    write(path, edited(ROWS, 3, Ad='Hafriyat'), COLUMNS)
+    df, hashes, _ = reload_changed(path, df, hashes)
+    delta = reload(path, edited(ROWS, 3, Ad='Hafriyat', Öncüller='2'), df, hashes)
+    assert delta["counts"]["changed"] == 1 and delta["columns"]["tasks"] == {'Öncüller'}
+
+def test_column_set_change_is_full_reload(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    assert reload(path, ROWS, df, hashes, [c for c in COLUMNS if c != 'Öncüller']) is None
+
+def test_reorder_and_duplicate_ids_are_full_reload(tmp_path):
+    path, df, hashes = loaded(tmp_path)
+    assert reload(path, [ROWS[0], ROWS[2], ROWS[1]] + ROWS[3:], df, hashes) is None
+    assert reload(path, ROWS + [ROWS[-1]], df, hashes) is None
+
+def test_unknown_previous_state_is_full_reload(tmp_path):
+    path, df, _ = loaded(tmp_path)
+    assert reload(path, edited(ROWS, 5, Ad='Çatı 2'), df, None) is None
+    write(path, edited(ROWS, 5, Ad='Çatı 3'))
+    assert watch_hashes(path, df.iloc[:-1]) is None
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+import pytest
+
+import schedule_reader
+from schedule_reader import read_schedule_table
+
+DATA_XLSX = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data.xlsx")
+
+# --- MOTOR EŞLİĞİ ---
+# Aynı dosya calamine ile de openpyxl ile de okunsa read_schedule_table aynı çerçeveyi döndürmelidir
+def read_with(path, calamine, monkeypatch):
+    monkeypatch.setattr(schedule_reader, "HAS_CALAMINE", calamine)
+    return read_schedule_table(path)
+
+def spaced_export(path):
+    # Baş/son boşluklu ve yalnızca boşluktan oluşan metin hücreleri
+    pd.DataFrame({
+        'Benzersiz_Kimlik': [1, 2, 3], 'Özet': ['Evet', 'Hayır', 'Hayır'], 'İKY': ['1', '1.1', '1.1.1'],
+        'Ad': ['Proje', '  Betonarme İşleri', 'Kalıp '], 'Tamamlanma_Yüzdesi': [0.5, 1.0, 0.0],
+        'Süre': ['10 gün', '4 gün', '6 gün'], 'Başlangıç': ['Mart 3, 2025 8:00 AM'] * 3, 'Bitiş': ['Mart 14, 2025 5:00 PM'] * 3,
+        'Fiili_Başlangıç': ['3/3/2025', '3/3/2025', 'Yok'], 'Fiili_Bitiş': ['Yok', '3/6/2025', 'Yok'],
+        'Toplam_Bolluk': ['0g', '0g', '2g'], 'Öncüller': [None, ' ', '2'],
+    }).to_excel(path, index=False)
+    return path
+
+@pytest.mark.parametrize("source", ["data", "spaced"])
+def test_engines_return_identical_frames(source, tmp_path, monkeypatch):
+    pytest.importorskip("python_calamine")
+    path = DATA_XLSX if source == "data" else spaced_export(str(tmp_path / "spaced.xlsx"))
+    pd.testing.assert_frame_equal(read_with(path, True, monkeypatch), read_with(path, False, monkeypatch))
+
+def test_text_cells_are_trimmed(tmp_path, monkeypatch):
+    df = read_with(spaced_export(str(tmp_path / "spaced.xlsx")), False, monkeypatch)
+    assert df['Ad'].tolist() == ['Proje', 'Betonarme İşleri', 'Kalıp']
+    assert df['Öncüller'].isna().tolist() == [True, True, False]